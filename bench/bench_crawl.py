@@ -0,0 +1,254 @@
+"""
+오프라인 수집 벤치마크 (실제 사이트 대신 로컬 work24 흉내 서버)
+
+bench/fixture_server.py 서버를 띄우고 WORKNET_BASE_URL을 그 주소로 바꾼 뒤
+CLI의 run()과 GUI의 CrawlerLogic.run_crawl을 그대로 실행합니다.
+대상별로 초당 처리 공고 수, 공고당 지연시간(단계별 p50/p95/p99), 최대 RSS를 비교합니다.
+(RSS 측정은 psutil이 설치되어 있을 때만, GUI 대상은 tkinter가 있을 때만)
+
+실행마다 임시 폴더에서 돌리므로 결과/캐시/체크포인트 파일이 섞이지 않습니다.
+요청 속도 제한은 --rate 로 풀어 두고, 서버 지연은 --latency-ms / --jitter-ms 로 조절합니다.
+회사명은 기본으로 공고마다 달라 상세 수집 경로를 재고, 회사 캐시 효과는 --company-repeat 로 따로 봅니다.
+
+사용법:
+    python bench/bench_crawl.py --postings 200 --latency-ms 50 --jitter-ms 30
+    python bench/bench_crawl.py --targets cli --postings 500 --show
+    python bench/bench_crawl.py --postings 200 --company-repeat 0.5
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from fixture_server import FixtureServer
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 공고당 지연시간으로 보여줄 단계 (HTTP 수집 / 탭 폴백)
+LATENCY_STAGES = ("detail_http", "detail_load")
+
+
+def default_chromium():
+    """Playwright에 딸린 Chromium 경로 (CLI의 윈도우 전용 경로 탐색 대신 사용)"""
+    from playwright.sync_api import sync_playwright
+    with sync_playwright() as p:
+        return p.chromium.executable_path
+
+
+def import_crawlers():
+    """
+    WORKNET_BASE_URL을 정한 뒤에 크롤러 모듈을 불러옴 (주소는 import 시점에 결정됨)
+    CLI 모듈은 LOCALAPPDATA가 있어야 import 되고 PLAYWRIGHT_BROWSERS_PATH를 바꾸므로 원래 값으로 되돌림
+    """
+    browsers_path = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    os.environ.setdefault("LOCALAPPDATA", tempfile.gettempdir())
+    with contextlib.redirect_stdout(io.StringIO()):
+        import worknet_crawler_fixed as cli
+    try:
+        import worknet_crawler_gui as gui
+    except ImportError as e:
+        print(f"GUI 모듈을 불러오지 못해 GUI 대상은 건너뜁니다: {e}")
+        gui = None
+    if browsers_path is None:
+        os.environ.pop("PLAYWRIGHT_BROWSERS_PATH", None)
+    else:
+        os.environ["PLAYWRIGHT_BROWSERS_PATH"] = browsers_path
+    return cli, gui
+
+
+def process_tree_rss():
+    """이 프로세스 + 자식 프로세스(브라우저)의 RSS 합계 (byte)"""
+    me = psutil.Process()
+    total = 0
+    for proc in [me] + me.children(recursive=True):
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+class RssSampler:
+    """실행하는 동안 별도 스레드에서 RSS 최대값 기록"""
+
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if psutil:
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, process_tree_rss())
+            self._stop.wait(self.interval)
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        return False
+
+
+def count_lines(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return sum(1 for line in f if line.strip())
+    except OSError:
+        return 0
+
+
+def read_metrics(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["stages"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def run_cli(cli, args, exe):
+    cli.find_chromium_executable = lambda: exe
+    cli.REQUEST_BURST = max(cli.REQUEST_BURST, int(args.rate))
+    out = sys.stdout if args.verbose else io.StringIO()
+    with contextlib.redirect_stdout(out):
+        asyncio.run(cli.run(target_count=args.postings, headless=not args.show, request_rate=args.rate))
+    return cli.RESULTS_JSONL, cli.METRICS_PATH, out
+
+
+def run_gui(gui, args, exe):
+    from worknet_metrics import span
+
+    class BenchLogic(gui.CrawlerLogic):
+        # 완료 메시지 창을 띄우지 않고 엑셀 변환만
+        def save_to_excel(self, jsonl_path, metrics=None):
+            with span(metrics, "excel_save"):
+                gui.export_excel(jsonl_path, gui.RESULTS_XLSX)
+
+    out = io.StringIO()
+    log = print if args.verbose else (lambda msg: out.write(str(msg) + "\n"))
+    gui.REQUEST_RATE = (args.rate, max(gui.REQUEST_RATE[1], int(args.rate)))
+    logic = BenchLogic(log)
+    logic.headless = not args.show
+    logic.browser_channel = None
+
+    async def main():
+        try:
+            await logic.run_crawl(args.postings)
+        finally:
+            await logic.close_browser()
+
+    asyncio.run(main())
+    return gui.RESULTS_JSONL, gui.METRICS_PATH, out
+
+
+def bench_target(name, runner, module, args, exe):
+    workdir = tempfile.mkdtemp(prefix=f"worknet_bench_{name}_")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        with RssSampler() as rss:
+            start = time.perf_counter()
+            results_path, metrics_path, out = runner(module, args, exe)
+            elapsed = time.perf_counter() - start
+        done = count_lines(results_path)
+        stages = read_metrics(metrics_path)
+        if done == 0 and not args.verbose:
+            tail = out.getvalue().strip().splitlines()[-5:]
+            print(f"[{name}] 수집된 공고가 없습니다. 마지막 로그:\n  " + "\n  ".join(tail))
+    finally:
+        os.chdir(cwd)
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+        else:
+            print(f"[{name}] 실행 폴더: {workdir}")
+
+    return {
+        "postings": done,
+        "elapsed": elapsed,
+        "rate": done / elapsed if elapsed else 0.0,
+        "stages": stages,
+        "rss_mb": rss.peak / 1024 / 1024 if psutil else None,
+    }
+
+
+def print_report(results, args):
+    print("\n" + "=" * 78)
+    print(f"서버 지연 {args.latency_ms:.0f}ms (+0~{args.jitter_ms:.0f}ms), 요청 제한 {args.rate:.0f}/초, "
+          f"회사 중복 비율 {args.company_repeat:.0%}")
+    print(f"{'대상':<6}{'공고':>7}{'시간(s)':>10}{'공고/초':>10}{'RSS MB':>10}")
+    for name, r in results.items():
+        rss = f"{r['rss_mb']:.0f}" if r["rss_mb"] is not None else "-"
+        print(f"{name:<6}{r['postings']:>7}{r['elapsed']:>10.1f}{r['rate']:>10.1f}{rss:>10}")
+    print("-" * 78)
+    print("공고당 지연시간 (ms)")
+    print(f"{'대상':<6}{'단계':<14}{'횟수':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'오류':>7}")
+    for name, r in results.items():
+        for stage in LATENCY_STAGES + tuple(s for s in r["stages"] if s not in LATENCY_STAGES):
+            s = r["stages"].get(stage)
+            if not s:
+                continue
+            print(f"{name:<6}{stage:<14}{s['count']:>7}{s['p50'] * 1000:>9.0f}{s['p95'] * 1000:>9.0f}"
+                  f"{s['p99'] * 1000:>9.0f}{s['errors']:>7}")
+    print("=" * 78)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 work24 흉내 서버로 수집 처리량 측정")
+    parser.add_argument("--targets", default="cli,gui", help="실행할 대상 (cli, gui 중 쉼표로 구분)")
+    parser.add_argument("--postings", type=int, default=200, help="대상별로 수집할 공고 수")
+    parser.add_argument("--latency-ms", type=float, default=0, help="서버 응답마다 넣을 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="지연에 더할 무작위 값의 최대치 (ms)")
+    parser.add_argument("--company-repeat", type=float, default=0.0,
+                        help="회사가 앞 공고와 겹치는 공고의 비율 0~1 (기본 0: 회사 캐시 적중 없음)")
+    parser.add_argument("--rate", type=float, default=1000.0, help="크롤러의 초당 요청 수 제한 (벤치마크에서는 크게)")
+    parser.add_argument("--chromium", help="사용할 Chromium 실행 파일 (기본: Playwright 기본 Chromium)")
+    parser.add_argument("--show", action="store_true", help="브라우저 창을 띄움 (기본: 헤드리스)")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그 그대로 출력")
+    parser.add_argument("--keep", action="store_true", help="실행 폴더(결과/지표 파일)를 지우지 않음")
+    args = parser.parse_args()
+
+    # 목록이 목표보다 먼저 끝나지 않도록 한 페이지 여유
+    server = FixtureServer(args.postings + 50, args.latency_ms, args.jitter_ms, company_repeat=args.company_repeat)
+    os.environ["WORKNET_BASE_URL"] = server.start()
+    exe = args.chromium or default_chromium()
+    cli, gui = import_crawlers()
+    if not psutil:
+        print("psutil이 없어 메모리(RSS)는 측정하지 않습니다. (pip install psutil)")
+
+    targets = {"cli": (run_cli, cli), "gui": (run_gui, gui)}
+    results = {}
+    try:
+        for name in (t.strip() for t in args.targets.split(",")):
+            runner, module = targets.get(name, (None, None))
+            if module is None:
+                continue
+            print(f"[{name}] 공고 {args.postings}건 수집 중... ({os.environ['WORKNET_BASE_URL']})")
+            results[name] = bench_target(name, runner, module, args, exe)
+    finally:
+        server.stop()
+
+    print(f"서버 요청 {server.requests}건")
+    print_report(results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+엑셀 변환 벤치마크 (셀 단위 정제 + openpyxl vs 컬럼 단위 정제 + 시트 XML 직접 기록)
+
+가짜 수집 결과 JSONL(--rows 행)을 만들고 두 방식으로 엑셀로 변환하면서
+소요 시간과 파이썬 힙 최대 사용량(tracemalloc)을 비교합니다.
+(tracemalloc 때문에 실제보다 느리게 나오므로 시간은 두 방식의 비율로 보면 됩니다)
+
+사용법:
+    python bench/bench_export.py --rows 100000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from worknet_sink import COLUMNS, clean_text, export_excel, iter_records
+
+
+def make_results(path, rows):
+    """가끔 제어문자 / 아주 긴 값이 섞인 가짜 수집 결과"""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(rows):
+            record = {key: f"{name} {i} " + "가나다라" * random.randint(1, 8) for key, name in COLUMNS}
+            if i % 997 == 0:
+                record["title"] += "\x0b\x1f"
+            if i % 10007 == 0:
+                record["address"] = "긴 주소 " * 5000
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def export_per_cell(jsonl_path, xlsx_path):
+    """이전 방식: 셀마다 clean_text 호출, openpyxl write-only 모드로 기록"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append([name for _, name in COLUMNS])
+    for record in iter_records(jsonl_path):
+        ws.append([clean_text(record.get(key, "")) for key, _ in COLUMNS])
+    wb.save(xlsx_path)
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(rows):
+    workdir = tempfile.mkdtemp(prefix="worknet_export_")
+    jsonl_path = os.path.join(workdir, "results.jsonl")
+    print(f"가짜 결과 {rows}행 생성 중... ({workdir})")
+    make_results(jsonl_path, rows)
+
+    results = {
+        "셀 단위 (before)": measure(export_per_cell, jsonl_path, os.path.join(workdir, "before.xlsx")),
+        "컬럼 단위 (after)": measure(export_excel, jsonl_path, os.path.join(workdir, "after.xlsx")),
+    }
+
+    print("\n" + "=" * 50)
+    print(f"{'방식':<18}{'시간(s)':>10}{'힙 최대 MB':>16}")
+    for name, (elapsed, peak) in results.items():
+        print(f"{name:<18}{elapsed:>10.2f}{peak / 1024 / 1024:>16.1f}")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="엑셀 변환 벤치마크")
+    parser.add_argument("--rows", type=int, default=100000, help="변환할 행 수")
+    args = parser.parse_args()
+    main(args.rows)
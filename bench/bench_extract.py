@@ -0,0 +1,97 @@
+"""
+상세 페이지 필드 추출 벤치마크 (로케이터 체인 vs 프레임당 evaluate 1회)
+
+저장된 상세 페이지(bench/fixtures/detail_*.html)를 브라우저로 열고
+두 방식으로 필드를 추출하면서 공고당 IPC 왕복 횟수와 소요 시간(ms)을 비교합니다.
+
+사용법:
+    python bench/bench_extract.py --repeat 20
+"""
+import argparse
+import asyncio
+import glob
+import inspect
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import async_playwright
+
+from worknet_extract import detail_frames, extract_fields_inpage, extract_fields_with_locators
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class RoundTripCounter:
+    """Page/Frame/Locator를 감싸서 await 되는 호출(= 드라이버 왕복) 횟수를 셉니다."""
+
+    def __init__(self, target, counter):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if inspect.iscoroutinefunction(attr):
+            async def counted(*args, **kwargs):
+                self._counter[0] += 1
+                return await attr(*args, **kwargs)
+            return counted
+        if callable(attr):
+            def wrapped(*args, **kwargs):
+                return RoundTripCounter(attr(*args, **kwargs), self._counter)
+            return wrapped
+        if hasattr(attr, "locator"):
+            return RoundTripCounter(attr, self._counter)
+        return attr
+
+
+STRATEGIES = {
+    "locator (before)": extract_fields_with_locators,
+    "inpage (after)": extract_fields_inpage,
+}
+
+
+async def bench(repeat, headless):
+    fixtures = sorted(glob.glob(os.path.join(FIXTURE_DIR, "detail_*.html")))
+    if not fixtures:
+        print(f"픽스처가 없습니다: {FIXTURE_DIR}")
+        return
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        page = await browser.new_page()
+
+        results = {name: {"trips": 0, "ms": 0.0, "n": 0} for name in STRATEGIES}
+        for path in fixtures:
+            await page.goto("file://" + path, wait_until="load")
+            print(f"\n[{os.path.basename(path)}]")
+            for name, func in STRATEGIES.items():
+                fields = None
+                for _ in range(repeat):
+                    counter = [0]
+                    frames = [RoundTripCounter(f, counter) for f in detail_frames(page)]
+                    start = time.perf_counter()
+                    fields = await func(frames)
+                    results[name]["ms"] += (time.perf_counter() - start) * 1000
+                    results[name]["trips"] += counter[0]
+                    results[name]["n"] += 1
+                print(f"  {name:<18} 왕복 {counter[0]:>4}회 | {fields}")
+
+        await browser.close()
+
+    print("\n" + "=" * 60)
+    print(f"{'방식':<20}{'왕복/공고':>12}{'ms/공고':>12}")
+    for name, r in results.items():
+        n = max(r["n"], 1)
+        print(f"{name:<20}{r['trips'] / n:>12.1f}{r['ms'] / n:>12.2f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상세 페이지 필드 추출 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="픽스처당 반복 횟수")
+    parser.add_argument("--headful", action="store_true", help="브라우저 창을 띄워서 실행")
+    args = parser.parse_args()
+    asyncio.run(bench(args.repeat, headless=not args.headful))
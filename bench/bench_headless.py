@@ -0,0 +1,137 @@
+"""
+헤드리스 vs 창 모드 벤치마크 (초당 처리 공고 수, 브라우저 메모리)
+
+크롤러와 같은 UA / 탐지 우회 스크립트 / 요청 차단 정책으로 브라우저를 띄우고,
+저장된 상세 페이지(bench/fixtures/detail_*.html)를 탭 풀에서 동시에 열어 필드를 추출합니다.
+모드별로 초당 처리 공고 수와 브라우저 프로세스 RSS 최대값을 비교합니다.
+(RSS 측정은 psutil이 설치되어 있을 때만)
+
+사용법:
+    python bench/bench_headless.py --postings 200 --concurrency 6
+"""
+import argparse
+import asyncio
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import async_playwright
+
+from worknet_extract import extract_page_fields
+from worknet_intercept import InterceptPolicy
+from worknet_pool import PagePool
+from worknet_waits import wait_for_fields
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+INIT_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+
+def browser_rss():
+    """이 프로세스가 띄운 브라우저 프로세스들의 RSS 합계 (byte)"""
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            if "chrom" in child.name().lower():
+                total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+async def sample_rss(peak, stop):
+    while not stop.is_set():
+        peak[0] = max(peak[0], browser_rss())
+        try:
+            await asyncio.wait_for(stop.wait(), 0.2)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def bench_mode(p, headless, urls, postings, concurrency):
+    browser = await p.chromium.launch(headless=headless, args=["--disable-blink-features=AutomationControlled"])
+    context = await browser.new_context(user_agent=USER_AGENT, viewport={"width": 1600, "height": 900})
+    await context.add_init_script(INIT_SCRIPT)
+    await InterceptPolicy().install(context)
+    pages = PagePool(context, concurrency)
+    await pages.warm(concurrency)
+
+    peak = [0]
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(peak, stop)) if psutil else None
+
+    queue = asyncio.Queue()
+    for i in range(postings):
+        queue.put_nowait(urls[i % len(urls)])
+    latencies = []
+
+    async def worker():
+        while not queue.empty():
+            url = queue.get_nowait()
+            page = await pages.acquire()
+            start = time.perf_counter()
+            try:
+                await page.goto(url, wait_until="domcontentloaded")
+                try: await wait_for_fields(page, 3000)
+                except asyncio.TimeoutError: pass
+                await extract_page_fields(page)
+            finally:
+                await pages.release(page)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    if sampler:
+        stop.set()
+        await sampler
+    await pages.close()
+    await browser.close()
+
+    latencies.sort()
+    return {
+        "rate": postings / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "rss_mb": peak[0] / 1024 / 1024 if psutil else None,
+    }
+
+
+async def main(postings, concurrency):
+    fixtures = sorted(glob.glob(os.path.join(FIXTURE_DIR, "detail_*.html")))
+    if not fixtures:
+        print(f"픽스처가 없습니다: {FIXTURE_DIR}")
+        return
+    urls = ["file://" + os.path.abspath(path) for path in fixtures]
+    if not psutil:
+        print("psutil이 없어 메모리(RSS)는 측정하지 않습니다. (pip install psutil)")
+
+    results = {}
+    async with async_playwright() as p:
+        for name, headless in (("창 모드", False), ("헤드리스", True)):
+            print(f"[{name}] 공고 {postings}건, 동시 {concurrency}개 실행 중...")
+            results[name] = await bench_mode(p, headless, urls, postings, concurrency)
+
+    print("\n" + "=" * 56)
+    print(f"{'모드':<12}{'공고/초':>10}{'p50 ms':>10}{'브라우저 RSS MB':>20}")
+    for name, r in results.items():
+        rss = f"{r['rss_mb']:.0f}" if r["rss_mb"] is not None else "-"
+        print(f"{name:<12}{r['rate']:>10.1f}{r['p50_ms']:>10.1f}{rss:>20}")
+    print("=" * 56)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="헤드리스 vs 창 모드 벤치마크")
+    parser.add_argument("--postings", type=int, default=200, help="모드별 처리할 공고 수")
+    parser.add_argument("--concurrency", type=int, default=6, help="동시에 여는 탭 수")
+    args = parser.parse_args()
+    asyncio.run(main(args.postings, args.concurrency))
@@ -0,0 +1,68 @@
+"""
+필드 추출 규칙 엔진 마이크로 벤치마크 (브라우저 불필요)
+
+저장된 상세 페이지(bench/fixtures)를 원본 HTML 엔진으로 반복 추출하고,
+주소 필터(키워드 목록 any() vs 합쳐진 정규식)의 호출당 비용을 비교합니다.
+
+사용법:
+    python bench/bench_rules.py --repeat 200
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from worknet_extract import INVALID_ADDR_KEYWORDS, INVALID_ADDR_RE, extract_fields_from_html, parse_html
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+FILTER_SAMPLES = [
+    "경기도 성남시 분당구 판교역로 235, 7층",
+    "서울특별시 강남구 테헤란로 123 5층",
+    "월급 250만원 이상, 경력 무관 우대 조건 있음",
+    "부산광역시 해운대구 센텀중앙로 79",
+    "근무지: 경기 성남시 분당구 판교역로 235 (근무 예정지)",
+]
+
+
+def load_fixtures():
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "detail_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append((os.path.basename(path), f.read()))
+    return pages
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(repeat):
+    pages = load_fixtures()
+    if not pages:
+        print(f"픽스처가 없습니다: {FIXTURE_DIR}")
+        return
+
+    print(f"{'페이지':<28}{'파싱 ms':>10}{'추출 ms':>10}")
+    for name, html in pages:
+        parse_ms = timed(lambda: parse_html(html), repeat) * 1000
+        total_ms = timed(lambda: extract_fields_from_html([html]), repeat) * 1000
+        print(f"{name:<28}{parse_ms:>10.3f}{total_ms:>10.3f}")
+
+    loops = repeat * 100
+    any_us = timed(lambda: [any(k in s for k in INVALID_ADDR_KEYWORDS) for s in FILTER_SAMPLES], loops) * 1e6
+    re_us = timed(lambda: [INVALID_ADDR_RE.search(s) for s in FILTER_SAMPLES], loops) * 1e6
+    n = len(FILTER_SAMPLES)
+    print(f"\n주소 필터 (호출당): any() {any_us / n:.3f}us | 정규식 {re_us / n:.3f}us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="필드 추출 규칙 엔진 마이크로 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200, help="페이지당 반복 횟수")
+    main(parser.parse_args().repeat)
@@ -0,0 +1,184 @@
+"""
+work24 흉내 로컬 서버 (오프라인 벤치마크용)
+
+실제 사이트 대신 저장된 페이지 구조로 목록/상세 페이지를 내려줍니다.
+  - 목록: /wk/a/b/1200/retriveDtlEmpSrchList.do?pageIndex=N&resultCnt=M
+    tr[id^="list"] 행, span.txt_total(전체 건수), 다음 페이지가 있으면 .btn_page.next
+  - 상세: /wk/a/b/1500/empDetailAuthView.do?wantedAuthNo=K0000001
+    공고 번호에 따라 bench/fixtures/detail_*.html (표 / li em.tit / [data-addr] / iframe) 중 하나
+  - 그 밖의 경로는 같은 이름의 fixtures 파일 (iframe 안의 company_frame.html 등)
+모든 응답에 latency_ms(+ 0~jitter_ms 무작위) 만큼 인위적인 지연을 넣을 수 있습니다.
+회사명은 기본으로 공고마다 다르고 (회사 캐시가 적중하지 않음), company_repeat 비율만큼 회사가 겹치게 할 수 있습니다.
+
+크롤러를 이 서버로 돌리려면 WORKNET_BASE_URL 환경변수를 서버 주소로 지정합니다.
+    python bench/fixture_server.py --port 8024 --postings 500 --latency-ms 50
+    WORKNET_BASE_URL=http://127.0.0.1:8024 python worknet_crawler_fixed.py --count 100
+"""
+import argparse
+import glob
+import html
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+LIST_PATH = "/wk/a/b/1200/retriveDtlEmpSrchList.do"
+DETAIL_PATH = "/wk/a/b/1500/empDetailAuthView.do"
+
+REGIONS = ("서울 강남구", "경기 성남시 분당구", "부산 해운대구", "충북 제천시", "경남 창원시 성산구")
+
+LIST_PAGE = """<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>채용정보 목록</title></head>
+<body>
+<div class="result_top">총 <span class="txt_total">{total}</span>건</div>
+<table class="board_list">
+<tbody>
+{rows}
+</tbody>
+</table>
+<div class="paging">{next_link}</div>
+</body>
+</html>
+"""
+
+LIST_ROW = """<tr id="list{index}">
+  <td class="link">
+    <a class="t3_sb" href="{detail_path}?wantedAuthNo={posting_id}">{title}</a>
+    <a class="cp_name" href="#">{company}</a>
+    <ul>
+      <li class="dollar"><span class="item b1_sb">월급</span><span class="item b1_sb">{salary}만원 이상</span></li>
+      <li class="site"><p>{region}</p></li>
+      <li class="time">주 5일 근무</li>
+    </ul>
+  </td>
+</tr>"""
+
+
+def posting_id(n):
+    return f"K{n:07d}"
+
+
+def company_count(postings, company_repeat):
+    """company_repeat(0~1): 앞 공고와 회사가 겹치는 공고의 비율 → 서로 다른 회사 수"""
+    return max(1, round(postings * (1 - min(max(company_repeat, 0.0), 1.0))))
+
+
+def render_list(page_index, page_size, total, companies=None):
+    """companies: 서로 다른 회사 수 (None이면 공고마다 다른 회사)"""
+    companies = companies or total
+    first = (page_index - 1) * page_size
+    rows = []
+    for i, n in enumerate(range(first, min(first + page_size, total))):
+        rows.append(LIST_ROW.format(
+            index=i,
+            detail_path=DETAIL_PATH,
+            posting_id=posting_id(n),
+            title=html.escape(f"벤치마크 공고 {n}"),
+            company=html.escape(f"(주)샘플기업{n % companies}"),
+            salary=200 + n % 150,
+            region=REGIONS[n % len(REGIONS)],
+        ))
+    next_link = (f'<a class="btn_page next" href="{LIST_PATH}?pageIndex={page_index + 1}&resultCnt={page_size}">다음</a>'
+                 if first + page_size < total else "")
+    return LIST_PAGE.format(total=f"{total:,}", rows="\n".join(rows), next_link=next_link)
+
+
+class FixtureServer:
+    """백그라운드 스레드에서 도는 로컬 서버. start()가 기본 주소(http://127.0.0.1:포트)를 돌려줌"""
+
+    def __init__(self, postings=500, latency_ms=0, jitter_ms=0, port=0, page_size=50, company_repeat=0.0):
+        self.postings = postings
+        self.companies = company_count(postings, company_repeat)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.page_size = page_size
+        self.details = sorted(glob.glob(os.path.join(FIXTURE_DIR, "detail_*.html")))
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _delay(self):
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def route(self, path, query):
+        """(상태 코드, HTML) - 요청 경로별 응답"""
+        if path == LIST_PATH:
+            page_index = int(query.get("pageIndex", ["1"])[0])
+            page_size = int(query.get("resultCnt", [str(self.page_size)])[0])
+            return 200, render_list(max(1, page_index), max(1, page_size), self.postings, self.companies)
+        if path == DETAIL_PATH:
+            pid = query.get("wantedAuthNo", [""])[0]
+            if not pid[1:].isdigit() or not self.details:
+                return 404, "not found"
+            return 200, self._read(self.details[int(pid[1:]) % len(self.details)])
+        fixture = os.path.join(FIXTURE_DIR, os.path.basename(path))
+        if os.path.isfile(fixture):
+            return 200, self._read(fixture)
+        return 404, "not found"
+
+    def _read(self, path):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                server._delay()
+                url = urlparse(self.path)
+                status, body = server.route(url.path, parse_qs(url.query))
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="work24 흉내 로컬 서버")
+    parser.add_argument("--port", type=int, default=8024)
+    parser.add_argument("--postings", type=int, default=500, help="목록에 올릴 공고 수")
+    parser.add_argument("--latency-ms", type=float, default=0, help="응답마다 넣을 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="지연에 더할 무작위 값의 최대치 (ms)")
+    parser.add_argument("--company-repeat", type=float, default=0.0,
+                        help="회사가 앞 공고와 겹치는 공고의 비율 0~1 (기본 0: 공고마다 다른 회사)")
+    args = parser.parse_args()
+
+    server = FixtureServer(args.postings, args.latency_ms, args.jitter_ms, args.port, company_repeat=args.company_repeat)
+    print(f"{server.base_url} 에서 대기 중 (Ctrl+C로 종료)")
+    print(f"크롤러 실행: WORKNET_BASE_URL={server.base_url} python worknet_crawler_fixed.py --count 100")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
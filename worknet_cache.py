@@ -0,0 +1,400 @@
+import asyncio
+import json
+import re
+import sqlite3
+import time
+
+from worknet_extract import NOT_FOUND
+
+# ========================================================
+# 상세 수집 결과 캐시 (SQLite, 공고 ID 기준)
+# ========================================================
+# 어제 수집한 공고를 다시 열지 않도록 업종/인원수/팩스/주소를 디스크에 저장합니다.
+# - TTL(일)이 지난 항목은 없는 것으로 취급하고 정리 시 삭제
+# - 최대 건수를 넘으면 오래된 항목부터 삭제
+# 같은 파일을 SeenStore 등 다른 연결도 함께 쓰므로 쓰기마다 바로 커밋합니다.
+# (쓰기 트랜잭션을 열어 두면 다른 연결의 쓰기가 잠금 대기 끝에 'database is locked'로 실패)
+
+DEFAULT_CACHE_PATH = "worknet_detail_cache.db"
+
+# 다른 연결/워커 프로세스가 커밋하는 동안 기다릴 최대 시간 (초, sqlite3 기본값 5초)
+# 분할 수집(--workers)에서는 모든 워커가 같은 캐시 파일에 쓰므로 넉넉하게
+BUSY_TIMEOUT = 30
+
+
+def connect(path):
+    """WAL 모드 SQLite 연결 (읽기는 쓰기를 기다리지 않고, 쓰기끼리는 BUSY_TIMEOUT까지 대기)"""
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class DetailCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_days=7, max_entries=300000):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS detail ("
+            " posting_id TEXT PRIMARY KEY,"
+            " fields TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_detail_fetched ON detail(fetched_at)")
+        self.conn.commit()
+
+    def get(self, posting_id):
+        """유효한 캐시가 있으면 필드 dict, 없거나 만료되었으면 None"""
+        if not posting_id:
+            return None
+        row = self.conn.execute(
+            "SELECT fields FROM detail WHERE posting_id = ? AND fetched_at >= ?",
+            (posting_id, time.time() - self.ttl),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, posting_id, fields):
+        """하나도 못 찾은 결과는 저장하지 않음 (다음 실행에서 다시 시도)"""
+        if not posting_id or all(v == NOT_FOUND for v in fields.values()):
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO detail (posting_id, fields, fetched_at) VALUES (?, ?, ?)",
+            (posting_id, json.dumps(fields, ensure_ascii=False), time.time()),
+        )
+        self.conn.commit()
+
+    def evict(self):
+        """만료 항목 삭제 후, 최대 건수를 넘는 만큼 오래된 항목 삭제"""
+        self.conn.execute("DELETE FROM detail WHERE fetched_at < ?", (time.time() - self.ttl,))
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM detail").fetchone()
+        if count > self.max_entries:
+            self.conn.execute(
+                "DELETE FROM detail WHERE posting_id IN ("
+                " SELECT posting_id FROM detail ORDER BY fetched_at ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+        self.conn.commit()
+
+    def close(self):
+        try:
+            self.evict()
+            self.conn.close()
+        except Exception:
+            pass
+
+
+# ========================================================
+# 이전 실행에서 본 공고 ID 기록 (증분 수집용)
+# ========================================================
+# 공고 ID별로 목록 행 내용의 지문(fingerprint)을 저장해 두고
+# 새 공고 / 내용이 바뀐 공고 / 이미 본 공고를 구분합니다.
+
+class SeenStore:
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.conn = connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " posting_id TEXT PRIMARY KEY,"
+            " fingerprint TEXT NOT NULL,"
+            " last_seen REAL NOT NULL)"
+        )
+        self.conn.commit()
+
+    def status(self, posting_id, fingerprint):
+        """'new' / 'changed' / 'known' (ID가 없으면 알 수 없으므로 'new')"""
+        if not posting_id:
+            return "new"
+        row = self.conn.execute("SELECT fingerprint FROM seen WHERE posting_id = ?", (posting_id,)).fetchone()
+        if row is None:
+            return "new"
+        return "known" if row[0] == fingerprint else "changed"
+
+    def mark(self, posting_id, fingerprint):
+        if not posting_id:
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO seen (posting_id, fingerprint, last_seen) VALUES (?, ?, ?)",
+            (posting_id, fingerprint, time.time()),
+        )
+        # 상세 캐시와 같은 파일을 쓰므로 건마다 커밋 (DetailCache 참고)
+        self.conn.commit()
+
+    def close(self):
+        try:
+            self.conn.commit()
+            self.conn.close()
+        except Exception:
+            pass
+
+
+# ========================================================
+# 여러 프로세스가 함께 쓰는 공고 ID 선점 기록 (분할 수집용)
+# ========================================================
+# 워커 프로세스마다 다른 목록 페이지를 맡지만, 수집 도중 새 공고가 올라오면
+# 목록이 밀려서 같은 공고가 두 워커에 보일 수 있습니다.
+# 먼저 INSERT에 성공한 워커만 그 공고를 수집합니다 (SQLite가 프로세스 간 잠금 처리).
+# 선점한 워커 번호(owner)를 함께 남겨서, 워커가 죽은 뒤 이어하기 때는 자기 선점을 다시 가져갑니다.
+# (선점은 바로 커밋되지만 체크포인트는 주기적으로 저장되므로, 안 그러면 그사이 선점한 공고는 아무도 수집하지 않음)
+
+DEFAULT_CLAIMS_PATH = "worknet_claims.db"
+
+
+class ClaimStore:
+    def __init__(self, path=DEFAULT_CLAIMS_PATH, owner=None):
+        """owner: 이 워커의 번호 (같은 owner가 선점한 공고는 다시 선점 가능, None이면 다시 가져가지 않음)"""
+        self.owner = owner
+        self.duplicates = 0
+        self.reclaimed = 0
+        self.conn = connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS claims (posting_id TEXT PRIMARY KEY, owner TEXT)")
+        try:
+            # owner 컬럼이 없던 선점 기록 (이전 버전)
+            self.conn.execute("ALTER TABLE claims ADD COLUMN owner TEXT")
+        except sqlite3.OperationalError:
+            pass
+        self.conn.commit()
+
+    def claim(self, posting_id):
+        """
+        처음 선점했거나 이 워커가 예전에 선점한 공고면 True, 다른 워커가 가져갔으면 False
+        (ID가 없으면 항상 True)
+        """
+        if not posting_id:
+            return True
+        cur = self.conn.execute("INSERT OR IGNORE INTO claims (posting_id, owner) VALUES (?, ?)", (posting_id, self.owner))
+        # 다른 프로세스가 바로 볼 수 있도록 건마다 커밋
+        self.conn.commit()
+        if cur.rowcount == 1:
+            return True
+        if self.owner is not None:
+            row = self.conn.execute("SELECT owner FROM claims WHERE posting_id = ?", (posting_id,)).fetchone()
+            if row and row[0] == self.owner:
+                self.reclaimed += 1
+                return True
+        self.duplicates += 1
+        return False
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+
+# ========================================================
+# 목록 단계 중복 제거 (이번 실행에서 이미 예약한 공고)
+# ========================================================
+# 페이지를 넘기는 사이 새 공고가 올라오면 목록이 밀려서 같은 공고가 다음 페이지에 다시 보입니다.
+# 탭을 열거나 HTTP 요청을 보내기 전에 공고 키(공고 ID, 없으면 행 지문)로 걸러냅니다.
+# path를 주면 본 키를 SQLite에 남겨서 ttl_days 안에 다시 실행해도 건너뜁니다 (None이면 이번 실행만).
+#   - status()로 확인만 하고, 실제로 예약한 뒤에 mark()로 기록 (건너뛴 행까지 기록하면 다음 실행에서 영영 빠짐)
+#   - 이번 실행에서 다시 보인 공고('duplicate')와 이전 실행에서 본 공고('known')를 구분
+#     (증분 모드의 멈춤 판단에서 'known'은 이미 본 공고로 셈)
+
+class PostingDedupe:
+    def __init__(self, path=None, ttl_days=1):
+        self.duplicates = 0
+        self.known = 0
+        self._seen = set()
+        self._persisted = set()
+        self.conn = None
+        if path:
+            self.conn = connect(path)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS list_seen ("
+                " posting_key TEXT PRIMARY KEY,"
+                " seen_at REAL NOT NULL)"
+            )
+            self.conn.execute("DELETE FROM list_seen WHERE seen_at < ?", (time.time() - ttl_days * 86400,))
+            self.conn.commit()
+            self._persisted.update(key for (key,) in self.conn.execute("SELECT posting_key FROM list_seen"))
+
+    def status(self, key):
+        """
+        'new' / 'duplicate' (이번 실행에서 이미 예약) / 'known' (이전 실행에서 예약)
+        키가 없으면 알 수 없으므로 'new'. 중복이면 각 건수를 올림 (기록은 mark()에서)
+        """
+        if not key:
+            return "new"
+        if key in self._seen:
+            self.duplicates += 1
+            return "duplicate"
+        if key in self._persisted:
+            self.known += 1
+            return "known"
+        return "new"
+
+    def mark(self, key):
+        """예약한 공고 키 기록"""
+        if not key or key in self._seen:
+            return
+        self._seen.add(key)
+        if self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO list_seen (posting_key, seen_at) VALUES (?, ?)", (key, time.time()))
+            # 캐시 파일과 같은 경로를 줄 수 있으므로 건마다 커밋 (DetailCache 참고)
+            self.conn.commit()
+
+    def close(self):
+        if not self.conn:
+            return
+        try:
+            self.conn.commit()
+            self.conn.close()
+        except Exception:
+            pass
+
+
+# ========================================================
+# 회사 단위 캐시 (업종/인원수/팩스/주소는 회사 정보)
+# ========================================================
+# 큰 회사는 공고를 수십 개씩 올리는데, 공고마다 기업정보 탭을 누르고 HTML 전체에 정규식을 돌렸습니다.
+# 목록 행의 회사명(.cp_name)을 정규화한 키로 필드를 저장해 두고, 적중하면 상세 수집을 통째로 건너뜁니다.
+# (목록 행에는 사업자번호가 없어서 회사명으로 구분)
+#   - 실행 중에는 메모리, path를 주면 SQLite에도 저장 (ttl_days 동안 유효)
+#   - 같은 회사 공고를 여러 작업이 동시에 수집하지 않도록, 먼저 시작한 작업의 결과를 나머지가 기다림
+
+DEFAULT_COMPANY_TTL_DAYS = 30
+
+# 회사명에서 떼어낼 법인 형태 표기
+COMPANY_FORMS = re.compile(
+    r"\(주\)|㈜|주식회사|\(유\)|유한회사|\(합\)|합자회사|합명회사|\(재\)|재단법인|\(사\)|사단법인|"
+    r"사회복지법인|의료법인|학교법인|농업회사법인|영농조합법인|협동조합"
+)
+COMPANY_NOISE = re.compile(r"[\W_]+")
+
+
+def company_key(name):
+    """'(주) 샘플 테크' / '주식회사샘플테크' → '샘플테크' (회사명이 없거나 너무 짧으면 None)"""
+    if not name or name == "N/A":
+        return None
+    key = COMPANY_NOISE.sub("", COMPANY_FORMS.sub("", name)).lower()
+    return key if len(key) >= 2 else None
+
+
+class CompanyCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_days=DEFAULT_COMPANY_TTL_DAYS, required=("industry", "address"),
+                 wait_timeout=60):
+        """
+        path: SQLite 파일 (None이면 이번 실행 동안만 메모리에)
+        required: 이 필드를 모두 찾은 결과만 저장 (일부만 찾은 결과로 다른 공고까지 채우지 않음)
+        wait_timeout: 같은 회사를 수집 중인 작업을 기다리는 최대 시간 (초)
+        """
+        self.ttl = ttl_days * 86400
+        self.required = required
+        self.wait_timeout = wait_timeout
+        self.hits = 0
+        self.waited = 0
+        self._memory = {}
+        self._inflight = {}
+        self.conn = None
+        if path:
+            self.conn = connect(path)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS company ("
+                " company_key TEXT PRIMARY KEY,"
+                " fields TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL)"
+            )
+            self.conn.execute("DELETE FROM company WHERE fetched_at < ?", (time.time() - self.ttl,))
+            self.conn.commit()
+
+    def _lookup(self, key):
+        if key in self._memory:
+            return self._memory[key]
+        if not self.conn:
+            return None
+        row = self.conn.execute(
+            "SELECT fields FROM company WHERE company_key = ? AND fetched_at >= ?",
+            (key, time.time() - self.ttl),
+        ).fetchone()
+        if row is None:
+            return None
+        fields = self._memory[key] = json.loads(row[0])
+        return fields
+
+    def get(self, company):
+        """저장된 회사 필드 dict (없으면 None)"""
+        key = company_key(company)
+        fields = self._lookup(key) if key else None
+        if fields:
+            self.hits += 1
+            return dict(fields)
+        return None
+
+    async def wait(self, company):
+        """
+        저장된 필드가 있으면 바로, 다른 작업이 같은 회사를 수집 중이면 끝날 때까지 기다렸다가 그 결과를 돌려줌.
+        None이면 호출한 작업이 직접 수집 (이후 put / release로 기다리는 작업을 깨워야 함)
+        """
+        key = company_key(company)
+        if not key:
+            return None
+        fields = self.get(company)
+        if fields:
+            return fields
+        future = self._inflight.get(key)
+        if future is None:
+            self._inflight[key] = asyncio.get_running_loop().create_future()
+            return None
+        try:
+            fields = await asyncio.wait_for(asyncio.shield(future), self.wait_timeout)
+        except asyncio.TimeoutError:
+            return None
+        if fields:
+            self.waited += 1
+            return dict(fields)
+        return None
+
+    def put(self, company, fields):
+        """수집한 필드 저장 (필수 필드를 못 찾았으면 저장하지 않고 기다리는 작업만 깨움)"""
+        key = company_key(company)
+        if not key:
+            return
+        if any(fields.get(name, NOT_FOUND) == NOT_FOUND for name in self.required):
+            self.release(company)
+            return
+        fields = dict(fields)
+        self._memory[key] = fields
+        # 디스크 저장이 실패해도 기다리는 작업은 먼저 깨움
+        self._resolve(key, fields)
+        if self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO company (company_key, fields, fetched_at) VALUES (?, ?, ?)",
+                (key, json.dumps(fields, ensure_ascii=False), time.time()),
+            )
+            # 상세 캐시와 같은 파일을 쓰므로 건마다 커밋 (DetailCache 참고)
+            self.conn.commit()
+
+    def release(self, company):
+        """수집 실패: 기다리던 작업들은 각자 수집하도록 깨움"""
+        key = company_key(company)
+        if key:
+            self._resolve(key, None)
+
+    def _resolve(self, key, fields):
+        future = self._inflight.pop(key, None)
+        if future and not future.done():
+            future.set_result(fields)
+
+    def summary(self):
+        return f"적중 {self.hits}건 (동시 수집 대기 후 재사용 {self.waited}건), 회사 {len(self._memory)}곳"
+
+    def close(self):
+        for key in list(self._inflight):
+            self._resolve(key, None)
+        if not self.conn:
+            return
+        try:
+            self.conn.commit()
+            self.conn.close()
+        except Exception:
+            pass
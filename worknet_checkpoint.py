@@ -0,0 +1,140 @@
+import json
+import os
+import time
+
+from worknet_sink import iter_records
+
+# ========================================================
+# 긴 수집 작업의 체크포인트 / 이어하기
+# ========================================================
+# 몇 시간짜리 수집이 브라우저 오류로 죽으면 1페이지부터 다시 해야 했습니다.
+# 주기적으로 아래 상태를 JSON 파일에 저장해 두고, --resume(또는 GUI의 이어하기 버튼)로
+# 마지막 목록 페이지부터 다시 시작하면서 끝나지 않은 상세 수집만 다시 예약합니다.
+#   - page_num     : 마지막으로 보던 목록 페이지
+#   - scheduled    : 예약한 공고 ID
+#   - finished     : 수집이 끝난 공고 ID
+#   - pending      : 예약했지만 아직 안 끝난 공고 (목록 행 정보 포함)
+#   - failed       : 실패한 공고 (목록 행 정보 + 오류 메시지)
+# 결과 파일은 20건마다 디스크에 쓰이지만 체크포인트는 30초마다 저장되므로,
+# 이어하기 전에 결과 파일에 이미 있는 공고를 finished로 옮깁니다 (restore_finished).
+
+
+class Checkpoint:
+    # path=None이면 파일로 저장하지 않음 (실패 공고 재수집처럼 목록 위치가 필요 없는 실행)
+    def __init__(self, path, target_count=0, delta=False, interval=30):
+        self.path = path
+        self.interval = interval
+        self.target_count = target_count
+        self.delta = delta
+        self.page_num = 1
+        self.scheduled = set()
+        self.finished = set()
+        self.pending = {}
+        self.failed = {}
+        # 저장 직전에 호출 (결과 파일 버퍼를 먼저 디스크에 내려 finished와 어긋나지 않게)
+        self.on_save = None
+        self._last_save = time.time()
+
+    @classmethod
+    def load(cls, path, interval=30):
+        """저장된 체크포인트 불러오기 (없거나 깨졌으면 None)"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        cp = cls(path, data.get("target_count", 0), data.get("delta", False), interval)
+        cp.page_num = data.get("page_num", 1)
+        cp.scheduled = set(data.get("scheduled", []))
+        cp.finished = set(data.get("finished", []))
+        cp.pending = {row["posting_id"]: row for row in data.get("pending", [])}
+        cp.failed = {item["row"]["posting_id"]: item for item in data.get("failed", [])}
+        return cp
+
+    def is_scheduled(self, posting_id):
+        return bool(posting_id) and posting_id in self.scheduled
+
+    def mark_scheduled(self, row):
+        posting_id = row.get("posting_id")
+        if not posting_id:
+            return
+        self.scheduled.add(posting_id)
+        self.pending[posting_id] = row
+        self.failed.pop(posting_id, None)
+
+    def mark_finished(self, posting_id):
+        if not posting_id:
+            return
+        self.finished.add(posting_id)
+        self.pending.pop(posting_id, None)
+        self.failed.pop(posting_id, None)
+        self.maybe_save()
+
+    def mark_failed(self, posting_id, error=""):
+        """예약된 공고를 실패로 옮김 (이어하기 때 다시 예약됨)"""
+        row = self.pending.pop(posting_id, None) if posting_id else None
+        if row is None:
+            return
+        self.failed[posting_id] = {"row": row, "error": str(error)[:300]}
+        self.maybe_save()
+
+    def restore_finished(self, results_path):
+        """
+        결과 파일(JSONL)에 이미 기록된 공고를 완료로 옮김 (마지막 저장 뒤 죽었을 때 다시 수집해 중복 기록되지 않게)
+        옮긴 건수를 반환합니다.
+        """
+        restored = 0
+        try:
+            for record in iter_records(results_path):
+                posting_id = record.get("posting_id")
+                if not posting_id or posting_id in self.finished:
+                    continue
+                self.scheduled.add(posting_id)
+                self.finished.add(posting_id)
+                if self.pending.pop(posting_id, None) is not None or self.failed.pop(posting_id, None) is not None:
+                    restored += 1
+        except OSError:
+            pass
+        return restored
+
+    def unfinished_rows(self):
+        """이어하기 시 다시 예약할 목록 행 (미완료 + 실패)"""
+        return list(self.pending.values()) + [item["row"] for item in self.failed.values()]
+
+    def maybe_save(self):
+        if time.time() - self._last_save >= self.interval:
+            self.save()
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체 (저장 도중 죽어도 이전 체크포인트는 유지)"""
+        if self.on_save:
+            self.on_save()
+        if not self.path:
+            return
+        data = {
+            "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "target_count": self.target_count,
+            "delta": self.delta,
+            "page_num": self.page_num,
+            "scheduled": sorted(self.scheduled),
+            "finished": sorted(self.finished),
+            "pending": list(self.pending.values()),
+            "failed": list(self.failed.values()),
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+        self._last_save = time.time()
+
+    def clear(self):
+        """정상 완료 시 체크포인트 삭제"""
+        if not self.path:
+            return
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,187 @@
+import asyncio
+import contextvars
+import statistics
+import time
+
+# ========================================================
+# 상세 수집 동시 작업 수 자동 조절 (AIMD)
+# ========================================================
+# 고정 Semaphore(12)/Semaphore(10)는 노트북에는 너무 많고 수집 서버에는 너무 적습니다.
+# 완료된 작업 window건마다 지연시간/타임아웃/오류율을 보고 동시 작업 수를 조절합니다.
+#   - 문제 없고 한도까지 꽉 차게 쓰고 있었으면 +1 (가산 증가)
+#   - 타임아웃, 오류율 초과, 지연시간이 기준의 latency_factor배 이상이면 x beta (승산 감소)
+# 모든 결정은 log로 남겨서 값을 조정할 때 참고합니다.
+# 슬롯 안에서 TokenBucket을 기다린 시간은 지연시간에서 뺍니다.
+# (속도 제한 대기까지 지연으로 세면 한도/속도만큼 지연이 늘어나 스스로 동시 작업 수를 깎음)
+
+# 현재 작업의 슬롯이 모으는 토큰 대기 시간 ([초] 리스트, 슬롯 밖이면 None)
+_throttle_wait = contextvars.ContextVar("throttle_wait", default=None)
+
+
+def _is_timeout(error):
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    return "timeout" in type(error).__name__.lower() or "timeout" in str(error).lower()
+
+
+class AdaptiveConcurrency:
+    def __init__(self, start=8, min_limit=2, max_limit=32, window=20, beta=0.7,
+                 max_error_rate=0.1, latency_factor=2.0, log=print):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(max(start, self.min_limit), self.max_limit)
+        self.window = window
+        self.beta = beta
+        self.max_error_rate = max_error_rate
+        self.latency_factor = latency_factor
+        self.log = log
+
+        self.inflight = 0
+        self.base_latency = None
+        self.increases = 0
+        self.decreases = 0
+        self.peak_limit = self.limit
+        self._samples = []
+        self._saturated = False
+        self._cond = None
+
+    def slot(self):
+        """async with limiter.slot() as slot: ... (처리한 오류는 slot.failed(e)로 알림)"""
+        return _Slot(self)
+
+    async def acquire(self):
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.inflight < self.limit)
+            self.inflight += 1
+            if self.inflight >= self.limit:
+                self._saturated = True
+
+    async def release(self):
+        async with self._cond:
+            self.inflight -= 1
+            self._cond.notify_all()
+
+    def record(self, latency, error=None):
+        """작업 하나의 결과 기록 (직후 release의 notify_all이 늘어난 한도만큼 대기 작업을 깨움)"""
+        self._samples.append((latency, error))
+        if len(self._samples) >= self.window:
+            self._adjust()
+
+    def _adjust(self):
+        samples, self._samples = self._samples, []
+        saturated, self._saturated = self._saturated, False
+
+        latency = statistics.median(s[0] for s in samples)
+        errors = [s[1] for s in samples if s[1] is not None]
+        timeouts = sum(1 for e in errors if _is_timeout(e))
+        error_rate = len(errors) / len(samples)
+        stats = f"중앙값 {latency:.2f}s, 오류 {len(errors)}/{len(samples)}, 타임아웃 {timeouts}"
+
+        # 문제없는 구간의 가장 빠른 지연시간을 기준으로 삼음
+        if not errors and (self.base_latency is None or latency < self.base_latency):
+            self.base_latency = latency
+
+        reason = None
+        if timeouts:
+            reason = "타임아웃"
+        elif error_rate > self.max_error_rate:
+            reason = f"오류율 {error_rate:.0%}"
+        elif self.base_latency and latency > self.base_latency * self.latency_factor:
+            reason = f"지연 증가 (기준 {self.base_latency:.2f}s)"
+
+        old = self.limit
+        if reason:
+            self.limit = max(self.min_limit, int(self.limit * self.beta))
+            if self.limit < old:
+                self.decreases += 1
+                self.log(f"  [동시성] {old} → {self.limit} 감소: {reason} | {stats}")
+        elif saturated and self.limit < self.max_limit:
+            self.limit += 1
+            self.increases += 1
+            self.peak_limit = max(self.peak_limit, self.limit)
+            self.log(f"  [동시성] {old} → {self.limit} 증가 | {stats}")
+
+    def summary(self):
+        return (f"최종 {self.limit} (범위 {self.min_limit}~{self.max_limit}, 최대 {self.peak_limit}) "
+                f"| 증가 {self.increases}회 / 감소 {self.decreases}회")
+
+
+class _Slot:
+    def __init__(self, limiter):
+        self.limiter = limiter
+        self.error = None
+        self._start = 0.0
+        self._waited = [0.0]
+        self._token = None
+
+    def failed(self, error):
+        self.error = error
+
+    async def __aenter__(self):
+        await self.limiter.acquire()
+        self._start = time.perf_counter()
+        self._token = _throttle_wait.set(self._waited)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc is not None and self.error is None:
+            self.error = exc
+        _throttle_wait.reset(self._token)
+        latency = time.perf_counter() - self._start - self._waited[0]
+        self.limiter.record(max(0.0, latency), self.error)
+        await self.limiter.release()
+        return False
+
+
+# ========================================================
+# 전체 요청 속도 제한 (토큰 버킷)
+# ========================================================
+# 탭 열기 사이의 random.uniform(0.4, 0.8) / sleep(0.5) 대신, 사이트로 나가는 모든 이동
+# (목록 페이지, 상세 페이지, 기업정보 탭)이 하나의 버킷에서 토큰을 받아 갑니다.
+# 초당 rate개씩 토큰이 차고 최대 burst개까지 모아 둘 수 있습니다. rate <= 0 이면 제한 없음.
+
+class TokenBucket:
+    def __init__(self, rate=5.0, burst=10):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.requests = 0
+        self.waited = 0.0
+        self._lock = None
+
+    async def acquire(self):
+        """토큰 1개를 받을 때까지 대기 (동시성 슬롯 안이면 기다린 시간을 슬롯에 알려 지연시간에서 뺌)"""
+        self.requests += 1
+        if not self.rate or self.rate <= 0:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        start = time.perf_counter()
+        try:
+            await self._take()
+        finally:
+            waited = _throttle_wait.get()
+            if waited is not None:
+                waited[0] += time.perf_counter() - start
+
+    async def _take(self):
+        # 락을 쥔 채로 기다리므로 먼저 온 요청부터 순서대로 나감
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            wait = (1 - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+            self.waited += wait
+            self.tokens = 0.0
+            self.updated = time.monotonic()
+
+    def summary(self):
+        limit = f"초당 {self.rate:g}건, 버스트 {self.burst}" if self.rate and self.rate > 0 else "제한 없음"
+        return f"{limit} | 요청 {self.requests}건, 대기 합계 {self.waited:.1f}s"
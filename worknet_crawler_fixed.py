@@ -65,28 +65,124 @@ def find_chromium_executable():
         return None
 
 try:
+    import argparse
     import asyncio
-    import json
-    import re
-    import random
-    import pandas as pd
+    import multiprocessing
     from playwright.async_api import async_playwright
+    from worknet_fetch import HttpDetailFetcher
+    from worknet_listing import ListPrefetcher, job_basic_from_row, row_title_locator, row_fingerprint, row_key, list_page_url, plan_shards, LIST_ROW_SELECTOR, LIST_PAGE_SIZE, SORT_NEWEST
+    from worknet_extract import extract_page_fields, FrameStats
+    from worknet_cache import DetailCache, SeenStore, ClaimStore, PostingDedupe, CompanyCache, DEFAULT_CACHE_PATH, DEFAULT_CLAIMS_PATH
+    from worknet_sink import ResultSink, export_excel, merge_results
+    from worknet_export import export_results, default_export_path, EXPORT_FORMATS as AVAILABLE_FORMATS, PARTITION_COLUMNS
+    from worknet_checkpoint import Checkpoint
+    from worknet_concurrency import AdaptiveConcurrency, TokenBucket
+    from worknet_intercept import InterceptPolicy
+    from worknet_pool import PagePool
+    from worknet_metrics import Metrics, span, DEFAULT_METRICS_PATH
+    from worknet_retry import RetryQueue, take_dead_letters, DEFAULT_DEAD_LETTER_PATH
+    from worknet_waits import WaitStats, wait_for_fields, settle_after, DETAIL_LOAD_TIMEOUT, FIELDS_READY_TIMEOUT, CORP_TAB_TIMEOUT
 except Exception:
     log_error(traceback.format_exc())
     print("임포트 에러 발생! debug_launch_log.txt를 확인하세요.")
     input("Press Enter to exit...")
     sys.exit(1)
 
-# 텍스트 정제 함수
-def clean_text(text):
-    if not isinstance(text, str):
-        return str(text)
-    text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]', '', text)
-    if len(text) > 32000:
-        text = text[:32000] + "..."
-    return text
-
-async def run():
+# 상세 페이지 수집 방식
+# "http": HTTP로 HTML을 받아 파싱하고, 자바스크립트가 필요한 페이지만 탭으로 열기 (기본)
+# "browser": 기존처럼 모든 공고를 Ctrl+클릭 새 탭으로 열기
+FETCH_BACKEND = "http"
+
+# 탭에서 필드 추출 방식
+# "inpage": 프레임마다 스크립트 1회 실행으로 모든 필드 추출 (기본)
+# "locator": 기존 로케이터 체인 방식 (필드마다 여러 번 왕복)
+DETAIL_EXTRACT_MODE = "inpage"
+
+# 상세 수집 결과 캐시 (공고 ID 기준, 캐시 적중 시 상세 수집 생략)
+# CACHE_PATH = None 으로 두면 캐시를 사용하지 않음
+CACHE_PATH = DEFAULT_CACHE_PATH
+CACHE_TTL_DAYS = 7
+CACHE_MAX_ENTRIES = 300000
+# 회사 단위 캐시 (업종/인원수/팩스/주소는 회사 정보라 같은 회사의 다른 공고는 상세 수집 생략)
+# CACHE_PATH에 함께 저장, CACHE_PATH = None 이면 이번 실행 동안만 메모리에
+COMPANY_CACHE_TTL_DAYS = 30
+
+# 목록 단계 중복 제거 (목록이 밀려 다시 보인 공고는 탭/HTTP 요청 전에 건너뜀)
+# DEDUPE_PATH를 지정하면 본 공고를 DEDUPE_TTL_DAYS일 동안 기록해 다음 실행에서도 건너뜀 (None: 이번 실행만)
+DEDUPE_PATH = None
+DEDUPE_TTL_DAYS = 1
+
+# 수집 결과는 공고마다 JSONL 파일에 바로 기록하고, 마지막에 엑셀로 변환
+RESULTS_JSONL = "worknet_results.jsonl"
+RESULTS_XLSX = "worknet_results.xlsx"
+
+# 결과 내보내기 형식 (xlsx / parquet / feather / csv, --format 으로 변경)
+# parquet/feather/csv는 타입이 있는 컬럼(인원수 정수, 급여 최소/최대/단위, 시/도)으로 저장
+# EXPORT_PARTITION_BY에 run_date / region을 넣으면 폴더로 나눠 저장 (--partition-by)
+EXPORT_FORMATS = ("xlsx",)
+EXPORT_PARTITION_BY = ()
+RESULTS_EXPORT_BASE = "worknet_results"
+
+# 목록 페이지는 URL(pageIndex/resultCnt)로 직접 받고, 상세 수집과 별도로 최대 몇 페이지를 미리 받아 둠
+LIST_PREFETCH = 3
+
+# 상세 수집 동시 작업 수 (지연시간/타임아웃/오류율에 따라 최소~최대 사이에서 자동 조절)
+CONCURRENCY_START = 12
+CONCURRENCY_MIN = 2
+CONCURRENCY_MAX = 32
+
+# 탭 폴백/브라우저 목록 읽기에 재사용할 탭 수 (매번 새 탭을 만들고 닫지 않음)
+PAGE_POOL_SIZE = 6
+
+# 사이트 요청 속도 제한 (목록/상세/기업정보 탭 이동 모두 포함, 초당 요청 수와 순간 최대치)
+# 분할 수집(--workers)에서는 워커 수로 나눠서 전체 속도가 이 값을 넘지 않게 함
+REQUESTS_PER_SEC = 5.0
+REQUEST_BURST = 10
+
+# 체크포인트 파일 (--resume 으로 마지막 페이지부터 이어서 수집)
+CHECKPOINT_PATH = "worknet_checkpoint.json"
+
+# 실패한 상세 수집 재시도 (지수 백오프: 2초, 4초, ... / 실행 전체 재시도 예산)
+# 끝내 실패한 공고는 DEAD_LETTER_PATH에 남고 --replay-dead-letter 로 그 공고만 다시 수집
+# (GUI의 실패 공고는 --replay-dead-letter --dead-letter-path worknet_dead_letter_gui.jsonl)
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 2.0
+RETRY_BUDGET = 200
+DEAD_LETTER_PATH = DEFAULT_DEAD_LETTER_PATH
+
+# 단계별 소요 시간 (p50/p95/p99, 횟수, 오류) 기록 파일: JSON + 같은 이름의 .prom (Prometheus 텍스트)
+# 실행 중 METRICS_INTERVAL초마다, 끝날 때 한 번 더 씀. METRICS_PATH = None 이면 파일로 쓰지 않음
+METRICS_PATH = DEFAULT_METRICS_PATH
+METRICS_INTERVAL = 30
+
+# 분할 수집 (--workers N): 목록 페이지 범위를 N개 프로세스가 나눠 맡음
+# 워커마다 브라우저를 따로 띄우고, 공고 ID 선점 기록(CLAIMS_PATH)을 함께 써서 중복을 막음
+CLAIMS_PATH = DEFAULT_CLAIMS_PATH
+SHARD_RESULTS_JSONL = "worknet_results.shard{}.jsonl"
+SHARD_CHECKPOINT_PATH = "worknet_checkpoint.shard{}.json"
+SHARD_DEAD_LETTER_PATH = "worknet_dead_letter.shard{}.jsonl"
+SHARD_METRICS_PATH = "worknet_metrics.shard{}.json"
+
+async def run(target_count=100, delta=False, resume=False, start_page=1, end_page=None,
+              results_path=RESULTS_JSONL, checkpoint_path=CHECKPOINT_PATH, claims_path=None, claims_owner=None, export=True,
+              request_rate=REQUESTS_PER_SEC, headless=False, dead_letter_path=DEAD_LETTER_PATH, replay_dead_letter=False,
+              metrics_path=METRICS_PATH, formats=EXPORT_FORMATS, partition_by=EXPORT_PARTITION_BY):
+    """
+    target_count: 수집할 공고 수
+    delta: True면 이전 실행에서 본 공고는 건너뛰고 새 공고/변경된 공고만 수집
+    resume: True면 마지막 체크포인트의 목록 페이지부터 이어서 수집
+    start_page, end_page: 맡을 목록 페이지 범위 (분할 수집 워커용, end_page=None이면 끝까지)
+    results_path, checkpoint_path: 결과 JSONL / 체크포인트 파일 경로
+    claims_path: 다른 워커와 함께 쓰는 공고 ID 선점 기록 (None이면 사용 안 함)
+    claims_owner: 선점 기록에 남길 워커 번호 (이어하기 때 자기 선점은 다시 가져감)
+    export: False면 엑셀/분석용 내보내기 생략 (분할 수집은 코디네이터가 합친 뒤 변환)
+    request_rate: 이 프로세스의 초당 요청 수 제한
+    headless: True면 브라우저 창 없이 실행 (UA/탐지 우회 스크립트는 동일하게 적용)
+    dead_letter_path: 재시도 끝에 실패한 공고를 남길 파일
+    replay_dead_letter: True면 목록은 보지 않고 실패 보관 파일의 공고만 다시 수집 (결과는 기존 결과에 추가)
+    metrics_path: 단계별 소요 시간 기록 파일 (JSON, 같은 이름의 .prom도 함께 씀)
+    formats, partition_by: 내보낼 형식 목록 / 나눠 저장할 컬럼 (save_results 참고)
+    """
     # [중요] 사용 할 브라우저 경로 미리 찾기
     exec_path = find_chromium_executable()
     
@@ -101,10 +197,10 @@ async def run():
         return
 
     async with async_playwright() as p:
-        # headless=False: 브라우저가 뜨고 작동하는 모습을 볼 수 있음
+        # headless=False: 브라우저가 뜨고 작동하는 모습을 볼 수 있음 (--headless 로 창 숨김)
         
         launch_args = {
-            "headless": False,
+            "headless": headless,
             "args": ["--disable-blink-features=AutomationControlled"],
             "executable_path": exec_path  # 찾은 경로 강제 지정
         }
@@ -125,43 +221,134 @@ async def run():
         # navigator.webdriver = false 설정 (탐지 우회)
         await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
-        # [속도 개선] 이미지, 폰트 등 불필요한 리소스 로딩 차단
-        await context.route("**/*.{png,jpg,jpeg,gif,webp,svg,woff,woff2,ttf,eot}", lambda route: route.abort())
+        # [속도 개선] 이미지, 폰트, 분석/광고 스크립트 등 불필요한 요청 차단 (종류 + 호스트 기준)
+        intercept = InterceptPolicy()
+        await intercept.install(context)
 
         page = await context.new_page()
 
-        url = "https://www.work24.go.kr/wk/a/b/1200/retriveDtlEmpSrchList.do"
+        # 모든 이동이 거쳐 가는 요청 속도 제한
+        throttle = TokenBucket(request_rate, REQUEST_BURST)
+        # 상세 탭 로딩 대기 시간 기록 (고정 sleep 대신 이벤트 대기)
+        waits = WaitStats()
+        # 공고당 탐색한 iframe 수 기록
+        frame_stats = FrameStats()
+        # 단계별 소요 시간 (목록/탭/상세/필드 추출/엑셀)
+        metrics = Metrics(metrics_path, METRICS_INTERVAL)
+
+        # HTTP 상세 수집용 클라이언트 (컨텍스트 쿠키 공유, 연결 재사용)
+        fetcher = HttpDetailFetcher(context, throttle=throttle)
+
+        # 이어하기: 저장된 체크포인트의 목표/모드/페이지를 그대로 사용
+        checkpoint = Checkpoint.load(checkpoint_path) if resume and not replay_dead_letter else None
+        resuming = checkpoint is not None
+        replay_rows = []
+        if replay_dead_letter:
+            # 실패 공고 재수집: 파일에 저장하지 않는 체크포인트를 쓰고, 실패 공고는 아래에서 상세 URL로 바로 예약
+            # (체크포인트는 공고 ID가 없는 행을 기록하지 않으므로 거치지 않음)
+            replay_rows = take_dead_letters(dead_letter_path)
+            print(f"[실패 공고 재수집] {len(replay_rows)}건 ({dead_letter_path})")
+            checkpoint = Checkpoint(None, len(replay_rows))
+        elif resume and not resuming:
+            print("저장된 체크포인트가 없어 처음부터 수집합니다.")
+        if resuming:
+            target_count = checkpoint.target_count or target_count
+            delta = checkpoint.delta
+            # 마지막 체크포인트 저장 뒤 결과 파일에 기록된 공고는 다시 예약하지 않음
+            restored = checkpoint.restore_finished(results_path)
+            if restored:
+                print(f"[이어하기] 결과 파일에 이미 있는 공고 {restored}건을 완료로 처리")
+            print(f"[이어하기] {checkpoint.page_num}페이지부터 재개 (완료 {len(checkpoint.finished)}건, 미완료 {len(checkpoint.unfinished_rows())}건)")
+        else:
+            checkpoint = Checkpoint(checkpoint_path, target_count, delta)
+            checkpoint.page_num = start_page
+
+        # 증분 모드는 최신 등록순으로 보다가 이미 본 공고만 있는 페이지에서 멈춤
+        list_params = SORT_NEWEST if delta else None
+        url = list_page_url(checkpoint.page_num, list_params)
         print(f"이동 중: {url}...")
         
         try:
+            await throttle.acquire()
             await page.goto(url, wait_until="networkidle")
         except Exception as e:
             print(f"이동 오류(1차): {e}")
             await asyncio.sleep(1) # 대기 시간 단축
             try:
+                await throttle.acquire()
                 await page.goto(url)
                 await page.wait_for_load_state("domcontentloaded")
             except Exception as e2:
                 print(f"이동 오류(2차): {e2} - 접속이 차단되었거나 인터넷 연결을 확인해주세요.")
                 # 여기서 종료하지 않고 진행 시도하거나 return 할 수 있음
 
-        jobs = []
-        target_count = 100 
-        page_num = 1
+        # 결과를 메모리에 모으지 않고 완료 즉시 파일에 추가 (중간에 죽어도 보존)
+        sink = ResultSink(results_path, append=resuming or replay_dead_letter)
+        checkpoint.on_save = sink.flush
+        # 목록 페이지 미리 받기 (메인 탭은 쿠키 준비와 Ctrl+클릭 방식에만 사용)
+        pages = PagePool(context, PAGE_POOL_SIZE)
+        prefetcher = ListPrefetcher(context, list_params, ahead=LIST_PREFETCH, throttle=throttle, pages=pages, metrics=metrics)
+        shown_page = checkpoint.page_num
         
         # [속도 최적화] 병렬 작업을 위한 설정
-        # 동시에 12개 탭까지 허용 (검색 속도 대폭 증가)
-        sem = asyncio.Semaphore(12)
+        # 동시 작업 수는 12개에서 시작해 상황에 맞춰 자동 조절
+        limiter = AdaptiveConcurrency(CONCURRENCY_START, CONCURRENCY_MIN, CONCURRENCY_MAX)
         tasks = []
-        scheduled_count = 0
+        scheduled_count = len(checkpoint.scheduled)
+
+        cache = DetailCache(CACHE_PATH, CACHE_TTL_DAYS, CACHE_MAX_ENTRIES) if CACHE_PATH else None
+        companies = CompanyCache(CACHE_PATH, COMPANY_CACHE_TTL_DAYS)
+        seen = SeenStore(CACHE_PATH or DEFAULT_CACHE_PATH) if delta else None
+        known_skipped = 0
+        claims = ClaimStore(claims_path, claims_owner) if claims_path else None
+        dedupe = PostingDedupe(DEDUPE_PATH, DEDUPE_TTL_DAYS)
+        retries = RetryQueue(RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, budget=RETRY_BUDGET, dead_letter_path=dead_letter_path)
+
+        # 수집 결과 병합 (+ 캐시 저장)
+        # from_company=True: 회사 단위 캐시에서 가져온 필드
+        # 결과를 쓴 뒤의 캐시 저장 실패는 경고만 (예외가 나면 이미 쓴 공고를 재시도해 중복 기록됨)
+        def record_job(job_basic, fields, from_cache=False, from_company=False):
+            job_basic.update(fields)
+            sink.write(job_basic)
+            checkpoint.mark_finished(job_basic.get("posting_id"))
+            try:
+                # 회사 캐시를 먼저 (같은 회사를 기다리는 작업은 디스크 저장 전에 깨어남)
+                if not from_company:
+                    companies.put(job_basic.get("company"), fields)
+                if cache and not from_cache:
+                    cache.put(job_basic.get("posting_id"), fields)
+                if seen:
+                    seen.mark(job_basic.get("posting_id"), row_fingerprint(job_basic))
+            except Exception as e:
+                print(f"  [캐시 저장 실패] {e}")
+            metrics.maybe_export()
+            tag = "회사 캐시" if from_company else "캐시" if from_cache else "수집 완료"
+            print(f"  [{tag}] {job_basic['title'][:15]}... | 주소: {fields['address']} | 팩스: {fields['fax']}")
 
         # 상세 페이지 수집 및 브라우저 닫기까지 처리하는 비동기 함수
-        async def extract_detail(dtl_page, job_basic):
-            async with sem:
+        # 실패 처리: 상세 URL이 있으면 백오프 뒤 재시도, 횟수/예산을 넘으면 실패 보관 파일 + 체크포인트 실패
+        def handle_failure(job_basic, detail_url, error, attempt):
+            # 같은 회사 결과를 기다리던 작업은 각자 수집하도록 깨움
+            companies.release(job_basic.get("company"))
+            row = dict(job_basic, detail_url=detail_url)
+            if detail_url:
+                retry = lambda next_attempt: extract_detail_http(detail_url, job_basic, next_attempt)
+                if retries.submit(attempt, retry, row, error):
+                    return
+            else:
+                retries.dead_letter(row, error, attempt, "상세 URL 없음")
+            checkpoint.mark_failed(job_basic.get("posting_id"), error)
+
+        # pooled=True면 다 쓴 탭을 닫지 않고 풀에 반납
+        async def extract_detail(dtl_page, job_basic, pooled=False, detail_url=None, attempt=1):
+            async with limiter.slot() as slot:
                 try:
-                    # 로딩 대기
-                    await dtl_page.wait_for_load_state("domcontentloaded")
-                    await asyncio.sleep(0.3) # 대기 시간 최소화
+                    # 로딩 대기: DOM 준비 → 필드 라벨이 어느 프레임에든 붙을 때까지 (고정 대기 없음)
+                    with metrics.span("detail_load") as s:
+                        if not await waits.run("detail_dom", dtl_page.wait_for_load_state("domcontentloaded", timeout=DETAIL_LOAD_TIMEOUT)):
+                            raise RuntimeError(f"상세 페이지 로딩 {DETAIL_LOAD_TIMEOUT}ms 초과")
+                        if not await waits.run("detail_fields", wait_for_fields(dtl_page, FIELDS_READY_TIMEOUT)):
+                            s.fail()
 
                     # [중요] '기업정보' 탭이나 버튼이 있다면 클릭하여 정보 로딩 유도
                     try:
@@ -169,275 +356,206 @@ async def run():
                         corp_tab = dtl_page.locator("a:has-text('기업정보'), li:has-text('기업정보'), button:has-text('기업정보')").first
                         if await corp_tab.count() > 0:
                             if await corp_tab.is_visible():
-                                await corp_tab.click()
-                                await asyncio.sleep(0.5) # 로딩 대기
+                                with metrics.span("corp_tab") as s:
+                                    await throttle.acquire()
+                                    # 라벨은 이미 붙어 있으므로 클릭이 일으킨 요청/DOM 변경이 끝날 때까지 대기
+                                    async with settle_after(dtl_page) as settled:
+                                        await corp_tab.click()
+                                        if not await waits.run("corp_tab", settled.wait(CORP_TAB_TIMEOUT)):
+                                            s.fail()
                     except:
                         pass
 
-                    industry = "정보 없음"
-                    employees = "정보 없음"
-                    fax = "정보 없음"
-                    address = "정보 없음"
-
-                    # 메인 페이지 및 모든 iframe 탐색
-                    frames = [dtl_page] + dtl_page.frames
-
-                    for frame in frames:
-                        try:
-                            # 1. 업종
-                            if industry == "정보 없음":
-                                # Case A: 표 형식 (th, td)
-                                th = frame.locator("th").filter(has_text=re.compile(r"업\s*종"))
-                                if await th.count() > 0:
-                                    td = th.first.locator("xpath=following-sibling::td")
-                                    if await td.count() > 0:
-                                        industry = await td.first.inner_text()
-                                        industry = industry.strip()
-                                
-                                # Case B: 리스트 형식 (li > em.tit)
-                                if industry == "정보 없음":
-                                    # <em class="tit">업종</em>노인 요양 복지시설 운영업
-                                    em = frame.locator("li em.tit").filter(has_text=re.compile(r"업\s*종"))
-                                    if await em.count() > 0:
-                                        # em의 부모(li) 텍스트 전체에서 em 텍스트('업종')를 제거하는 방식
-                                        li = em.first.locator("xpath=..")
-                                        full_text = await li.inner_text() # "업종\n노인 요양..."
-                                        # em 텍스트 제거하고 나머지 반환
-                                        industry = full_text.replace(await em.first.inner_text(), "").strip()
-
-                            # 2. 인원수 (근로자수 / 사원수)
-                            if employees == "정보 없음":
-                                # Case A: 표 형식
-                                th = frame.locator("th").filter(has_text=re.compile(r"(근로자수|사원수|직원수)"))
-                                if await th.count() > 0:
-                                    td = th.first.locator("xpath=following-sibling::td")
-                                    if await td.count() > 0:
-                                        employees = await td.first.inner_text()
-                                        employees = employees.strip()
-                                
-                                # Case B: 리스트 형식
-                                if employees == "정보 없음":
-                                     em = frame.locator("li em.tit").filter(has_text=re.compile(r"(근로자수|사원수|직원수)"))
-                                     if await em.count() > 0:
-                                        li = em.first.locator("xpath=..")
-                                        full_text = await li.inner_text()
-                                        employees = full_text.replace(await em.first.inner_text(), "").strip()
-
-                            # 3. 팩스
-                            if fax == "정보 없음":
-                                th = frame.locator("th").filter(has_text=re.compile(r"(팩스|FAX|Fax)"))
-                                if await th.count() > 0:
-                                    td = th.first.locator("xpath=following-sibling::td")
-                                    if await td.count() > 0:
-                                        fax = await td.first.inner_text()
-                                        fax = fax.strip()
-                            
-                            # 4. 주소 (회사주소 / 소재지)
-                            if address == "정보 없음":
-                                # [최우선] Case Special: 지도 버튼(data-addr) 활용
-                                # 예: <button data-addr="충청북도 제천시...">
-                                try:
-                                    map_attr_el = frame.locator("[data-addr]").first
-                                    if await map_attr_el.count() > 0:
-                                        val = await map_attr_el.get_attribute("data-addr")
-                                        if val and len(val.strip()) > 5:
-                                            address = val.strip()
-                                except: pass
-
-                                # Case A: 표 형식 (th -> td)
-                                if address == "정보 없음":
-                                    th = frame.locator("th").filter(has_text=re.compile(r"(주소|소재지|위치)"))
-                                    if await th.count() > 0:
-                                        td = th.first.locator("xpath=following-sibling::td")
-                                        if await td.count() > 0:
-                                            address = await td.first.inner_text()
-                                            address = address.strip()
-                                
-                                # Case B: 리스트 형식 (li > em.tit)
-                                if address == "정보 없음":
-                                     em = frame.locator("li em.tit").filter(has_text=re.compile(r"(주소|소재지|위치)"))
-                                     if await em.count() > 0:
-                                        li = em.first.locator("xpath=..")
-                                        full_text = await li.inner_text()
-                                        address = full_text.replace(await em.first.inner_text(), "").strip()
-
-                                # Case C: 텍스트로 바로 적혀있는 경우 (P, DIV 등)
-                                # 예: <p>경기도 양주시 ...</p>
-                                if address == "정보 없음":
-                                    regions = ["서울", "경기", "인천", "부산", "대구", "광주", "대전", "울산", "세종", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"]
-                                    invalid_keywords = ["연봉", "급여", "월급", "일급", "시급", "채용", "모집", "근무", "우대", "경력", "만원", "찾아줘"]
-                                    
-                                    for region in regions:
-                                        # 해당 지역명으로 시작하는 P, DIV 태그 검색
-                                        xpath_query = f"//p[starts-with(normalize-space(.), '{region}')] | //div[starts-with(normalize-space(.), '{region}')] | //span[starts-with(normalize-space(.), '{region}')]"
-                                        addr_el = frame.locator(xpath_query).first
-                                        if await addr_el.count() > 0:
-                                            cand_addr = await addr_el.inner_text()
-                                            cand_addr = re.sub(r'\s+', ' ', cand_addr).strip()
-                                            
-                                            # [필터링] 주소가 아닌 문장(연봉, 채용 등) 걸러내기
-                                            if any(k in cand_addr for k in invalid_keywords):
-                                                continue
-
-                                            # 너무 긴 문장(본문 등)은 제외하고 적당한 길이인 경우만 주소로 인식
-                                            if 5 < len(cand_addr) < 80:
-                                                address = cand_addr
-                                                break
-
-                        except:
-                            continue
-
-                    # 3-2. 팩스 (Regex - 테이블에서 못 찾은 경우)
-                    if not fax or fax == "정보 없음" or fax == "-":
-                         try:
-                            all_text = ""
-                            for frame in frames:
-                                try: all_text += await frame.content()
-                                except: pass
-                            
-                            pattern = re.compile(r'(?:팩스|FAX|Fax|F\s*A\s*X)(?:<[^>]*>|[\s:.-])*(\d{2,4}[-. ]\d{3,4}[-. ]\d{4})')
-                            match = pattern.search(all_text)
-                            if match:
-                                found_num = match.group(1).replace(" ", "").replace(".", "-")
-                                if not found_num.startswith("010"):
-                                    fax = found_num
-                         except:
-                             pass
-                    
-                    # 4-2. 주소 (Regex - 테이블/리스트/엘리먼트에서 못 찾은 경우)
-                    if address == "정보 없음":
-                         try:
-                            all_plain_text = ""
-                            for frame in frames:
-                                try: all_plain_text += await frame.inner_text() + "\n"
-                                except: pass
-                            
-                            # 광역자치단체로 시작하는 주소 패턴
-                            addr_pattern = re.compile(r'((?:서울|경기|인천|부산|대구|광주|대전|울산|세종|강원|충북|충남|전북|전남|경북|경남|제주)[가-힣\s\d,.-]+(?:로|길|동|가|읍|면|리)\s*[\d-]+(?:[,]\s*[가-힣\d\s,.-]+)?)')
-                            match = addr_pattern.search(all_plain_text)
-                            if match:
-                                found_addr = match.group(0).strip()
-                                found_addr = re.sub(r'\s+', ' ', found_addr)
-                                
-                                # [필터링] 주소가 아닌 문장 걸러내기
-                                invalid_keywords = ["연봉", "급여", "월급", "일급", "시급", "채용", "모집", "근무", "우대", "경력", "만원", "찾아줘"]
-                                if not any(k in found_addr for k in invalid_keywords):
-                                    if len(found_addr) < 80:
-                                        address = found_addr
-                         except:
-                             pass
+                    # 필드 추출 (기본: 프레임당 evaluate 1회)
+                    fields = await extract_page_fields(dtl_page, DETAIL_EXTRACT_MODE, frame_stats, metrics)
 
                     # 데이터 병합
-                    job_basic.update({
-                        "industry": industry,
-                        "employees": employees,
-                        "fax": fax,
-                        "address": address
-                    })
-                    jobs.append(job_basic)
-                    
-                    print(f"  [수집 완료] {job_basic['title'][:15]}... | 주소: {address} | 팩스: {fax}")
+                    record_job(job_basic, fields)
 
                 except Exception as e:
                     print(f"  [상세 과정 오류] {e}")
+                    slot.failed(e)
+                    handle_failure(job_basic, detail_url, e, attempt)
                 finally:
-                    # 탭 닫기
-                    try: await dtl_page.close()
-                    except: pass
-
-        while scheduled_count < target_count:
-            print(f"\n--- {page_num}페이지 탐색 중 (수집 예정: {scheduled_count}, 완료: {len(jobs)}) ---")
-            
-            # 리스트 로딩 대기
+                    # 탭 닫기 (풀에서 빌린 탭은 반납)
+                    if pooled:
+                        await pages.release(dtl_page)
+                    else:
+                        try: await dtl_page.close()
+                        except: pass
+
+        # HTTP로 상세 HTML을 받아 수집 (탭 없이), 실패/JS 필요 시에만 탭으로 폴백
+        async def extract_detail_http(detail_url, job_basic, attempt=1):
+            # 같은 회사 공고를 다른 작업이 수집 중이면 기다렸다가 그 결과를 사용 (기업정보 수집 생략)
+            company = await companies.wait(job_basic.get("company"))
+            if company:
+                record_job(job_basic, company, from_cache=True, from_company=True)
+                return
+
+            async with limiter.slot() as slot:
+                with metrics.span("detail_http") as s:
+                    fields = await fetcher.fetch_fields(detail_url, on_error=slot.failed, metrics=metrics)
+                    if fields is None:
+                        s.fail()
+                if fields is not None:
+                    record_job(job_basic, fields)
+                    return
+
+            # 자바스크립트 렌더링이 필요한 페이지 → 풀에서 탭을 빌려 처리
+            dtl_page = None
             try:
-                await page.wait_for_selector('tr[id^="list"]', state="attached", timeout=5000)
-            except:
-                print("이 페이지에서 리스트 아이템을 찾을 수 없습니다.")
+                with metrics.span("tab_open"):
+                    dtl_page = await pages.acquire()
+                    await throttle.acquire()
+                    await dtl_page.goto(detail_url, wait_until="domcontentloaded")
+            except Exception as e:
+                print(f"  [상세 과정 오류] 탭 폴백 실패: {e}")
+                if dtl_page:
+                    await pages.release(dtl_page)
+                handle_failure(job_basic, detail_url, e, attempt)
+                return
+            await extract_detail(dtl_page, job_basic, pooled=True, detail_url=detail_url, attempt=attempt)
+
+        # Ctrl+클릭 방식일 때만 메인 탭을 해당 목록 페이지로 이동
+        async def show_list_page(page_num):
+            nonlocal shown_page
+            if shown_page == page_num:
+                return
+            await throttle.acquire()
+            await page.goto(list_page_url(page_num, list_params), wait_until="domcontentloaded")
+            await page.wait_for_selector(LIST_ROW_SELECTOR, state="attached", timeout=5000)
+            shown_page = page_num
+
+        # 이어하기: 지난 실행에서 끝나지 않은 상세 수집부터 다시 예약
+        for row in checkpoint.unfinished_rows():
+            if not row.get("detail_url"):
+                continue
+            checkpoint.mark_scheduled(row)
+            tasks.append(asyncio.create_task(extract_detail_http(row["detail_url"], job_basic_from_row(row))))
+
+        # 실패 공고 재수집: 공고 ID 유무와 관계없이 상세 URL로 예약 (URL이 없는 공고는 다시 수집할 방법이 없음)
+        for row in replay_rows:
+            if not row.get("detail_url"):
+                print(f"  [재수집 불가] 상세 URL 없음: {row.get('title', '')[:15]}")
+                continue
+            checkpoint.mark_scheduled(row)
+            tasks.append(asyncio.create_task(extract_detail_http(row["detail_url"], job_basic_from_row(row))))
+
+        # 분할 수집 경고용: 실제로 받은 목록 페이지 수 / 행 수
+        listed_pages = listed_rows = 0
+
+        # 실패 공고 재수집 모드는 목록을 보지 않음 (end_page=0)
+        async for page_num, list_rows in prefetcher.pages(checkpoint.page_num, 0 if replay_dead_letter else end_page):
+            if scheduled_count >= target_count:
                 break
-            
-            # 인덱스로 접근하여 순차 처리 (하나 찾고, 들어가고, 다음꺼 찾고..)
-            list_rows = page.locator('tr[id^="list"]')
-            count = await list_rows.count()
+            checkpoint.page_num = page_num
+            checkpoint.maybe_save()
+            metrics.maybe_export()
+            print(f"\n--- {page_num}페이지 탐색 중 (수집 예정: {scheduled_count}, 완료: {sink.count}) ---")
+
+            count = len(list_rows)
             print(f"이 페이지 목록 개수: {count}개")
+            listed_pages += 1
+            listed_rows += count
             
             if count == 0:
+                print("리스트의 끝이거나 목록을 불러오지 못했습니다.")
                 break
 
-            for i in range(count):
+            page_all_known = True
+            for row in list_rows:
                 if scheduled_count >= target_count:
                     break
                 
                 try:
-                    row = list_rows.nth(i)
-                    
-                    # --- 기본 정보 추출 (동기) ---
-                    # 제목
-                    title_el = row.locator('a.t3_sb') 
-                    if await title_el.count() == 0: title_el = row.locator('td.link a').first
-                    title = await title_el.text_content() if await title_el.count() > 0 else "N/A"
-                    title = title.strip()
-                    
-                    # 회사명
-                    company_el = row.locator('.cp_name')
-                    company = await company_el.text_content() if await company_el.count() > 0 else "N/A"
-                    company = company.strip()
-
-                    # 급여
-                    salary = "N/A"
-                    salary_el = row.locator('li.dollar span.item.b1_sb')
-                    s_count = await salary_el.count()
-                    if s_count > 0:
-                        salary_parts = []
-                        for si in range(s_count):
-                            t = await salary_el.nth(si).text_content()
-                            if t: salary_parts.append(t.strip())
-                        salary = " / ".join(salary_parts)
-                        salary = re.sub(r'\s+', ' ', salary).strip()
-
-                    # 지역
-                    location = "N/A"
-                    loc_el_p = row.locator('li.site p')
-                    if await loc_el_p.count() > 0: location = await loc_el_p.text_content()
-                    else:
-                        loc_el = row.locator('li.site')
-                        if await loc_el.count() > 0: location = await loc_el.text_content()
-                    location = location.strip()
+                    # --- 목록이 밀려 다시 보인 공고는 건너뜀 (탭 열기/HTTP 요청 전) ---
+                    # 이번 실행에서 이미 예약한 공고는 '이전 실행에서 본 공고'인지 알 수 없으므로
+                    # 증분 모드의 멈춤 판단(page_all_known)에서 빼고 건너뜀 (이어하기 첫 페이지에서 멈추지 않게)
+                    key = row_key(row)
+                    dup = dedupe.status(key)
+                    if dup == "duplicate":
+                        page_all_known = False
+                        continue
+
+                    # --- 이어하기: 이미 예약했던 공고는 건너뜀 ---
+                    if checkpoint.is_scheduled(row["posting_id"]):
+                        page_all_known = False
+                        continue
+
+                    # 이전 실행에서 예약한 공고 (이어하기 대상이 아니면 이미 본 공고로 셈)
+                    if dup == "known":
+                        continue
+
+                    # --- 증분 모드: 이전에 본 그대로인 공고는 건너뜀 ---
+                    if seen:
+                        if seen.status(row["posting_id"], row_fingerprint(row)) == "known":
+                            known_skipped += 1
+                            continue
+                        page_all_known = False
 
-                    # 근무시간
-                    time_el = row.locator('li.time')
-                    time_info = await time_el.text_content() if await time_el.count() > 0 else "N/A"
-                    time_info = time_info.strip()
+                    # --- 분할 수집: 다른 워커가 이미 가져간 공고는 건너뜀 ---
+                    if claims and not claims.claim(row["posting_id"]):
+                        continue
 
                     # 기본 데이터 패키징
-                    job_basic = {
-                        "title": title,
-                        "company": company,
-                        "salary": salary,
-                        "location": location,
-                        "schedule": time_info
-                    }
+                    job_basic = job_basic_from_row(row)
+                    title = job_basic["title"]
+
+                    # --- 캐시 적중 시 상세 수집 생략 ---
+                    cached = cache.get(row["posting_id"]) if cache else None
+                    if cached:
+                        checkpoint.mark_scheduled(row)
+                        dedupe.mark(key)
+                        record_job(job_basic, cached, from_cache=True)
+                        scheduled_count += 1
+                        continue
+
+                    # --- 같은 회사 정보가 이미 있으면 상세 수집(기업정보 탭/정규식 포함) 생략 ---
+                    company = companies.get(row["company"])
+                    if company:
+                        checkpoint.mark_scheduled(row)
+                        dedupe.mark(key)
+                        record_job(job_basic, company, from_cache=True, from_company=True)
+                        scheduled_count += 1
+                        continue
+
+                    # --- HTTP 우선 수집 (탭 없이) ---
+                    if FETCH_BACKEND == "http" and row["detail_url"]:
+                        checkpoint.mark_scheduled(row)
+                        dedupe.mark(key)
+                        task = asyncio.create_task(extract_detail_http(row["detail_url"], job_basic))
+                        tasks.append(task)
+                        scheduled_count += 1
+                        print(f"  [작업 예약] {title[:10]}... (HTTP)")
+                        continue
 
                     # --- 상세 페이지 탭 열기 (직렬) ---
                     # 탭 열기는 순차적으로 해야 안전하게 핸들링 가능
                     detail_page = None
                     try:
-                        async with context.expect_page(timeout=5000) as new_page_info:
-                            await title_el.click(modifiers=["Control"])
-                        detail_page = await new_page_info.value
+                        await show_list_page(page_num)
+                        title_el = row_title_locator(page, row)
+                        await throttle.acquire()
+                        with metrics.span("tab_open"):
+                            async with context.expect_page(timeout=5000) as new_page_info:
+                                await title_el.click(modifiers=["Control"])
+                            detail_page = await new_page_info.value
                     except:
                         print(f"  [Skip] 클릭 실패 또는 탭 안 열림: {title}")
+                        checkpoint.mark_scheduled(row)
+                        dedupe.mark(key)
+                        handle_failure(job_basic, row["detail_url"], "탭 열기 실패", 1)
                         continue
                     
                     if detail_page:
+                        checkpoint.mark_scheduled(row)
+                        dedupe.mark(key)
                         # [병렬 처리 핵심] 태스크 생성 후 백그라운드로 넘김
-                        # extract_detail 함수가 알아서 수집하고 jobs에 넣고 탭을 닫음
-                        task = asyncio.create_task(extract_detail(detail_page, job_basic))
+                        # extract_detail 함수가 알아서 수집하고 결과 파일에 기록한 뒤 탭을 닫음
+                        task = asyncio.create_task(extract_detail(detail_page, job_basic, detail_url=row["detail_url"]))
                         tasks.append(task)
                         scheduled_count += 1
                         print(f"  [작업 예약] {title[:10]}... (탭 오픈)")
-
-                        # 탭 오픈 간격 (빠른 처리)
-                        await asyncio.sleep(random.uniform(0.4, 0.8))
                     
                 except Exception as e:
                     print(f"행 처리 중 오류: {e}")
@@ -448,69 +566,222 @@ async def run():
                 print("목표 수집 개수만큼 예약을 완료했습니다.")
                 break
 
-            # 다음 페이지 이동
-            next_button = page.locator('.btn_page.next')
-            if await next_button.count() > 0:
-                print(">> 다음 페이지로 이동...")
-                await next_button.click()
-                try: await page.wait_for_load_state("networkidle", timeout=5000)
-                except: pass
-                await asyncio.sleep(2) 
-                page_num += 1
-            else:
-                print("다음 버튼이 없거나 리스트의 끝입니다.")
+            # 증분 모드: 한 페이지 전체가 이미 본 공고면 이후 페이지도 이전에 수집된 것
+            if seen and page_all_known:
+                print("이 페이지의 공고를 모두 이전에 수집했습니다. 증분 수집을 마칩니다.")
+                print("  (최신순 정렬 파라미터 SORT_NEWEST는 사이트에서 확인하지 않은 값입니다. 새 공고가 빠졌다면 정렬을 확인하세요)")
                 break
+        prefetcher.cancel()
+
+        # 분할 수집: 페이지 범위는 페이지당 LIST_PAGE_SIZE건(resultCnt)을 가정하고 나눔
+        # 사이트가 더 적게 주면 맡은 범위를 다 봐도 목표에 못 미치므로 알림 (--workers 1 이나 목표를 늘려 다시 실행)
+        if end_page is not None and not delta and not replay_dead_letter and scheduled_count < target_count:
+            per_page = listed_rows / listed_pages if listed_pages else 0
+            print(f"[분할 경고] {start_page}~{end_page}페이지에서 목표 {target_count}건 중 {scheduled_count}건만 예약했습니다. "
+                  f"(페이지당 평균 {per_page:.0f}건, 가정 {LIST_PAGE_SIZE}건 / 다른 워커와 겹쳐 건너뜀 {claims.duplicates if claims else 0}건)")
+            log_error(f"[분할 경고] {start_page}~{end_page}페이지: {scheduled_count}/{target_count}건, 페이지당 평균 {per_page:.0f}건")
         
         # 모든 상세 페이지 작업이 완료될 때까지 대기
         print("\n모든 상세 페이지 수집 작업이 완료되기를 기다리는 중...")
-        await asyncio.gather(*tasks)
+        # 작업 하나의 예외로 결과 저장/체크포인트/내보내기까지 건너뛰지 않도록 예외는 모아서 버림
+        await asyncio.gather(*tasks, return_exceptions=True)
         
         # [중요] 진행 중인 모든 백그라운드 태스크가 끝날 때까지 대기
         if tasks:
             print(f"\n남은 {len([t for t in tasks if not t.done()])}개의 상세 수집 작업을 기다리는 중...")
             await asyncio.gather(*tasks, return_exceptions=True)
 
-        # 파일 저장
-        print(f"\n수집 완료: 총 {len(jobs)} 건.")
-        df = pd.DataFrame(jobs)
-        
-        # 컬럼명 한글로 변경
-        df.rename(columns={
-            "title": "채용공고명",
-            "company": "업체명",
-            "industry": "업종",
-            "employees": "인원수",
-            "fax": "팩스번호",
-            "address": "주소",
-            "salary": "급여",
-            "location": "지역",
-            "schedule": "근무시간"
-        }, inplace=True)
-
-        print("데이터 정제 중...")
-        for col in df.columns:
-            df[col] = df[col].apply(clean_text)
+        # 백오프 대기 중인 재시도까지 마무리
+        await retries.drain()
+
+        print(f"\n[목록 페이지] HTTP: {prefetcher.http_pages}페이지 / 브라우저: {prefetcher.browser_pages}페이지")
+        print(f"[상세 수집 방식] HTTP: {fetcher.http_count}건 / 탭 폴백: {fetcher.fallback_count}건")
+        print(f"[동시성] {limiter.summary()}")
+        print(f"[요청 속도] {throttle.summary()}")
+        print(f"[요청 차단] {intercept.summary()}")
+        print(f"[탭 풀] {pages.summary()}")
+        print(f"[재시도] {retries.summary()}")
+        for line in waits.summary_lines():
+            print(f"[대기] {line}")
+        print(f"[프레임] {frame_stats.summary()}")
+        for line in metrics.summary_lines():
+            print(f"[단계] {line}")
+        if cache:
+            print(f"[캐시] 적중: {cache.hits}건 / 미적중: {cache.misses}건")
+            cache.close()
+        if seen:
+            print(f"[증분] 이미 본 공고 건너뜀: {known_skipped}건 / 새로 수집: {sink.count}건")
+            seen.close()
+        if claims:
+            print(f"[분할] 다른 워커와 겹친 공고 건너뜀: {claims.duplicates}건 / 이전 실행에서 선점한 공고 다시 수집: {claims.reclaimed}건")
+            claims.close()
+        print(f"[중복] 목록에서 다시 보인 공고 건너뜀: {dedupe.duplicates}건 / 이전 실행에서 예약한 공고 건너뜀: {dedupe.known}건")
+        dedupe.close()
+        print(f"[회사 캐시] {companies.summary()}")
+        companies.close()
+
+        # 체크포인트 정리: 실패가 남아 있으면 저장해 두고 --resume 으로 재시도 가능
+        if checkpoint.failed and checkpoint.path:
+            checkpoint.save()
+            print(f"[체크포인트] 실패 {len(checkpoint.failed)}건이 남아 있습니다. --resume 또는 --replay-dead-letter 로 다시 시도할 수 있습니다.")
+        else:
+            checkpoint.clear()
+
+        # 파일 저장 (JSONL → 엑셀)
+        sink.close()
+        print(f"\n수집 완료: 총 {sink.count} 건. (원본: {results_path})")
+
+        if export:
+            save_results(results_path, formats, partition_by, metrics)
+        metrics.export()
+        if metrics_path:
+            print(f"[단계별 시간] {metrics_path} / {metrics.prom_path}")
+
+        await pages.close()
+        await browser.close()
 
+def save_excel(jsonl_path, metrics=None):
+    """JSONL 결과 → 엑셀 (파일이 열려 있으면 백업 파일로 저장)"""
+    print("엑셀 변환 중...")
+    try:
+        with span(metrics, "excel_save"):
+            export_excel(jsonl_path, RESULTS_XLSX)
+        print(f"\n결과를 {RESULTS_XLSX} 파일로 저장했습니다.")
+    except PermissionError:
+         print("\n[중요] 엑셀 파일이 열려있어서 저장에 실패했습니다. 파일을 닫고 다시 실행해주세요.")
+         try:
+             export_excel(jsonl_path, 'worknet_results_backup.xlsx')
+             print("대신 worknet_results_backup.xlsx 파일로 저장했습니다.")
+         except:
+             pass
+
+def save_results(jsonl_path, formats=EXPORT_FORMATS, partition_by=EXPORT_PARTITION_BY, metrics=None):
+    """
+    JSONL 결과를 formats 형식마다 내보냄 (xlsx는 save_excel, 나머지는 타입 있는 컬럼 형식)
+    partition_by가 있으면 parquet/feather/csv는 폴더로 나눠 저장 (엑셀은 항상 한 파일)
+    """
+    for fmt in formats:
+        if fmt == "xlsx":
+            save_excel(jsonl_path, metrics)
+            continue
+        out_path = default_export_path(RESULTS_EXPORT_BASE, fmt, bool(partition_by))
+        print(f"{fmt} 내보내는 중...")
         try:
-            df.to_excel('worknet_results.xlsx', index=False, engine='openpyxl')
-            print(f"\n결과를 worknet_results.xlsx 파일로 저장했습니다.")
-        except PermissionError:
-             print("\n[중요] 엑셀 파일이 열려있어서 저장에 실패했습니다. 파일을 닫고 다시 실행해주세요.")
-             try:
-                 df.to_excel('worknet_results_backup.xlsx', index=False, engine='openpyxl')
-                 print("대신 worknet_results_backup.xlsx 파일로 저장했습니다.")
-             except:
-                 pass
+            with span(metrics, "export_" + fmt):
+                rows = export_results(jsonl_path, fmt, out_path, partition_by)
+            print(f"결과 {rows}건을 {out_path} 에 저장했습니다.")
+        except Exception as e:
+            print(f"[{fmt} 내보내기 실패] {e}")
 
-        await browser.close()
+def _shard_worker(shard_no, kwargs):
+    """워커 프로세스 진입점 (프로세스마다 자체 이벤트 루프와 브라우저)"""
+    print(f"[워커 {shard_no}] 시작: {kwargs['start_page']}~{kwargs['end_page']}페이지, 목표 {kwargs['target_count']}건")
+    try:
+        asyncio.run(run(**kwargs))
+    except Exception:
+        log_error(f"[워커 {shard_no}] {traceback.format_exc()}")
+        raise
+
+def run_sharded(target_count=100, workers=2, delta=False, resume=False, headless=False,
+                formats=EXPORT_FORMATS, partition_by=EXPORT_PARTITION_BY):
+    """
+    목록 페이지 범위를 workers개로 나눠 프로세스별로 수집한 뒤 결과를 하나로 합칩니다.
+    워커는 공고 ID 선점 기록을 함께 써서 같은 공고를 두 번 수집하지 않습니다.
+    """
+    shards = plan_shards(target_count, workers)
+    print(f"[분할 수집] 워커 {len(shards)}개: " + ", ".join(f"{s}~{e}p({c}건)" for s, e, c in shards))
+
+    # 새로 시작할 때만 선점 기록 초기화 (이어하기는 지난 선점을 유지)
+    if not resume:
+        for suffix in ("", "-wal", "-shm"):
+            try: os.remove(CLAIMS_PATH + suffix)
+            except OSError: pass
+
+    processes = []
+    shard_paths = []
+    for i, (start_page, end_page, count) in enumerate(shards):
+        results_path = SHARD_RESULTS_JSONL.format(i)
+        shard_paths.append(results_path)
+        kwargs = {
+            "target_count": count,
+            "delta": delta,
+            "resume": resume,
+            "start_page": start_page,
+            "end_page": end_page,
+            "results_path": results_path,
+            "checkpoint_path": SHARD_CHECKPOINT_PATH.format(i),
+            "claims_path": CLAIMS_PATH,
+            # 같은 --workers 값으로 이어하면 같은 페이지 범위를 같은 번호가 맡음
+            "claims_owner": str(i),
+            "export": False,
+            "request_rate": REQUESTS_PER_SEC / len(shards),
+            "headless": headless,
+            "dead_letter_path": SHARD_DEAD_LETTER_PATH.format(i),
+            "metrics_path": SHARD_METRICS_PATH.format(i),
+        }
+        proc = multiprocessing.Process(target=_shard_worker, args=(i, kwargs), name=f"worknet-shard-{i}")
+        proc.start()
+        processes.append(proc)
+
+    for i, proc in enumerate(processes):
+        proc.join()
+        if proc.exitcode != 0:
+            print(f"[분할 수집] 워커 {i}가 비정상 종료되었습니다 (코드 {proc.exitcode}). --resume 으로 이어서 수집할 수 있습니다.")
+
+    # 워커별 실패 보관 파일을 하나로 합침 (--replay-dead-letter 는 DEAD_LETTER_PATH만 읽음)
+    for i in range(len(shards)):
+        path = SHARD_DEAD_LETTER_PATH.format(i)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as src, open(DEAD_LETTER_PATH, "a", encoding="utf-8") as dst:
+            dst.write(src.read())
+        os.remove(path)
+
+    total = merge_results(shard_paths, RESULTS_JSONL)
+    print(f"\n[분할 수집] 워커 결과 병합: 총 {total} 건 (원본: {RESULTS_JSONL})")
+    save_results(RESULTS_JSONL, formats, partition_by)
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 워커 프로세스를 띄울 때 필요
+    multiprocessing.freeze_support()
     try:
         # 윈도우 실행 파일 디버깅을 위한 로그 파일 생성
         with open("debug_start_check.txt", "w", encoding="utf-8") as f:
             f.write("프로그램 시작...\n")
         
-        asyncio.run(run())
+        parser = argparse.ArgumentParser(description="Worknet 채용공고 크롤러")
+        parser.add_argument("--count", type=int, default=100, help="수집할 공고 수 (기본 100)")
+        parser.add_argument("--delta", action="store_true", help="이전 실행 이후 새로 올라오거나 바뀐 공고만 수집 (최신순 정렬 파라미터는 미확인, worknet_listing.SORT_NEWEST 참고)")
+        parser.add_argument("--resume", action="store_true", help="마지막 체크포인트부터 이어서 수집")
+        parser.add_argument("--workers", type=int, default=1, help="목록 페이지를 나눠 맡을 프로세스 수 (기본 1)")
+        parser.add_argument("--headless", action="store_true", help="브라우저 창을 띄우지 않고 실행")
+        parser.add_argument("--replay-dead-letter", action="store_true", help="목록은 보지 않고 실패 보관 파일(--dead-letter-path)의 공고만 다시 수집")
+        parser.add_argument("--dead-letter-path", default=DEAD_LETTER_PATH,
+                            help=f"실패 보관 파일 (기본 {DEAD_LETTER_PATH}, GUI 실패 공고는 worknet_dead_letter_gui.jsonl)")
+        parser.add_argument("--format", default=",".join(EXPORT_FORMATS),
+                            help=f"내보낼 형식, 쉼표로 구분 ({', '.join(AVAILABLE_FORMATS)}, 기본 {','.join(EXPORT_FORMATS)})")
+        parser.add_argument("--partition-by", default=",".join(EXPORT_PARTITION_BY),
+                            help=f"parquet/feather/csv를 폴더로 나눌 컬럼, 쉼표로 구분 ({', '.join(PARTITION_COLUMNS)})")
+        args = parser.parse_args()
+
+        formats = tuple(f.strip() for f in args.format.split(",") if f.strip())
+        partition_by = tuple(c.strip() for c in args.partition_by.split(",") if c.strip())
+        for fmt in formats:
+            if fmt not in AVAILABLE_FORMATS:
+                parser.error(f"지원하지 않는 형식: {fmt}")
+        for column in partition_by:
+            if column not in PARTITION_COLUMNS:
+                parser.error(f"나눌 수 없는 컬럼: {column}")
+        exports = {"formats": formats, "partition_by": partition_by}
+
+        if args.replay_dead_letter:
+            asyncio.run(run(delta=args.delta, headless=args.headless, replay_dead_letter=True,
+                            dead_letter_path=args.dead_letter_path, **exports))
+        elif args.workers > 1:
+            run_sharded(target_count=args.count, workers=args.workers, delta=args.delta, resume=args.resume, headless=args.headless, **exports)
+        else:
+            asyncio.run(run(target_count=args.count, delta=args.delta, resume=args.resume, headless=args.headless,
+                            dead_letter_path=args.dead_letter_path, **exports))
         
         # 정상 종료 시
         input("\n프로그램이 종료되었습니다. 엔터를 누르면 창이 닫힙니다.")
@@ -5,10 +5,21 @@ import asyncio
 import threading
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import re
-import pandas as pd
 from playwright.async_api import async_playwright
 import traceback
+from worknet_fetch import LIST_URL, HttpDetailFetcher
+from worknet_listing import ListPrefetcher, job_basic_from_row, row_title_locator, row_fingerprint, row_key, list_page_url, LIST_ROW_SELECTOR, SORT_NEWEST
+from worknet_extract import extract_page_fields, FrameStats
+from worknet_cache import DetailCache, SeenStore, PostingDedupe, CompanyCache, DEFAULT_CACHE_PATH, DEFAULT_COMPANY_TTL_DAYS
+from worknet_sink import ResultSink, export_excel
+from worknet_export import export_results, default_export_path
+from worknet_checkpoint import Checkpoint
+from worknet_concurrency import AdaptiveConcurrency, TokenBucket
+from worknet_intercept import InterceptPolicy
+from worknet_pool import PagePool
+from worknet_metrics import Metrics, span
+from worknet_retry import RetryQueue
+from worknet_waits import WaitStats, wait_for_fields, settle_after, DETAIL_LOAD_TIMEOUT, FIELDS_READY_TIMEOUT, CORP_TAB_TIMEOUT
 
 # ========================================================
 # 1. 브라우저 경로 찾기 및 환경 설정 (다중 OS 지원)
@@ -57,373 +68,543 @@ def find_chromium_executable(log_func=print):
     except:
         return None
 
-def clean_text(text):
-    if not isinstance(text, str):
-        return str(text)
-    text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]', '', text)
-    if len(text) > 32000:
-        text = text[:32000] + "..."
-    return text
+RESULTS_JSONL = "worknet_results_gui.jsonl"
+RESULTS_XLSX = "worknet_results_gui.xlsx"
+# 엑셀과 함께 내보낼 분석용 형식 ("parquet", "feather", "csv") / 폴더로 나눌 컬럼 ("run_date", "region")
+EXTRA_EXPORT_FORMATS = ()
+EXPORT_PARTITION_BY = ()
+RESULTS_EXPORT_BASE = "worknet_results_gui"
+CHECKPOINT_PATH = "worknet_checkpoint_gui.json"
+# 목록 단계 중복 제거 기록 (None: 이번 실행만 / 경로: DEDUPE_TTL_DAYS일 동안 다음 실행에서도 건너뜀)
+DEDUPE_PATH = None
+DEDUPE_TTL_DAYS = 1
+LIST_PREFETCH = 3
+# 상세 수집 동시 작업 수 (시작, 최소, 최대) - 실행 중 자동 조절
+CONCURRENCY = (10, 2, 24)
+# 사이트 요청 속도 제한 (초당 요청 수, 순간 최대치) - 목록/상세/기업정보 탭 이동 모두 포함
+REQUEST_RATE = (5.0, 10)
+# 탭 폴백/브라우저 목록 읽기에 재사용할 탭 수
+PAGE_POOL_SIZE = 6
+# 실패한 상세 수집 재시도 (최대 시도 횟수, 첫 대기 초, 실행 전체 재시도 예산) / 최종 실패 보관 파일
+RETRY_POLICY = (3, 2.0)
+RETRY_BUDGET = 200
+# 재수집: python worknet_crawler_fixed.py --replay-dead-letter --dead-letter-path worknet_dead_letter_gui.jsonl
+DEAD_LETTER_PATH = "worknet_dead_letter_gui.jsonl"
+# 단계별 소요 시간 기록 (JSON + .prom, 단계 이름은 CLI와 같음) / 실행 중 기록 간격(초)
+METRICS_PATH = "worknet_metrics_gui.json"
+METRICS_INTERVAL = 30
 
 # ========================================================
 # 2. 크롤링 핵심 로직 (GUI 연동용으로 수정)
 # ========================================================
 class CrawlerLogic:
-    def __init__(self, log_callback, progress_callback=None):
+    def __init__(self, log_callback, progress_callback=None, fetch_backend="http", extract_mode="inpage",
+                 cache_path=DEFAULT_CACHE_PATH, cache_ttl_days=7):
         self.log = log_callback
         self.progress = progress_callback
         self.stop_requested = False
-
-    async def get_total_count(self):
-        """전체 공고 개수만 빠르게 가져오는 함수"""
-        # exec_path = find_chromium_executable(self.log) # 제거: 시스템 크롬 사용
-        
-        async with async_playwright() as p:
-            try:
-                browser = await p.chromium.launch(
-                    channel="chrome", # Google Chrome 사용
-                    headless=True,
-                    args=["--disable-blink-features=AutomationControlled"]
-                )
-                page = await browser.new_page()
-                url = "https://www.work24.go.kr/wk/a/b/1200/retriveDtlEmpSrchList.do"
-                await page.goto(url, wait_until="domcontentloaded")
-                
-                # <span class="txt_total">117,217</span>
-                el = page.locator("span.txt_total")
-                if await el.count() > 0:
-                    text = await el.inner_text() # "117,217"
-                    text = text.replace(",", "").strip()
-                    return int(text)
-                else:
-                    return 0
-            except Exception as e:
-                self.log(f"[오류] 개수 확인 실패 (구글 크롬이 설치되어 있어야 합니다): {e}")
-                return None
-            finally:
-                try: await browser.close()
-                except: pass
-
-    async def run_crawl(self, target_count):
-        """메인 크롤링 실행"""
-        self.log(f"=== 수집 시작 (목표: {target_count}건) ===")
-        self.log(f"> 시스템에 설치된 'Google Chrome'을 사용하여 실행합니다.")
-        
-        async with async_playwright() as p:
-            try:
-                browser = await p.chromium.launch(
-                    channel="chrome", # Google Chrome 사용
-                    headless=False,
-                    args=["--disable-blink-features=AutomationControlled"]
-                )
-            except Exception as e:
-                self.log(f"[치명적 오류] 구글 크롬(Chrome)을 실행할 수 없습니다.\n컴퓨터에 크롬이 설치되어 있는지 확인해주세요.\n{e}")
-                return
-            
-            context = await browser.new_context(
+        # "http": HTTP 우선 + 필요 시 탭 폴백 / "browser": 모든 공고를 탭으로
+        self.fetch_backend = fetch_backend
+        # "inpage": 프레임당 스크립트 1회로 필드 추출 / "locator": 기존 로케이터 체인
+        self.extract_mode = extract_mode
+        # 상세 수집 결과 캐시 (None이면 사용 안 함)
+        self.cache_path = cache_path
+        self.cache_ttl_days = cache_ttl_days
+        # 백그라운드 루프가 계속 들고 있는 브라우저 (개수 조회/반복 수집에 재사용, 실패 시에만 재실행)
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.intercept = None
+        # True면 브라우저 창 없이 실행 (다음 실행 때 모드가 바뀌었으면 브라우저를 다시 띄움)
+        self.headless = False
+        self._browser_headless = None
+        # 브라우저 실행/재실행/종료를 한 번에 하나씩 (개수 조회 중 수집 시작을 눌러도 같은 실행을 기다림)
+        self._browser_lock = None
+        # 실행할 브라우저 채널 ("chrome": 설치된 Google Chrome / None: Playwright 기본 Chromium, 벤치마크용)
+        self.browser_channel = "chrome"
+
+    def _lock(self):
+        # 백그라운드 루프 안에서 처음 쓸 때 만듦
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        return self._browser_lock
+
+    async def ensure_browser(self, background=False):
+        """
+        살아 있는 브라우저 컨텍스트를 돌려줌 (없거나 연결이 끊겼거나 창 모드가 바뀌었으면 새로 실행)
+        background=True: 개수 조회처럼 화면이 필요 없는 용도. 떠 있는 브라우저는 창 모드와 상관없이 쓰고,
+        없으면 창 없이 실행 (수집을 시작하기 전에 크롬 창이 뜨지 않게)
+        """
+        async with self._lock():
+            return await self._ensure_browser(background)
+
+    async def _ensure_browser(self, background=False):
+        alive = self.context and self.browser and self.browser.is_connected()
+        if alive and (background or self._browser_headless == self.headless):
+            return self.context
+        await self._close_browser()
+
+        headless = True if background else self.headless
+        if not background:
+            self.log(f"> 시스템에 설치된 'Google Chrome'을 실행합니다.{' (창 숨김)' if headless else ''}")
+        self.playwright = await async_playwright().start()
+        try:
+            self.browser = await self.playwright.chromium.launch(
+                channel=self.browser_channel, # 기본: Google Chrome 사용
+                headless=headless,
+                args=["--disable-blink-features=AutomationControlled"]
+            )
+            context = await self.browser.new_context(
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) ...",
                 viewport={'width': 1600, 'height': 900}
             )
             await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            await context.route("**/*.{png,jpg,jpeg,gif,webp,svg,woff,woff2,ttf,eot}", lambda route: route.abort())
+            self.intercept = InterceptPolicy()
+            await self.intercept.install(context)
+        except Exception:
+            await self._close_browser()
+            raise
+        self.context = context
+        self._browser_headless = headless
+        return context
+
+    async def close_browser(self, context=None):
+        """
+        브라우저와 Playwright 종료 (프로그램 종료 시, 또는 오류 후 다음 실행에서 새로 띄우기 위해)
+        context를 주면 그 컨텍스트가 아직 현재 브라우저일 때만 종료 (그사이 다시 띄운 브라우저는 유지)
+        """
+        async with self._lock():
+            if context is None or context is self.context:
+                await self._close_browser()
+
+    async def _close_browser(self):
+        self.context = None
+        if self.browser:
+            try: await self.browser.close()
+            except: pass
+            self.browser = None
+        if self.playwright:
+            try: await self.playwright.stop()
+            except: pass
+            self.playwright = None
+
+    async def get_total_count(self):
+        """
+        전체 공고 개수만 빠르게 가져오는 함수
+        (브라우저가 없으면 창 없이 띄움, 수집 시작 때 '창 숨김'도 선택했다면 그대로 재사용)
+        """
+        page = None
+        context = None
+        try:
+            context = await self.ensure_browser(background=True)
+            page = await context.new_page()
+            url = LIST_URL
+            await page.goto(url, wait_until="domcontentloaded")
+            
+            # <span class="txt_total">117,217</span>
+            el = page.locator("span.txt_total")
+            if await el.count() > 0:
+                text = await el.inner_text() # "117,217"
+                text = text.replace(",", "").strip()
+                return int(text)
+            else:
+                return 0
+        except Exception as e:
+            self.log(f"[오류] 개수 확인 실패 (구글 크롬이 설치되어 있어야 합니다): {e}")
+            # 실행 실패는 ensure_browser가 이미 정리함, 실행한 브라우저에서 난 오류만 닫음
+            if context:
+                await self.close_browser(context)
+            return None
+        finally:
+            if page:
+                try: await page.close()
+                except: pass
+
+    async def run_crawl(self, target_count, delta=False, resume=False):
+        """
+        메인 크롤링 실행
+        delta=True: 이전에 본 공고는 건너뛰고 새/변경 공고만
+        resume=True: 마지막 체크포인트의 페이지부터 이어서 (미완료 공고 재예약)
+        """
+        checkpoint = Checkpoint.load(CHECKPOINT_PATH) if resume else None
+        resuming = checkpoint is not None
+        if resume and not resuming:
+            self.log("저장된 체크포인트가 없어 처음부터 수집합니다.")
+        if resuming:
+            target_count = checkpoint.target_count or target_count
+            delta = checkpoint.delta
+            # 마지막 체크포인트 저장 뒤 결과 파일에 기록된 공고는 다시 예약하지 않음
+            restored = checkpoint.restore_finished(RESULTS_JSONL)
+            if restored:
+                self.log(f"[이어하기] 결과 파일에 이미 있는 공고 {restored}건을 완료로 처리")
+            self.log(f"[이어하기] {checkpoint.page_num}페이지부터 재개 (완료 {len(checkpoint.finished)}건, 미완료 {len(checkpoint.unfinished_rows())}건)")
+        else:
+            checkpoint = Checkpoint(CHECKPOINT_PATH, target_count, delta)
+
+        self.log(f"=== 수집 시작 (목표: {target_count}건{', 증분 모드' if delta else ''}) ===")
 
+        # 이미 떠 있는 브라우저를 재사용 (첫 실행이거나 이전에 실패했으면 새로 실행)
+        try:
+            context = await self.ensure_browser()
+        except Exception as e:
+            self.log(f"[치명적 오류] 구글 크롬(Chrome)을 실행할 수 없습니다.\n컴퓨터에 크롬이 설치되어 있는지 확인해주세요.\n{e}")
+            return
+        intercept = self.intercept
+        intercept.reset()
+
+        # 오류로 중간에 빠져나가도 finally에서 정리할 자원 (결과 파일, SQLite 연결, 탭)
+        page = sink = pages = prefetcher = retries = cache = seen = dedupe = companies = None
+        tasks = []
+        completed = broken = False
+        try:
             page = await context.new_page()
-            url = "https://www.work24.go.kr/wk/a/b/1200/retriveDtlEmpSrchList.do"
+            throttle = TokenBucket(*REQUEST_RATE)
+            waits = WaitStats()
+            frame_stats = FrameStats()
+            metrics = Metrics(METRICS_PATH, METRICS_INTERVAL)
+            fetcher = HttpDetailFetcher(context, throttle=throttle)
+            list_params = SORT_NEWEST if delta else None
+            url = list_page_url(checkpoint.page_num, list_params)
             try:
+                await throttle.acquire()
                 await page.goto(url, wait_until="networkidle")
             except:
+                await throttle.acquire()
                 await page.goto(url)
 
-            jobs = []
-            page_num = 1
-            scheduled_count = 0
+            # 완료된 공고는 즉시 JSONL 파일에 추가 (메모리에 쌓지 않음)
+            sink = ResultSink(RESULTS_JSONL, append=resuming)
+            checkpoint.on_save = sink.flush
+            # 목록 페이지는 URL로 직접 받고 다음 페이지들을 미리 받아 둠
+            pages = PagePool(context, PAGE_POOL_SIZE)
+            prefetcher = ListPrefetcher(context, list_params, ahead=LIST_PREFETCH, log=self.log, throttle=throttle, pages=pages, metrics=metrics)
+            shown_page = checkpoint.page_num
+            scheduled_count = len(checkpoint.scheduled)
             
-            sem = asyncio.Semaphore(10) # 탭 10개 제한
-            tasks = []
+            limiter = AdaptiveConcurrency(*CONCURRENCY, log=self.log) # 10개에서 시작해 자동 조절
+            # 캐시 연결은 크롤링이 도는 이벤트 루프 스레드에서 생성
+            cache = DetailCache(self.cache_path, self.cache_ttl_days) if self.cache_path else None
+            # 회사 단위 캐시 (같은 회사의 다른 공고는 상세 수집 생략, cache_path가 없으면 이번 실행만)
+            companies = CompanyCache(self.cache_path, DEFAULT_COMPANY_TTL_DAYS)
+            seen = SeenStore(self.cache_path or DEFAULT_CACHE_PATH) if delta else None
+            known_skipped = 0
+            dedupe = PostingDedupe(DEDUPE_PATH, DEDUPE_TTL_DAYS)
+            retries = RetryQueue(*RETRY_POLICY, budget=RETRY_BUDGET, dead_letter_path=DEAD_LETTER_PATH, log=self.log)
+
+            # 실패 처리: 백오프 뒤 재시도, 횟수/예산을 넘으면 실패 보관 파일 + 체크포인트 실패
+            def handle_failure(job_basic, detail_url, error, attempt):
+                companies.release(job_basic.get("company"))
+                row = dict(job_basic, detail_url=detail_url)
+                if detail_url:
+                    retry = lambda next_attempt: extract_detail_http(detail_url, job_basic, next_attempt)
+                    if retries.submit(attempt, retry, row, error):
+                        return
+                else:
+                    retries.dead_letter(row, error, attempt, "상세 URL 없음")
+                checkpoint.mark_failed(job_basic.get("posting_id"), error)
 
             # 상세 수집 함수
-            async def extract_detail(dtl_page, job_basic):
-                async with sem:
+            async def extract_detail(dtl_page, job_basic, pooled=False, detail_url=None, attempt=1):
+                async with limiter.slot() as slot:
                     try:
-                        await dtl_page.wait_for_load_state("domcontentloaded")
-                        await asyncio.sleep(0.3)
+                        # 고정 대기 대신 DOM 준비 → 필드 라벨 등장까지 대기 (각각 타임아웃)
+                        with metrics.span("detail_load") as s:
+                            if not await waits.run("detail_dom", dtl_page.wait_for_load_state("domcontentloaded", timeout=DETAIL_LOAD_TIMEOUT)):
+                                raise RuntimeError(f"상세 페이지 로딩 {DETAIL_LOAD_TIMEOUT}ms 초과")
+                            if not await waits.run("detail_fields", wait_for_fields(dtl_page, FIELDS_READY_TIMEOUT)):
+                                s.fail()
 
                         # 기업정보 탭 클릭 시도
                         try:
                             corp_tab = dtl_page.locator("a:has-text('기업정보'), button:has-text('기업정보')").first
                             if await corp_tab.count() > 0 and await corp_tab.is_visible():
-                                await corp_tab.click()
-                                await asyncio.sleep(0.5)
+                                with metrics.span("corp_tab") as s:
+                                    await throttle.acquire()
+                                    # 라벨은 이미 붙어 있으므로 클릭이 일으킨 요청/DOM 변경이 끝날 때까지 대기
+                                    async with settle_after(dtl_page) as settled:
+                                        await corp_tab.click()
+                                        if not await waits.run("corp_tab", settled.wait(CORP_TAB_TIMEOUT)):
+                                            s.fail()
                         except: pass
 
-                        industry = "정보 없음"
-                        employees = "정보 없음"
-                        fax = "정보 없음"
-                        address = "정보 없음"
-
-                        frames = [dtl_page] + dtl_page.frames
-                        
-                        for frame in frames:
-                            try:
-                                # 1. 업종
-                                if industry == "정보 없음":
-                                    th = frame.locator("th").filter(has_text=re.compile(r"업\s*종"))
-                                    if await th.count() > 0:
-                                        td = th.first.locator("xpath=following-sibling::td")
-                                        if await td.count() > 0:
-                                            industry = (await td.first.inner_text()).strip()
-                                    
-                                    if industry == "정보 없음":
-                                        em = frame.locator("li em.tit").filter(has_text=re.compile(r"업\s*종"))
-                                        if await em.count() > 0:
-                                            li = em.first.locator("xpath=..")
-                                            full = await li.inner_text()
-                                            industry = full.replace(await em.first.inner_text(), "").strip()
-
-                                # 2. 인원수
-                                if employees == "정보 없음":
-                                    th = frame.locator("th").filter(has_text=re.compile(r"(근로자수|사원수|직원수)"))
-                                    if await th.count() > 0:
-                                        td = th.first.locator("xpath=following-sibling::td")
-                                        if await td.count() > 0:
-                                            employees = (await td.first.inner_text()).strip()
-                                    
-                                    if employees == "정보 없음":
-                                        em = frame.locator("li em.tit").filter(has_text=re.compile(r"(근로자수|사원수|직원수)"))
-                                        if await em.count() > 0:
-                                            li = em.first.locator("xpath=..")
-                                            full = await li.inner_text()
-                                            employees = full.replace(await em.first.inner_text(), "").strip()
-
-                                # 3. 팩스
-                                if fax == "정보 없음":
-                                    th = frame.locator("th").filter(has_text=re.compile(r"(팩스|FAX|Fax)"))
-                                    if await th.count() > 0:
-                                        td = th.first.locator("xpath=following-sibling::td")
-                                        if await td.count() > 0:
-                                            fax = (await td.first.inner_text()).strip()
-
-                                # 4. 주소
-                                if address == "정보 없음":
-                                    try:
-                                        map_attr_el = frame.locator("[data-addr]").first
-                                        if await map_attr_el.count() > 0:
-                                            val = await map_attr_el.get_attribute("data-addr")
-                                            if val and len(val.strip()) > 5:
-                                                address = val.strip()
-                                    except: pass
-
-                                    if address == "정보 없음":
-                                        th = frame.locator("th").filter(has_text=re.compile(r"(주소|소재지|위치)"))
-                                        if await th.count() > 0:
-                                            td = th.first.locator("xpath=following-sibling::td")
-                                            if await td.count() > 0:
-                                                address = (await td.first.inner_text()).strip()
-                                    
-                                    if address == "정보 없음":
-                                        em = frame.locator("li em.tit").filter(has_text=re.compile(r"(주소|소재지|위치)"))
-                                        if await em.count() > 0:
-                                            li = em.first.locator("xpath=..")
-                                            full = await li.inner_text()
-                                            address = full.replace(await em.first.inner_text(), "").strip()
-                                    
-                                    # 텍스트 검색
-                                    if address == "정보 없음":
-                                        regions = ["서울", "경기", "인천", "부산", "대구", "광주", "대전", "울산", "세종", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"]
-                                        invalid_keywords = ["연봉", "급여", "월급", "일급", "시급", "채용", "모집", "근무", "우대", "경력", "만원", "찾아줘"]
-                                        for region in regions:
-                                            xpath_query = f"//p[starts-with(normalize-space(.), '{region}')] | //div[starts-with(normalize-space(.), '{region}')] | //span[starts-with(normalize-space(.), '{region}')]"
-                                            addr_el = frame.locator(xpath_query).first
-                                            if await addr_el.count() > 0:
-                                                cand_addr = re.sub(r'\s+', ' ', await addr_el.inner_text()).strip()
-                                                if any(k in cand_addr for k in invalid_keywords): continue
-                                                if 5 < len(cand_addr) < 80:
-                                                    address = cand_addr
-                                                    break
-                            except: continue
-                        
-                        # Regex 보완 (for fax and address if still missing)
-                        if fax == "정보 없음" or not fax:
-                             try:
-                                all_text = ""
-                                for f in frames:
-                                    try: all_text += await f.content()
-                                    except: pass
-                                pattern = re.compile(r'(?:팩스|FAX|Fax|F\s*A\s*X)(?:<[^>]*>|[\s:.-])*(\d{2,4}[-. ]\d{3,4}[-. ]\d{4})')
-                                match = pattern.search(all_text)
-                                if match:
-                                    found_num = match.group(1).replace(" ", "").replace(".", "-")
-                                    if not found_num.startswith("010"): fax = found_num
-                             except: pass
-
-                        if address == "정보 없음":
-                             try:
-                                all_plain = ""
-                                for f in frames:
-                                    try: all_plain += await f.inner_text() + "\n"
-                                    except: pass
-                                addr_pattern = re.compile(r'((?:서울|경기|인천|부산|대구|광주|대전|울산|세종|강원|충북|충남|전북|전남|경북|경남|제주)[가-힣\s\d,.-]+(?:로|길|동|가|읍|면|리)\s*[\d-]+(?:[,]\s*[가-힣\d\s,.-]+)?)')
-                                match = addr_pattern.search(all_plain)
-                                if match:
-                                    found_addr = re.sub(r'\s+', ' ', match.group(0).strip())
-                                    invalid_keywords = ["연봉", "급여", "월급", "일급", "시급", "채용", "모집", "근무", "우대", "경력", "만원", "찾아줘"]
-                                    if not any(k in found_addr for k in invalid_keywords):
-                                        if len(found_addr) < 80: address = found_addr
-                             except: pass
-
-                        job_basic.update({
-                            "industry": industry,
-                            "employees": employees,
-                            "fax": fax,
-                            "address": address
-                        })
-                        jobs.append(job_basic)
-                        
-                        if self.progress:
-                             self.progress(len(jobs), target_count)
-                             
-                        self.log(f"[수집] {len(jobs)}번째: {job_basic['title'][:10]}... ({address})")
+                        fields = await extract_page_fields(dtl_page, self.extract_mode, frame_stats, metrics)
+                        record_job(job_basic, fields)
 
                     except Exception as e:
-                        pass
+                        slot.failed(e)
+                        handle_failure(job_basic, detail_url, e, attempt)
                     finally:
-                        try: await dtl_page.close()
-                        except: pass
+                        # 풀에서 빌린 탭은 닫지 않고 반납
+                        if pooled:
+                            await pages.release(dtl_page)
+                        else:
+                            try: await dtl_page.close()
+                            except: pass
+
+            # 결과를 쓴 뒤의 캐시 저장 실패는 경고만 (예외가 나면 이미 쓴 공고를 재시도해 중복 기록됨)
+            def record_job(job_basic, fields, from_cache=False, from_company=False):
+                job_basic.update(fields)
+                sink.write(job_basic)
+                checkpoint.mark_finished(job_basic.get("posting_id"))
+                try:
+                    # 회사 캐시를 먼저 (같은 회사를 기다리는 작업은 디스크 저장 전에 깨어남)
+                    if not from_company:
+                        companies.put(job_basic.get("company"), fields)
+                    if cache and not from_cache:
+                        cache.put(job_basic.get("posting_id"), fields)
+                    if seen:
+                        seen.mark(job_basic.get("posting_id"), row_fingerprint(job_basic))
+                except Exception as e:
+                    self.log(f"  [캐시 저장 실패] {e}")
+                metrics.maybe_export()
+                if self.progress:
+                    self.progress(sink.count, target_count)
+                self.log(f"[수집] {sink.count}번째: {job_basic['title'][:10]}... ({fields['address']})")
+
+            # HTTP 상세 수집 (JS가 필요한 페이지만 탭으로 폴백)
+            async def extract_detail_http(detail_url, job_basic, attempt=1):
+                # 같은 회사 공고를 다른 작업이 수집 중이면 그 결과를 기다렸다가 사용
+                company = await companies.wait(job_basic.get("company"))
+                if company:
+                    record_job(job_basic, company, from_cache=True, from_company=True)
+                    return
+
+                async with limiter.slot() as slot:
+                    with metrics.span("detail_http") as s:
+                        fields = await fetcher.fetch_fields(detail_url, on_error=slot.failed, metrics=metrics)
+                        if fields is None:
+                            s.fail()
+                    if fields is not None:
+                        record_job(job_basic, fields)
+                        return
+                dtl_page = None
+                try:
+                    with metrics.span("tab_open"):
+                        dtl_page = await pages.acquire()
+                        await throttle.acquire()
+                        await dtl_page.goto(detail_url, wait_until="domcontentloaded")
+                except Exception as e:
+                    if dtl_page:
+                        await pages.release(dtl_page)
+                    handle_failure(job_basic, detail_url, e, attempt)
+                    return
+                await extract_detail(dtl_page, job_basic, pooled=True, detail_url=detail_url, attempt=attempt)
+
+            # 탭 방식(Ctrl+클릭)일 때만 메인 탭을 해당 목록 페이지로 이동
+            async def show_list_page(page_num):
+                nonlocal shown_page
+                if shown_page == page_num:
+                    return
+                await throttle.acquire()
+                await page.goto(list_page_url(page_num, list_params), wait_until="domcontentloaded")
+                await page.wait_for_selector(LIST_ROW_SELECTOR, state="attached", timeout=5000)
+                shown_page = page_num
+
+            # 이어하기: 지난 실행에서 끝나지 않은 상세 수집부터 다시 예약
+            for row in checkpoint.unfinished_rows():
+                if not row.get("detail_url"):
+                    continue
+                checkpoint.mark_scheduled(row)
+                tasks.append(asyncio.create_task(extract_detail_http(row["detail_url"], job_basic_from_row(row))))
 
             # 메인 루프
-            while scheduled_count < target_count and not self.stop_requested:
+            async for page_num, rows in prefetcher.pages(checkpoint.page_num):
+                if scheduled_count >= target_count or self.stop_requested: break
+                checkpoint.page_num = page_num
+                checkpoint.maybe_save()
+                metrics.maybe_export()
                 self.log(f"--- {page_num} 페이지 탐색 중 ---")
-                
-                try:
-                    await page.wait_for_selector('tr[id^="list"]', timeout=5000)
-                except:
-                    self.log("리스트를 찾을 수 없어 종료합니다.")
-                    break
 
-                rows = page.locator('tr[id^="list"]')
-                count = await rows.count()
-                
-                if count == 0: break
+                if len(rows) == 0:
+                    self.log("더 이상 목록이 없습니다.")
+                    break
 
-                for i in range(count):
+                page_all_known = True
+                for row in rows:
                     if scheduled_count >= target_count or self.stop_requested: break
                     
                     try:
-                        row = rows.nth(i)
-                        
-                        # --- 기본 정보 추출 (동기) ---
-                        # 제목
-                        title_el = row.locator('a.t3_sb') 
-                        if await title_el.count() == 0: title_el = row.locator('td.link a').first
-                        title = await title_el.text_content() if await title_el.count() > 0 else "N/A"
-                        title = title.strip()
-                        
-                        # 회사명
-                        company_el = row.locator('.cp_name')
-                        company = await company_el.text_content() if await company_el.count() > 0 else "N/A"
-                        company = company.strip()
-
-                        # 급여
-                        salary = "N/A"
-                        salary_el = row.locator('li.dollar span.item.b1_sb')
-                        s_count = await salary_el.count()
-                        if s_count > 0:
-                            salary_parts = []
-                            for si in range(s_count):
-                                t = await salary_el.nth(si).text_content()
-                                if t: salary_parts.append(t.strip())
-                            salary = " / ".join(salary_parts)
-                            salary = re.sub(r'\s+', ' ', salary).strip()
-
-                        # 지역
-                        location = "N/A"
-                        loc_el_p = row.locator('li.site p')
-                        if await loc_el_p.count() > 0: location = await loc_el_p.text_content()
-                        else:
-                            loc_el = row.locator('li.site')
-                            if await loc_el.count() > 0: location = await loc_el.text_content()
-                        location = location.strip()
-
-                        # 근무시간
-                        time_el = row.locator('li.time')
-                        time_info = await time_el.text_content() if await time_el.count() > 0 else "N/A"
-                        time_info = time_info.strip()
-
-                        # 기본 데이터 패키징
-                        job_basic = {
-                            "title": title,
-                            "company": company,
-                            "salary": salary,
-                            "location": location,
-                            "schedule": time_info
-                        }
+                        # 목록이 밀려 다시 보인 공고는 탭/HTTP 요청 전에 건너뜀
+                        # 이번 실행에서 이미 예약한 공고는 '이전 실행에서 본 공고'인지 알 수 없으므로
+                        # 증분 모드의 멈춤 판단(page_all_known)에서 빼고 건너뜀 (이어하기 첫 페이지에서 멈추지 않게)
+                        key = row_key(row)
+                        dup = dedupe.status(key)
+                        if dup == "duplicate":
+                            page_all_known = False
+                            continue
+
+                        # 이어하기: 이미 예약했던 공고는 건너뜀
+                        if checkpoint.is_scheduled(row["posting_id"]):
+                            page_all_known = False
+                            continue
+
+                        # 이전 실행에서 예약한 공고 (이어하기 대상이 아니면 이미 본 공고로 셈)
+                        if dup == "known":
+                            continue
+
+                        # 증분 모드: 이전에 본 그대로인 공고는 건너뜀
+                        if seen:
+                            if seen.status(row["posting_id"], row_fingerprint(row)) == "known":
+                                known_skipped += 1
+                                continue
+                            page_all_known = False
+
+                        job_basic = job_basic_from_row(row)
+
+                        # 캐시 적중 시 상세 수집 생략
+                        cached = cache.get(row["posting_id"]) if cache else None
+                        if cached:
+                            checkpoint.mark_scheduled(row)
+                            dedupe.mark(key)
+                            record_job(job_basic, cached, from_cache=True)
+                            scheduled_count += 1
+                            continue
+
+                        # 같은 회사 정보가 이미 있으면 상세 수집 생략
+                        company = companies.get(row["company"])
+                        if company:
+                            checkpoint.mark_scheduled(row)
+                            dedupe.mark(key)
+                            record_job(job_basic, company, from_cache=True, from_company=True)
+                            scheduled_count += 1
+                            continue
                         
+                        # HTTP 우선 수집
+                        if self.fetch_backend == "http" and row["detail_url"]:
+                            checkpoint.mark_scheduled(row)
+                            dedupe.mark(key)
+                            tasks.append(asyncio.create_task(extract_detail_http(row["detail_url"], job_basic)))
+                            scheduled_count += 1
+                            continue
+
                         # 탭 열기
                         detail_page = None
                         try:
-                            async with context.expect_page(timeout=5000) as new_page_info:
-                                await title_el.click(modifiers=["Control"])
-                            detail_page = await new_page_info.value
-                        except: continue
+                            await show_list_page(page_num)
+                            title_el = row_title_locator(page, row)
+                            await throttle.acquire()
+                            with metrics.span("tab_open"):
+                                async with context.expect_page(timeout=5000) as new_page_info:
+                                    await title_el.click(modifiers=["Control"])
+                                detail_page = await new_page_info.value
+                        except:
+                            checkpoint.mark_scheduled(row)
+                            dedupe.mark(key)
+                            handle_failure(job_basic, row["detail_url"], "탭 열기 실패", 1)
+                            continue
                         
                         # 태스크 추가
-                        task = asyncio.create_task(extract_detail(detail_page, job_basic))
+                        checkpoint.mark_scheduled(row)
+                        dedupe.mark(key)
+                        task = asyncio.create_task(extract_detail(detail_page, job_basic, detail_url=row["detail_url"]))
                         tasks.append(task)
                         scheduled_count += 1
-                        
-                        await asyncio.sleep(0.5)
 
                     except Exception as e:
                         continue
                 
                 if scheduled_count >= target_count: break
-                
-                # 다음 페이지
-                next_btn = page.locator('.btn_page.next')
-                if await next_btn.count() > 0:
-                    await next_btn.click()
-                    await asyncio.sleep(2)
-                    page_num += 1
-                else:
-                    self.log("다음 페이지가 없습니다.")
+
+                if seen and page_all_known:
+                    self.log("이 페이지의 공고를 모두 이전에 수집했습니다. 증분 수집을 마칩니다.")
                     break
+            prefetcher.cancel()
 
             # 마무리 대기
             self.log("진행 중인 태스크 마무리 중...")
             if tasks:
                 await asyncio.gather(*tasks, return_exceptions=True)
+            await retries.drain()
             
+            self.log(f"[목록 페이지] HTTP: {prefetcher.http_pages}페이지 / 브라우저: {prefetcher.browser_pages}페이지")
+            self.log(f"[상세 수집 방식] HTTP: {fetcher.http_count}건 / 탭 폴백: {fetcher.fallback_count}건")
+            self.log(f"[동시성] {limiter.summary()}")
+            self.log(f"[요청 속도] {throttle.summary()}")
+            self.log(f"[요청 차단] {intercept.summary()}")
+            self.log(f"[탭 풀] {pages.summary()}")
+            self.log(f"[재시도] {retries.summary()}")
+            for line in waits.summary_lines():
+                self.log(f"[대기] {line}")
+            self.log(f"[프레임] {frame_stats.summary()}")
+            for line in metrics.summary_lines():
+                self.log(f"[단계] {line}")
+            if cache:
+                self.log(f"[캐시] 적중: {cache.hits}건 / 미적중: {cache.misses}건")
+            if seen:
+                self.log(f"[증분] 이미 본 공고 건너뜀: {known_skipped}건 / 새로 수집: {sink.count}건")
+            self.log(f"[중복] 목록에서 다시 보인 공고 건너뜀: {dedupe.duplicates}건 / 이전 실행에서 예약한 공고 건너뜀: {dedupe.known}건")
+            self.log(f"[회사 캐시] {companies.summary()}")
+
+            # 중단했거나 실패가 남아 있으면 체크포인트 유지 ('이어하기'로 재시도)
+            if checkpoint.failed or self.stop_requested:
+                checkpoint.save()
+                self.log(f"[체크포인트] 저장됨 (실패 {len(checkpoint.failed)}건) - '이어하기'로 다시 시도할 수 있습니다.")
+            else:
+                checkpoint.clear()
+            completed = True
+
             # 저장
-            self.save_to_excel(jobs)
-            await browser.close()
+            sink.close()
+            # 분석용 형식을 먼저 저장 (엑셀 저장 후에는 완료 메시지 창이 뜸)
+            self.save_exports(RESULTS_JSONL, metrics)
+            self.save_to_excel(RESULTS_JSONL, metrics)
+            metrics.export()
             self.log("=== 모든 작업 완료 ===")
+        except Exception as e:
+            # 브라우저가 죽었거나 상태를 알 수 없으면 닫고 다음 실행에서 새로 띄움
+            self.log(f"[오류] 수집 중 브라우저 오류: {e}\n다음 실행 때 브라우저를 다시 띄웁니다.")
+            broken = True
+        finally:
+            # 오류로 끝났으면 남은 작업을 멈추고 지금까지의 결과/체크포인트를 남김 ('이어하기'로 재개)
+            if prefetcher:
+                prefetcher.cancel()
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            if retries:
+                await retries.cancel()
+            if not completed:
+                checkpoint.save()
+                self.log(f"[체크포인트] 저장됨 (완료 {len(checkpoint.finished)}건) - '이어하기'로 이어서 수집할 수 있습니다.")
+            # close()는 여러 번 불러도 안전 (정상 종료 때 이미 닫은 결과 파일 포함)
+            for store in (sink, cache, seen, dedupe, companies):
+                if store:
+                    try: store.close()
+                    except Exception: pass
+            if pages:
+                try: await pages.close()
+                except Exception: pass
+            if page:
+                try: await page.close()
+                except: pass
+            if broken:
+                await self.close_browser(context)
 
-    def save_to_excel(self, jobs):
+    def save_to_excel(self, jsonl_path, metrics=None):
+        """스트리밍으로 기록한 JSONL 결과를 엑셀로 변환"""
         try:
-            df = pd.DataFrame(jobs)
-            
-            # 컬럼명 한글로 변경 (CLI 버전과 동일하게)
-            df.rename(columns={
-                "title": "채용공고명",
-                "company": "업체명",
-                "industry": "업종",
-                "employees": "인원수",
-                "fax": "팩스번호",
-                "address": "주소",
-                "salary": "급여",
-                "location": "지역",
-                "schedule": "근무시간"
-            }, inplace=True)
-            
-            df = df.applymap(clean_text)
-            filename = 'worknet_results_gui.xlsx'
-            df.to_excel(filename, index=False, engine='openpyxl')
-            self.log(f"[저장 완료] 파일명: {filename} ({len(jobs)}건)")
-            messagebox.showinfo("완료", f"수집이 완료되었습니다.\n총 {len(jobs)}건")
+            filename = RESULTS_XLSX
+            with span(metrics, "excel_save"):
+                rows = export_excel(jsonl_path, filename)
+            self.log(f"[저장 완료] 파일명: {filename} ({rows}건)")
+            messagebox.showinfo("완료", f"수집이 완료되었습니다.\n총 {rows}건")
         except Exception as e:
-            self.log(f"[저장 실패] {e}")
+            self.log(f"[저장 실패] {e} (수집 결과는 {jsonl_path}에 남아 있습니다)")
             messagebox.showerror("오류", f"저장 중 오류가 발생했습니다.\n{e}")
 
+    def save_exports(self, jsonl_path, metrics=None):
+        """EXTRA_EXPORT_FORMATS 형식으로도 내보냄 (타입 있는 컬럼, 실패해도 엑셀 결과에는 영향 없음)"""
+        for fmt in EXTRA_EXPORT_FORMATS:
+            out_path = default_export_path(RESULTS_EXPORT_BASE, fmt, bool(EXPORT_PARTITION_BY))
+            try:
+                with span(metrics, "export_" + fmt):
+                    rows = export_results(jsonl_path, fmt, out_path, EXPORT_PARTITION_BY)
+                self.log(f"[저장 완료] {out_path} ({rows}건)")
+            except Exception as e:
+                self.log(f"[{fmt} 저장 실패] {e}")
+
 # ========================================================
 # 3. GUI 메인 클래스
 # ========================================================
@@ -437,6 +618,7 @@ class WorknetGUI:
         self.loop = asyncio.new_event_loop()
         
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # 별도 스레드에서 이벤트 루프 실행 및 초기 데이터 로드
         self.thread = threading.Thread(target=self.start_async_loop, daemon=True)
@@ -465,7 +647,10 @@ class WorknetGUI:
 
     def reset_ui_state(self):
         self.btn_start.config(state="normal", text="수집 시작")
+        self.btn_resume.config(state="normal")
         self.entry_count.config(state="normal")
+        self.chk_delta.config(state="normal")
+        self.chk_headless.config(state="normal")
 
     def setup_ui(self):
         # 스타일링
@@ -496,6 +681,17 @@ class WorknetGUI:
         self.btn_start = ttk.Button(mid_frame, text="수집 시작", command=self.on_start_click)
         self.btn_start.pack(side="right", padx=5)
 
+        self.btn_resume = ttk.Button(mid_frame, text="이어하기", command=self.on_resume_click)
+        self.btn_resume.pack(side="right", padx=5)
+
+        self.var_delta = tk.BooleanVar(value=False)
+        self.chk_delta = ttk.Checkbutton(mid_frame, text="새 공고만", variable=self.var_delta)
+        self.chk_delta.pack(side="left", padx=5)
+
+        self.var_headless = tk.BooleanVar(value=False)
+        self.chk_headless = ttk.Checkbutton(mid_frame, text="창 숨김", variable=self.var_headless)
+        self.chk_headless.pack(side="left", padx=5)
+
         # 로그 프레임
         log_frame = ttk.LabelFrame(self.root, text="진행 상황 로그", padding=10)
         log_frame.pack(fill="both", expand=True, padx=10, pady=5)
@@ -513,7 +709,7 @@ class WorknetGUI:
         else:
             self.root.after(0, lambda: self.lbl_total.config(text="조회 실패 (로그 확인)", foreground="red"))
 
-    def on_start_click(self):
+    def on_start_click(self, resume=False):
         try:
             count = int(self.entry_count.get())
         except ValueError:
@@ -521,12 +717,30 @@ class WorknetGUI:
             return
             
         self.btn_start.config(state="disabled", text="실행 중...")
+        self.btn_resume.config(state="disabled")
         self.entry_count.config(state="disabled")
+        self.chk_delta.config(state="disabled")
+        self.chk_headless.config(state="disabled")
         
-        # 크롤링 시작
-        future = self.run_async(self.crawler.run_crawl(count))
+        # 크롤링 시작 (창 숨김 여부가 바뀌었으면 브라우저를 새 모드로 다시 띄움)
+        self.crawler.headless = self.var_headless.get()
+        future = self.run_async(self.crawler.run_crawl(count, delta=self.var_delta.get(), resume=resume))
         future.add_done_callback(lambda f: self.root.after(0, self.reset_ui_state))
 
+    def on_resume_click(self):
+        """마지막 체크포인트부터 이어서 수집"""
+        self.on_start_click(resume=True)
+
+    def on_close(self):
+        """창을 닫을 때 백그라운드 루프가 들고 있는 브라우저도 종료"""
+        self.crawler.stop_requested = True
+        try:
+            self.run_async(self.crawler.close_browser()).result(timeout=10)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.root.destroy()
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = WorknetGUI(root)
@@ -0,0 +1,322 @@
+import csv
+import datetime
+import os
+import re
+import time
+
+from worknet_sink import COLUMNS, clean_column, export_excel, iter_chunks, iter_records
+
+# ========================================================
+# 분석용 내보내기 (Parquet / Feather / CSV, 타입이 있는 컬럼)
+# ========================================================
+# 엑셀 결과를 분석 작업마다 다시 파싱하지 않도록, 같은 JSONL 결과를 컬럼 형식 파일로도 내보냅니다.
+#   - employees_count: 인원수 "48 명" → 48 (정수)
+#   - salary_min / salary_max / salary_unit: 급여 "월급 / 250만원 ~ 300만원" → 2500000 / 3000000 / 월급
+#   - region: 지역 "경기 성남시 분당구" → 경기 (시/도)
+#   - run_date: 내보낸 날짜
+# partition_by를 주면 run_date=YYYY-MM-DD/region=서울/ 형태의 폴더로 나눠 저장합니다 (필요한 부분만 읽기).
+# (Hive 방식이라 나눈 컬럼은 파일 안에 넣지 않고 폴더 이름으로만 남김 - pyarrow/pandas/Spark가 그대로 읽음)
+# Parquet / Feather는 pyarrow가 있어야 합니다 (pip install pyarrow). 엑셀은 기존 export_excel 그대로.
+
+# JSONL을 몇 행씩 읽어 기록할지
+EXPORT_CHUNK_ROWS = 5000
+# CSV는 이 행 수마다 새 파일로 나눔 (None이면 한 파일)
+CSV_PART_ROWS = 200000
+
+# (컬럼, 타입) - 컬럼 형식 파일의 순서와 타입
+TYPED_COLUMNS = [
+    ("posting_id", "str"),
+    ("title", "str"),
+    ("company", "str"),
+    ("salary", "str"),
+    ("salary_min", "int"),
+    ("salary_max", "int"),
+    ("salary_unit", "str"),
+    ("location", "str"),
+    ("region", "str"),
+    ("schedule", "str"),
+    ("industry", "str"),
+    ("employees", "str"),
+    ("employees_count", "int"),
+    ("fax", "str"),
+    ("address", "str"),
+    ("run_date", "date"),
+]
+PARTITION_COLUMNS = ("run_date", "region")
+
+SALARY_UNITS = ("시급", "일급", "주급", "월급", "연봉", "건당")
+SALARY_AMOUNT = re.compile(r"([\d,]+(?:\.\d+)?)\s*(만)?\s*원")
+# '2800 ~ 3200만원'처럼 앞 숫자에 단위가 없으면 뒤 숫자의 단위(만/원)를 함께 씀
+SALARY_RANGE = re.compile(r"([\d,]+(?:\.\d+)?)\s*(만)?\s*(원)?\s*~\s*([\d,]+(?:\.\d+)?)\s*(만)?\s*원")
+EMPLOYEE_COUNT = re.compile(r"\d[\d,]*")
+
+# 시/도 이름 → 목록에 쓰이는 짧은 이름
+REGION_NAMES = {
+    "서울특별시": "서울", "부산광역시": "부산", "대구광역시": "대구", "인천광역시": "인천",
+    "광주광역시": "광주", "대전광역시": "대전", "울산광역시": "울산", "세종특별자치시": "세종",
+    "경기도": "경기", "강원도": "강원", "강원특별자치도": "강원", "충청북도": "충북", "충청남도": "충남",
+    "전라북도": "전북", "전북특별자치도": "전북", "전라남도": "전남", "경상북도": "경북", "경상남도": "경남",
+    "제주특별자치도": "제주", "제주도": "제주",
+}
+UNKNOWN_REGION = "기타"
+
+
+def parse_employees(text):
+    """'48 명', '1,234명' → 정수 (숫자가 없으면 None)"""
+    match = EMPLOYEE_COUNT.search(text or "")
+    return int(match.group().replace(",", "")) if match else None
+
+
+def _won(number, man):
+    """'3,200' + '만' → 32000000 (숫자가 아니면 ValueError)"""
+    value = float(number.replace(",", ""))
+    return int(value * 10000) if man else int(value)
+
+
+def parse_salary(text):
+    """
+    '월급 / 250만원 ~ 300만원' → (2500000, 3000000, '월급')
+    '연봉 / 2800 ~ 3200만원' → (28000000, 32000000, '연봉') (앞 숫자는 뒤 숫자의 단위를 따름)
+    '시급 / 10,030원' → (10030, 10030, '시급'), '... 이상' → (최소, None), '... 이하' → (None, 최대)
+    금액이 없으면 (None, None, 단위 또는 None)
+    """
+    text = text or ""
+    unit = next((u for u in SALARY_UNITS if u in text), None)
+    match = SALARY_RANGE.search(text)
+    if match:
+        low, low_man, low_won, high, high_man = match.groups()
+        if not low_man and not low_won:
+            low_man = high_man
+        try:
+            amounts = [_won(low, low_man), _won(high, high_man)]
+            return min(amounts), max(amounts), unit
+        except ValueError:
+            pass
+    amounts = []
+    for number, man in SALARY_AMOUNT.findall(text):
+        try:
+            amounts.append(_won(number, man))
+        except ValueError:
+            continue
+    if not amounts:
+        return None, None, unit
+    if len(amounts) >= 2:
+        return min(amounts[:2]), max(amounts[:2]), unit
+    if "이상" in text:
+        return amounts[0], None, unit
+    if "이하" in text:
+        return None, amounts[0], unit
+    return amounts[0], amounts[0], unit
+
+
+def parse_region(location):
+    """'경기 성남시 분당구' / '경기도 성남시' → '경기' (알 수 없으면 '기타')"""
+    first = (location or "").split()
+    if not first or first[0] == "N/A":
+        return UNKNOWN_REGION
+    name = first[0]
+    return REGION_NAMES.get(name, name)
+
+
+def typed_record(record, run_date):
+    """JSONL 결과 한 건 → TYPED_COLUMNS 형식 dict"""
+    salary_min, salary_max, salary_unit = parse_salary(record.get("salary"))
+    row = {key: record.get(key) for key, _ in COLUMNS}
+    row.update({
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_unit": salary_unit,
+        "region": parse_region(record.get("location")),
+        "employees_count": parse_employees(record.get("employees")),
+        "run_date": run_date,
+    })
+    return row
+
+
+def typed_columns(records, run_date):
+    """레코드 묶음 → {컬럼: 값 목록} (문자열 컬럼은 엑셀과 같은 규칙으로 정제, 빈 값은 None 유지)"""
+    rows = [typed_record(record, run_date) for record in records]
+    columns = {}
+    for name, kind in TYPED_COLUMNS:
+        values = [row[name] for row in rows]
+        if kind == "str":
+            present = [i for i, v in enumerate(values) if v is not None]
+            cleaned = clean_column([values[i] for i in present])
+            for i, v in zip(present, cleaned):
+                values[i] = v
+        columns[name] = values
+    return columns
+
+
+# ========================================================
+# 형식별 기록기 (fields: 기록할 (컬럼, 타입) 목록 / write(columns) / close())
+# ========================================================
+def _arrow_schema(fields):
+    import pyarrow as pa
+    types = {"str": pa.string(), "int": pa.int64(), "date": pa.date32()}
+    return pa.schema([(name, types[kind]) for name, kind in fields])
+
+
+def _require_pyarrow(fmt):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise RuntimeError(f"{fmt} 내보내기에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+
+class ParquetWriter:
+    ext = ".parquet"
+
+    def __init__(self, path, fields=TYPED_COLUMNS):
+        _require_pyarrow("Parquet")
+        import pyarrow.parquet as pq
+        self.schema = _arrow_schema(fields)
+        self._writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+
+    def write(self, columns):
+        import pyarrow as pa
+        self._writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        self._writer.close()
+
+
+class FeatherWriter:
+    """Feather v2 (= Arrow IPC 파일), 묶음마다 레코드 배치로 이어 씀"""
+    ext = ".feather"
+
+    def __init__(self, path, fields=TYPED_COLUMNS):
+        _require_pyarrow("Feather")
+        import pyarrow as pa
+        self.schema = _arrow_schema(fields)
+        self._sink = pa.OSFile(path, "wb")
+        self._writer = pa.ipc.new_file(self._sink, self.schema,
+                                       options=pa.ipc.IpcWriteOptions(compression="lz4"))
+
+    def write(self, columns):
+        import pyarrow as pa
+        self._writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        self._writer.close()
+        self._sink.close()
+
+
+class CsvWriter:
+    """UTF-8(BOM) CSV, part_rows 행마다 .part0001.csv 처럼 다음 파일로 넘어감"""
+    ext = ".csv"
+
+    def __init__(self, path, fields=TYPED_COLUMNS, part_rows=CSV_PART_ROWS):
+        self.path = path
+        self.names = [name for name, _ in fields]
+        self.part_rows = part_rows
+        self.parts = 0
+        self._rows_in_part = 0
+        self._file = None
+        self._open_next()
+
+    def _open_next(self):
+        if self._file:
+            self._file.close()
+        path = self.path
+        if self.parts:
+            root, ext = os.path.splitext(self.path)
+            path = f"{root}.part{self.parts:04d}{ext}"
+        self.parts += 1
+        self._rows_in_part = 0
+        self._file = open(path, "w", encoding="utf-8-sig", newline="")
+        self._csv = csv.writer(self._file)
+        self._csv.writerow(self.names)
+
+    def write(self, columns):
+        values = [columns[name] for name in self.names]
+        for row in zip(*values):
+            if self.part_rows and self._rows_in_part >= self.part_rows:
+                self._open_next()
+            self._csv.writerow(["" if v is None else v for v in row])
+            self._rows_in_part += 1
+
+    def close(self):
+        self._file.close()
+
+
+WRITERS = {
+    "parquet": ParquetWriter,
+    "feather": FeatherWriter,
+    "csv": CsvWriter,
+}
+EXPORT_FORMATS = ("xlsx",) + tuple(WRITERS)
+
+
+def _partition_value(value):
+    text = str(value) if value is not None else UNKNOWN_REGION
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", text) or UNKNOWN_REGION
+
+
+def _split_columns(columns, partition_by):
+    """{컬럼: 값 목록} → {(파티션 값, ...): {컬럼: 값 목록}}"""
+    keys = list(zip(*(columns[name] for name in partition_by)))
+    groups = {}
+    for i, key in enumerate(keys):
+        groups.setdefault(key, []).append(i)
+    if len(groups) == 1:
+        return {keys[0]: columns}
+    return {key: {name: [values[i] for i in idx] for name, values in columns.items()}
+            for key, idx in groups.items()}
+
+
+def export_results(jsonl_path, fmt, out_path, partition_by=None, run_date=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    JSONL 결과를 fmt(xlsx / parquet / feather / csv) 형식으로 내보내고 기록한 행 수를 반환합니다.
+    out_path: 파일 경로 (partition_by가 있으면 폴더 경로)
+    partition_by: ("run_date", "region") 중 일부 - 폴더/파일을 나눠 저장 (xlsx는 지원 안 함)
+    run_date: run_date 컬럼 값 (기본: 오늘)
+    """
+    if fmt == "xlsx":
+        if partition_by:
+            raise ValueError("엑셀 내보내기는 partition_by를 지원하지 않습니다")
+        return export_excel(jsonl_path, out_path)
+    if fmt not in WRITERS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (가능: {', '.join(EXPORT_FORMATS)})")
+    partition_by = tuple(partition_by or ())
+    for name in partition_by:
+        if name not in PARTITION_COLUMNS:
+            raise ValueError(f"나눌 수 없는 컬럼: {name} (가능: {', '.join(PARTITION_COLUMNS)})")
+
+    writer_cls = WRITERS[fmt]
+    fields = [(name, kind) for name, kind in TYPED_COLUMNS if name not in partition_by]
+    run_date = run_date or datetime.date.today()
+    # 같은 날 여러 번 내보내도 이전 파일을 덮어쓰지 않도록 파티션 안 파일명에 시각을 붙임
+    part_name = f"part-{time.strftime('%H%M%S')}{writer_cls.ext}"
+    writers = {}
+    rows = 0
+    try:
+        for chunk in iter_chunks(iter_records(jsonl_path), chunk_rows):
+            columns = typed_columns(chunk, run_date)
+            groups = _split_columns(columns, partition_by) if partition_by else {(): columns}
+            for key, group in groups.items():
+                writer = writers.get(key)
+                if writer is None:
+                    path = out_path
+                    if partition_by:
+                        folder = os.path.join(out_path, *(f"{name}={_partition_value(value)}"
+                                                          for name, value in zip(partition_by, key)))
+                        os.makedirs(folder, exist_ok=True)
+                        path = os.path.join(folder, part_name)
+                    writer = writers[key] = writer_cls(path, fields)
+                writer.write(group)
+            rows += len(chunk)
+        if not writers and not partition_by:
+            # 결과가 없어도 빈 파일(헤더/스키마만)은 남김
+            writers[()] = writer_cls(out_path, fields)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return rows
+
+
+def default_export_path(base, fmt, partitioned=False):
+    """'worknet_results' → worknet_results.parquet / 나눠 저장하면 worknet_results_parquet 폴더"""
+    if partitioned:
+        return f"{base}_{fmt}"
+    return base + (".xlsx" if fmt == "xlsx" else WRITERS[fmt].ext)
@@ -0,0 +1,633 @@
+import re
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+
+from worknet_metrics import span
+
+# ========================================================
+# 상세 페이지 필드 추출 규칙 (두 크롤러 공용)
+# ========================================================
+# 업종 / 인원수 / 팩스 / 주소 추출 규칙을 표 하나로 정의하고,
+# 모듈 로드 시 한 번만 컴파일합니다.
+# 같은 규칙 표를 세 가지 엔진이 사용합니다.
+#   - 원본 HTML (HTTP 수집)         : extract_fields_from_html
+#   - 브라우저 프레임 (evaluate 1회) : extract_fields_inpage
+#   - 브라우저 프레임 (로케이터 체인) : extract_fields_with_locators
+
+NOT_FOUND = "정보 없음"
+
+REGIONS = ["서울", "경기", "인천", "부산", "대구", "광주", "대전", "울산", "세종", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"]
+INVALID_ADDR_KEYWORDS = ["연봉", "급여", "월급", "일급", "시급", "채용", "모집", "근무", "우대", "경력", "만원", "찾아줘"]
+
+# 주소가 아닌 문장 필터 (키워드 목록을 하나의 정규식으로 합침)
+INVALID_ADDR_RE = re.compile("|".join(map(re.escape, INVALID_ADDR_KEYWORDS)))
+ADDR_MAX_LEN = 80
+
+FAX_PATTERN = re.compile(r'(?:팩스|FAX|Fax|F\s*A\s*X)(?:<[^>]*>|[\s:.-])*(\d{2,4}[-. ]\d{3,4}[-. ]\d{4})')
+ADDR_PATTERN = re.compile(r'((?:' + "|".join(REGIONS) + r')[가-힣\s\d,.-]+(?:로|길|동|가|읍|면|리)\s*[\d-]+(?:[,]\s*[가-힣\d\s,.-]+)?)')
+
+
+def normalize_space(text):
+    return re.sub(r'\s+', ' ', text or "").strip()
+
+
+def clean_fax_match(raw):
+    """팩스 정규식 매치 정리 (휴대폰 번호는 제외)"""
+    found_num = raw.replace(" ", "").replace(".", "-")
+    return None if found_num.startswith("010") else found_num
+
+
+def clean_addr_match(raw):
+    """주소 정규식 매치 정리 (연봉/채용 등 주소가 아닌 문장 제외)"""
+    found_addr = normalize_space(raw)
+    if INVALID_ADDR_RE.search(found_addr) or len(found_addr) >= ADDR_MAX_LEN:
+        return None
+    return found_addr
+
+
+# 필드별 규칙 표
+#   label       : th / li em.tit 라벨 정규식
+#   strategies  : 순서대로 시도할 구조 탐색 전략
+#   regex       : 구조 탐색 실패 시 전체 문서에서 찾을 정규식 (group, 대상: html/text)
+#   regex_if    : 이 값들이면 정규식 보완 실행
+#   clean       : 정규식 매치 후처리 (None 반환 시 버림)
+FIELD_RULES = (
+    {
+        "field": "industry",
+        "label": re.compile(r"업\s*종"),
+        "strategies": ("th_td", "li_em"),
+    },
+    {
+        "field": "employees",
+        "label": re.compile(r"(근로자수|사원수|직원수)"),
+        "strategies": ("th_td", "li_em"),
+    },
+    {
+        "field": "fax",
+        "label": re.compile(r"(팩스|FAX|Fax)"),
+        "strategies": ("th_td",),
+        "regex": FAX_PATTERN, "regex_group": 1, "regex_source": "html",
+        "regex_if": ("", NOT_FOUND, "-"),
+        "clean": clean_fax_match,
+    },
+    {
+        "field": "address",
+        "label": re.compile(r"(주소|소재지|위치)"),
+        "strategies": ("data_addr", "th_td", "li_em", "region_text"),
+        "regex": ADDR_PATTERN, "regex_group": 0, "regex_source": "text",
+        "regex_if": (NOT_FOUND,),
+        "clean": clean_addr_match,
+    },
+)
+FIELD_NAMES = tuple(rule["field"] for rule in FIELD_RULES)
+REGEX_RULES = tuple(rule for rule in FIELD_RULES if "regex" in rule)
+
+# 브라우저 스크립트로 넘길 규칙 (정규식은 소스 문자열로)
+JS_RULES = {
+    "rules": [
+        {
+            "field": rule["field"],
+            "label": rule["label"].pattern,
+            "strategies": list(rule["strategies"]),
+            "regex": rule["regex"].pattern if "regex" in rule else None,
+            "regex_group": rule.get("regex_group", 0),
+            "regex_source": rule.get("regex_source"),
+        }
+        for rule in FIELD_RULES
+    ],
+    "regions": REGIONS,
+    "invalid": INVALID_ADDR_RE.pattern,
+    "addr_max_len": ADDR_MAX_LEN,
+}
+
+
+def empty_fields():
+    return {name: NOT_FOUND for name in FIELD_NAMES}
+
+
+def needs_regex(rule, value):
+    return not value or value in rule["regex_if"]
+
+
+def _is_addr_candidate(text):
+    return not INVALID_ADDR_RE.search(text) and 5 < len(text) < ADDR_MAX_LEN
+
+
+# ========================================================
+# 엔진 1: 원본 HTML
+# ========================================================
+# 자식 없이 닫히는 태그 / 같은 태그가 새로 열리면 암묵적으로 닫히는 태그
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+IMPLICIT_CLOSE_TAGS = {"li", "td", "th", "tr", "p", "option", "dt", "dd"}
+SKIP_TEXT_TAGS = {"script", "style", "noscript", "template"}
+BLOCK_TAGS = {"div", "p", "li", "tr", "table", "ul", "ol", "dl", "dt", "dd", "br", "h1", "h2", "h3", "h4", "h5", "h6", "section", "article", "header", "footer"}
+
+
+class Node:
+    """최소한의 DOM 노드 (태그, 속성, 자식)"""
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.children = []
+        self.parent = parent
+
+    def classes(self):
+        return (self.attrs.get("class") or "").split()
+
+    def iter(self):
+        """문서 순서대로 하위 엘리먼트 순회"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Node):
+                yield node
+                stack.extend(reversed(node.children))
+
+    def text(self):
+        """text_content()에 해당 (스크립트/스타일 제외)"""
+        parts = []
+        self._collect(parts, block=False)
+        return "".join(parts)
+
+    def inner_text(self):
+        """블록 요소 경계를 줄바꿈으로 구분한 inner_text() 근사치"""
+        parts = []
+        self._collect(parts, block=True)
+        return "".join(parts)
+
+    def _collect(self, parts, block):
+        if self.tag in SKIP_TEXT_TAGS:
+            return
+        for child in self.children:
+            if isinstance(child, Node):
+                child._collect(parts, block)
+                if block and child.tag in BLOCK_TAGS:
+                    parts.append("\n")
+            else:
+                parts.append(child)
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document")
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        if tag in IMPLICIT_CLOSE_TAGS:
+            # <li>...<li> 처럼 닫는 태그 없이 이어지는 경우 이전 것을 닫음
+            for idx in range(len(self.stack) - 1, 0, -1):
+                open_tag = self.stack[idx].tag
+                if open_tag == tag:
+                    del self.stack[idx:]
+                    break
+                if open_tag in ("table", "ul", "ol", "dl", "div", "tbody"):
+                    break
+        node = Node(tag, [(k, v or "") for k, v in attrs], self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        node = Node(tag, [(k, v or "") for k, v in attrs], self.stack[-1])
+        self.stack[-1].children.append(node)
+
+    def handle_endtag(self, tag):
+        for idx in range(len(self.stack) - 1, 0, -1):
+            if self.stack[idx].tag == tag:
+                del self.stack[idx:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(html):
+    builder = _TreeBuilder()
+    try:
+        builder.feed(html)
+        builder.close()
+    except Exception:
+        pass
+    return builder.root
+
+
+def _html_th_td(root, rule):
+    """<th>라벨</th><td>값</td> 형식"""
+    label = rule["label"]
+    for th in root.iter():
+        if th.tag != "th" or not label.search(normalize_space(th.text())):
+            continue
+        siblings = th.parent.children if th.parent else []
+        after = False
+        for sib in siblings:
+            if sib is th:
+                after = True
+                continue
+            if after and isinstance(sib, Node) and sib.tag == "td":
+                return normalize_space(sib.inner_text())
+        return None
+    return None
+
+
+def _has_li_ancestor(node):
+    node = node.parent
+    while node is not None:
+        if node.tag == "li":
+            return True
+        node = node.parent
+    return False
+
+
+def _html_li_em(root, rule):
+    """<li><em class="tit">라벨</em>값</li> 형식"""
+    label = rule["label"]
+    for em in root.iter():
+        if em.tag != "em" or "tit" not in em.classes() or not _has_li_ancestor(em):
+            continue
+        if not label.search(normalize_space(em.text())):
+            continue
+        return em.parent.inner_text().replace(em.inner_text(), "").strip()
+    return None
+
+
+def _html_data_addr(root, rule):
+    """지도 버튼 등의 data-addr 속성"""
+    for el in root.iter():
+        if "data-addr" in el.attrs:
+            val = el.attrs["data-addr"].strip()
+            return val if len(val) > 5 else None
+    return None
+
+
+def _html_region_text(root, rule):
+    """지역명으로 시작하는 P/DIV/SPAN 텍스트"""
+    candidates = [el for el in root.iter() if el.tag in ("p", "div", "span")]
+    for region in REGIONS:
+        for el in candidates:
+            if not normalize_space(el.text()).startswith(region):
+                continue
+            cand_addr = normalize_space(el.inner_text())
+            if _is_addr_candidate(cand_addr):
+                return cand_addr
+            break
+    return None
+
+
+HTML_STRATEGIES = {
+    "th_td": _html_th_td,
+    "li_em": _html_li_em,
+    "data_addr": _html_data_addr,
+    "region_text": _html_region_text,
+}
+
+
+def extract_fields_from_html(htmls, metrics=None):
+    """
+    상세 페이지 HTML 목록(메인 문서 + iframe 문서)에서 필드를 추출합니다.
+    찾지 못한 필드는 '정보 없음'으로 남습니다.
+    metrics: Metrics를 주면 전략별 소요 시간(field_th_td ... field_regex)을 기록
+    """
+    fields = empty_fields()
+    roots = [parse_html(h) for h in htmls]
+
+    for root in roots:
+        for rule in FIELD_RULES:
+            if fields[rule["field"]] != NOT_FOUND:
+                continue
+            for strategy in rule["strategies"]:
+                with span(metrics, "field_" + strategy):
+                    val = HTML_STRATEGIES[strategy](root, rule)
+                if val:
+                    fields[rule["field"]] = val
+                    break
+
+    # 정규식 보완 (구조 탐색으로 못 찾은 필드)
+    sources = {}
+    for rule in REGEX_RULES:
+        if not needs_regex(rule, fields[rule["field"]]):
+            continue
+        with span(metrics, "field_regex"):
+            if rule["regex_source"] not in sources:
+                if rule["regex_source"] == "html":
+                    sources["html"] = "".join(htmls)
+                else:
+                    sources["text"] = "\n".join(root.inner_text() for root in roots)
+            match = rule["regex"].search(sources[rule["regex_source"]])
+            val = rule["clean"](match.group(rule["regex_group"])) if match else None
+        if val:
+            fields[rule["field"]] = val
+
+    return fields
+
+
+def find_iframe_srcs(html):
+    """HTML 안의 iframe src 목록 (기업정보가 iframe으로 들어오는 경우 대비)"""
+    root = parse_html(html)
+    return [el.attrs["src"] for el in root.iter() if el.tag == "iframe" and el.attrs.get("src")]
+
+
+# ========================================================
+# 엔진 2: 브라우저 프레임 (evaluate 1회)
+# ========================================================
+# 프레임마다 evaluate 한 번으로 규칙 표의 모든 전략을 브라우저 안에서 실행하고
+# dict 하나로 돌려받습니다. 정규식 후보는 모든 프레임을 본 뒤 파이썬에서 후처리합니다.
+
+DETAIL_EXTRACT_JS = r"""
+(args) => {
+    const norm = (s) => (s || "").replace(/\s+/g, " ").trim();
+    const invalid = new RegExp(args.invalid);
+
+    const strategies = {
+        th_td: (re) => {
+            for (const th of document.querySelectorAll("th")) {
+                if (!re.test(norm(th.textContent))) continue;
+                let sib = th.nextElementSibling;
+                while (sib && sib.tagName !== "TD") sib = sib.nextElementSibling;
+                return sib ? sib.innerText.trim() : null;
+            }
+            return null;
+        },
+        li_em: (re) => {
+            for (const em of document.querySelectorAll("li em.tit")) {
+                if (!re.test(norm(em.textContent))) continue;
+                const parent = em.parentElement;
+                return parent ? parent.innerText.split(em.innerText).join("").trim() : null;
+            }
+            return null;
+        },
+        data_addr: () => {
+            const el = document.querySelector("[data-addr]");
+            if (!el) return null;
+            const val = (el.getAttribute("data-addr") || "").trim();
+            return val.length > 5 ? val : null;
+        },
+        region_text: () => {
+            for (const region of args.regions) {
+                const xp = `//p[starts-with(normalize-space(.), '${region}')] | //div[starts-with(normalize-space(.), '${region}')] | //span[starts-with(normalize-space(.), '${region}')]`;
+                const el = document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                if (!el) continue;
+                const cand = norm(el.innerText);
+                if (invalid.test(cand)) continue;
+                if (cand.length > 5 && cand.length < args.addr_max_len) return cand;
+            }
+            return null;
+        },
+    };
+
+    const sources = {};
+    const source = (kind) => {
+        if (!(kind in sources)) {
+            sources[kind] = kind === "html"
+                ? document.documentElement.outerHTML
+                : (document.body ? document.body.innerText : "");
+        }
+        return sources[kind];
+    };
+
+    // 전략/정규식 호출마다 [이름, ms]를 남겨 파이썬 쪽 metrics에 field_<전략>으로 기록
+    const timings = [];
+    const timed = (name, fn) => {
+        const start = performance.now();
+        try {
+            return fn();
+        } finally {
+            timings.push([name, performance.now() - start]);
+        }
+    };
+
+    const out = {};
+    for (const rule of args.rules) {
+        if (args.missing.includes(rule.field)) {
+            const label = new RegExp(rule.label);
+            for (const name of rule.strategies) {
+                const val = timed(name, () => strategies[name](label));
+                if (val) { out[rule.field] = val; break; }
+            }
+        }
+        if (rule.regex && args.want_regex.includes(rule.field)) {
+            const m = timed("regex", () => source(rule.regex_source).match(new RegExp(rule.regex)));
+            out[rule.field + "_regex"] = m ? m[rule.regex_group] : null;
+        }
+    }
+    out._timings = timings;
+    return out;
+}
+"""
+
+
+# 내용이 없는 iframe (광고 자리, 빈 프레임)
+BLANK_FRAME_SCHEMES = ("about:", "data:", "javascript:", "blob:")
+
+
+def _same_site(frame_url, site):
+    host = urlparse(frame_url).hostname
+    if site is None or host is None:
+        return site == host
+    return host == site or host.endswith("." + site)
+
+
+def detail_frames(dtl_page):
+    """
+    상세 탭에서 탐색할 프레임 목록: 메인 프레임 + 같은 사이트의 iframe
+    (page.frames에는 메인 프레임이 이미 들어 있으므로 page를 따로 넣지 않음 - 예전에는 메인을 두 번 탐색했음)
+    빈 iframe(about:blank 등)과 다른 도메인(광고/분석) iframe은 건너뜀
+    """
+    main = dtl_page.main_frame
+    site = urlparse(main.url).hostname
+    if site and site.startswith("www."):
+        site = site[4:]
+    frames = [main]
+    for frame in dtl_page.frames:
+        if frame is main:
+            continue
+        url = frame.url or ""
+        if not url or url.startswith(BLANK_FRAME_SCHEMES) or not _same_site(url, site):
+            continue
+        frames.append(frame)
+    return frames
+
+
+class FrameStats:
+    """공고당 실제로 탐색한 프레임 수 / 건너뛴 프레임 수"""
+
+    def __init__(self):
+        self.postings = 0
+        self.scanned = 0
+        self.skipped = 0
+
+    def summary(self):
+        n = max(self.postings, 1)
+        return f"공고 {self.postings}건, 공고당 탐색 {self.scanned / n:.2f}개 / 건너뜀 {self.skipped / n:.2f}개"
+
+
+def _apply_regex_candidates(fields, candidates):
+    for rule in REGEX_RULES:
+        raw = candidates.get(rule["field"])
+        if raw and needs_regex(rule, fields[rule["field"]]):
+            val = rule["clean"](raw)
+            if val:
+                fields[rule["field"]] = val
+
+
+async def extract_fields_inpage(frames, stats=None, metrics=None):
+    """
+    프레임마다 evaluate 한 번으로 필드를 추출합니다. (메인 프레임에서 다 찾으면 iframe은 보지 않음)
+    어느 프레임에서도 스크립트를 실행하지 못하면 예외를 올려 로케이터 방식으로 넘깁니다.
+    metrics: 스크립트가 재어 온 전략별 시간을 field_<전략> / field_regex로 기록
+    """
+    fields = empty_fields()
+    candidates = {}
+    evaluated = 0
+
+    for frame in frames:
+        missing = [name for name in FIELD_NAMES if fields[name] == NOT_FOUND]
+        want_regex = [rule["field"] for rule in REGEX_RULES
+                      if needs_regex(rule, fields[rule["field"]]) and rule["field"] not in candidates]
+        if not missing and not want_regex:
+            break
+        try:
+            res = await frame.evaluate(DETAIL_EXTRACT_JS, dict(JS_RULES, missing=missing, want_regex=want_regex))
+        except Exception:
+            continue
+        evaluated += 1
+        if metrics:
+            for name, ms in res.get("_timings") or []:
+                metrics.observe("field_" + name, ms / 1000)
+
+        for name in missing:
+            if res.get(name):
+                fields[name] = res[name].strip()
+        for name in want_regex:
+            if res.get(name + "_regex"):
+                candidates[name] = res[name + "_regex"]
+
+    if evaluated == 0:
+        raise RuntimeError("in-page extraction script could not run in any frame")
+    if stats:
+        stats.scanned += evaluated
+
+    _apply_regex_candidates(fields, candidates)
+    return fields
+
+
+# ========================================================
+# 엔진 3: 브라우저 프레임 (로케이터 체인, 옵션)
+# ========================================================
+# 전략마다 count / inner_text 왕복이 필요해 느리지만, 스크립트 주입이 막힌 경우를 위해 남겨둡니다.
+
+async def _loc_th_td(frame, rule):
+    th = frame.locator("th").filter(has_text=rule["label"])
+    if await th.count() > 0:
+        td = th.first.locator("xpath=following-sibling::td")
+        if await td.count() > 0:
+            return (await td.first.inner_text()).strip()
+    return None
+
+
+async def _loc_li_em(frame, rule):
+    em = frame.locator("li em.tit").filter(has_text=rule["label"])
+    if await em.count() > 0:
+        li = em.first.locator("xpath=..")
+        full = await li.inner_text()
+        return full.replace(await em.first.inner_text(), "").strip()
+    return None
+
+
+async def _loc_data_addr(frame, rule):
+    map_attr_el = frame.locator("[data-addr]").first
+    if await map_attr_el.count() > 0:
+        val = await map_attr_el.get_attribute("data-addr")
+        if val and len(val.strip()) > 5:
+            return val.strip()
+    return None
+
+
+async def _loc_region_text(frame, rule):
+    for region in REGIONS:
+        xpath_query = f"//p[starts-with(normalize-space(.), '{region}')] | //div[starts-with(normalize-space(.), '{region}')] | //span[starts-with(normalize-space(.), '{region}')]"
+        addr_el = frame.locator(xpath_query).first
+        if await addr_el.count() > 0:
+            cand_addr = normalize_space(await addr_el.inner_text())
+            if _is_addr_candidate(cand_addr):
+                return cand_addr
+    return None
+
+
+LOCATOR_STRATEGIES = {
+    "th_td": _loc_th_td,
+    "li_em": _loc_li_em,
+    "data_addr": _loc_data_addr,
+    "region_text": _loc_region_text,
+}
+
+
+async def extract_fields_with_locators(frames, stats=None, metrics=None):
+    """기존 로케이터 체인 방식 (필드/전략마다 count·inner_text 왕복, metrics에 전략별 field_<전략> 시간 기록)"""
+    fields = empty_fields()
+
+    for frame in frames:
+        if all(v != NOT_FOUND for v in fields.values()):
+            break
+        if stats:
+            stats.scanned += 1
+        for rule in FIELD_RULES:
+            if fields[rule["field"]] != NOT_FOUND:
+                continue
+            for strategy in rule["strategies"]:
+                with span(metrics, "field_" + strategy) as s:
+                    try:
+                        val = await LOCATOR_STRATEGIES[strategy](frame, rule)
+                    except Exception:
+                        val = None
+                        s.fail()
+                if val:
+                    fields[rule["field"]] = val
+                    break
+
+    # 정규식 보완 (모든 프레임의 HTML / 본문 텍스트)
+    candidates = {}
+    sources = {}
+    for rule in REGEX_RULES:
+        if not needs_regex(rule, fields[rule["field"]]):
+            continue
+        with span(metrics, "field_regex"):
+            kind = rule["regex_source"]
+            if kind not in sources:
+                parts = []
+                for frame in frames:
+                    try:
+                        parts.append(await frame.content() if kind == "html" else await frame.inner_text("body"))
+                    except Exception:
+                        pass
+                sources[kind] = ("" if kind == "html" else "\n").join(parts)
+            match = rule["regex"].search(sources[kind])
+            if match:
+                candidates[rule["field"]] = match.group(rule["regex_group"])
+
+    _apply_regex_candidates(fields, candidates)
+    return fields
+
+
+async def extract_page_fields(dtl_page, mode="inpage", stats=None, metrics=None):
+    """
+    상세 탭에서 필드 추출
+    mode="inpage": 프레임당 evaluate 1회 (기본, 실패 시 로케이터 방식으로 폴백)
+    mode="locator": 기존 로케이터 체인
+    stats: FrameStats를 주면 공고마다 탐색/건너뛴 프레임 수를 기록
+    metrics: Metrics를 주면 추출 전략별 소요 시간(field_inpage, field_th_td ... field_regex)을 기록
+             (inpage는 스크립트 안에서 잰 전략별 시간을 받아 기록)
+    """
+    frames = detail_frames(dtl_page)
+    if stats:
+        stats.postings += 1
+        stats.skipped += len(dtl_page.frames) - len(frames)
+    if mode == "inpage":
+        try:
+            with span(metrics, "field_inpage"):
+                return await extract_fields_inpage(frames, stats, metrics)
+        except Exception:
+            pass
+    return await extract_fields_with_locators(frames, stats, metrics)
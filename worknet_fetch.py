@@ -0,0 +1,88 @@
+import os
+import re
+from urllib.parse import urljoin, urlparse, parse_qs
+
+from worknet_extract import NOT_FOUND, extract_fields_from_html, find_iframe_srcs
+
+# ========================================================
+# 상세 페이지 가져오기 (HTTP 우선, 필요 시 브라우저 탭)
+# ========================================================
+# 로컬 테스트 서버(저장된 work24 페이지)로 돌리려면
+# WORKNET_BASE_URL 환경변수로 주소를 바꿔주면 됩니다.
+WORK24_BASE_URL = os.environ.get("WORKNET_BASE_URL", "https://www.work24.go.kr").rstrip("/")
+LIST_URL = WORK24_BASE_URL + "/wk/a/b/1200/retriveDtlEmpSrchList.do"
+
+# HTML만으로 이 필드들을 못 찾으면 자바스크립트 렌더링이 필요한 페이지로 판단
+REQUIRED_FIELDS = ("industry", "address")
+
+POSTING_ID_PATTERN = re.compile(r"wantedAuthNo=([A-Za-z0-9]+)")
+
+
+def posting_id_from_url(url):
+    """상세 URL에서 공고 ID(wantedAuthNo) 추출"""
+    if not url:
+        return None
+    qs = parse_qs(urlparse(url).query)
+    if qs.get("wantedAuthNo"):
+        return qs["wantedAuthNo"][0]
+    match = POSTING_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+class HttpDetailFetcher:
+    """
+    브라우저 컨텍스트의 요청 클라이언트(context.request)로 상세 HTML을 받아 파싱합니다.
+    - 컨텍스트와 쿠키/UA를 공유하고, 연결은 keep-alive로 재사용됩니다.
+    - 새 탭을 띄우지 않으므로 렌더링 비용이 없습니다.
+    - throttle(TokenBucket)을 주면 iframe 요청까지 모든 요청이 속도 제한을 거칩니다.
+    """
+
+    def __init__(self, context, timeout=10000, max_iframes=3, throttle=None):
+        self.request = context.request
+        self.timeout = timeout
+        self.max_iframes = max_iframes
+        self.throttle = throttle
+        self.http_count = 0
+        self.fallback_count = 0
+
+    async def _get(self, url, referer=None):
+        headers = {"Referer": referer} if referer else None
+        if self.throttle:
+            await self.throttle.acquire()
+        resp = await self.request.get(url, headers=headers, timeout=self.timeout)
+        if not resp.ok:
+            raise RuntimeError(f"HTTP {resp.status}: {url}")
+        return await resp.text()
+
+    async def fetch_fields(self, detail_url, on_error=None, metrics=None):
+        """
+        성공하면 필드 dict, 브라우저가 필요하면 None을 반환합니다.
+        (네트워크 오류도 None → 호출부에서 탭으로 폴백, on_error가 있으면 오류를 넘겨줌)
+        metrics를 주면 HTML 파싱의 전략별 소요 시간(field_th_td ...)을 기록
+        """
+        try:
+            html = await self._get(detail_url, referer=LIST_URL)
+            htmls = [html]
+            host = urlparse(detail_url).netloc
+            for src in find_iframe_srcs(html)[:self.max_iframes]:
+                frame_url = urljoin(detail_url, src)
+                # 광고 등 외부 도메인 iframe은 건너뜀
+                if urlparse(frame_url).netloc != host:
+                    continue
+                try:
+                    htmls.append(await self._get(frame_url, referer=detail_url))
+                except Exception:
+                    pass
+        except Exception as e:
+            self.fallback_count += 1
+            if on_error:
+                on_error(e)
+            return None
+
+        fields = extract_fields_from_html(htmls, metrics)
+        if any(fields[k] == NOT_FOUND for k in REQUIRED_FIELDS):
+            self.fallback_count += 1
+            return None
+
+        self.http_count += 1
+        return fields
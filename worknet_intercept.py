@@ -0,0 +1,113 @@
+import re
+from collections import Counter
+from urllib.parse import urlparse
+
+# ========================================================
+# 브라우저 요청 차단 정책 (리소스 종류 + 호스트 기준)
+# ========================================================
+# 예전에는 확장자(png, woff 등) 패턴만 막아서 확장자 없는 이미지 URL, 분석/광고 스크립트,
+# 동영상 등은 그대로 받았습니다. 요청의 resource_type과 호스트로 판단하고,
+# 허용 목록(ALLOW_URL_PATTERNS)에 맞는 URL은 항상 통과시킵니다.
+# (context.request로 보내는 HTTP 상세/목록 요청은 라우팅을 거치지 않음)
+
+# 막을 리소스 종류 (Playwright request.resource_type)
+# stylesheet는 is_visible() 판단에 필요하므로 막지 않음
+BLOCK_RESOURCE_TYPES = {"image", "media", "font", "texttrack", "manifest"}
+
+# 막을 호스트 (이 도메인과 하위 도메인 전부)
+BLOCK_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "adservice.google.com",
+    "facebook.net",
+    "wcs.naver.net",
+)
+
+# 종류/호스트와 상관없이 항상 허용할 URL 정규식 (예: 보안문자 이미지)
+ALLOW_URL_PATTERNS = (
+    r"captcha",
+)
+
+# 막은 요청의 절약량 추정치 (byte, 실제로 받지 않으므로 크기를 알 수 없음)
+ESTIMATED_BYTES = {
+    "image": 30_000,
+    "media": 300_000,
+    "font": 40_000,
+    "script": 50_000,
+    "texttrack": 5_000,
+    "manifest": 2_000,
+}
+DEFAULT_ESTIMATED_BYTES = 10_000
+
+
+class InterceptPolicy:
+    def __init__(self, block_types=BLOCK_RESOURCE_TYPES, block_hosts=BLOCK_HOSTS, allow_patterns=ALLOW_URL_PATTERNS):
+        self.block_types = set(block_types)
+        self.block_hosts = tuple(h.lower() for h in block_hosts)
+        self.allow_re = re.compile("|".join(allow_patterns), re.I) if allow_patterns else None
+
+        self.allowed = 0
+        self.allowed_bytes = 0
+        self.blocked_types = Counter()
+        self.blocked_hosts = Counter()
+        self.saved_bytes = 0
+
+    def reset(self):
+        """카운터 초기화 (같은 컨텍스트로 여러 번 수집할 때 실행마다 따로 집계)"""
+        self.allowed = 0
+        self.allowed_bytes = 0
+        self.blocked_types.clear()
+        self.blocked_hosts.clear()
+        self.saved_bytes = 0
+
+    def _blocked_host(self, url):
+        host = (urlparse(url).hostname or "").lower()
+        for blocked in self.block_hosts:
+            if host == blocked or host.endswith("." + blocked):
+                return blocked
+        return None
+
+    def decide(self, url, resource_type):
+        """막을 이유('type:image', 'host:doubleclick.net') 또는 None(허용)"""
+        if self.allow_re and self.allow_re.search(url):
+            return None
+        host = self._blocked_host(url)
+        if host:
+            return "host:" + host
+        if resource_type in self.block_types:
+            return "type:" + resource_type
+        return None
+
+    async def handle(self, route):
+        request = route.request
+        reason = self.decide(request.url, request.resource_type)
+        if reason is None:
+            self.allowed += 1
+            await route.continue_()
+            return
+        kind, name = reason.split(":", 1)
+        if kind == "host":
+            self.blocked_hosts[name] += 1
+        else:
+            self.blocked_types[name] += 1
+        self.saved_bytes += ESTIMATED_BYTES.get(request.resource_type, DEFAULT_ESTIMATED_BYTES)
+        await route.abort()
+
+    def on_response(self, response):
+        """허용한 요청이 받아온 크기 (Content-Length가 있는 응답만)"""
+        try:
+            self.allowed_bytes += int(response.headers.get("content-length", 0))
+        except (TypeError, ValueError):
+            pass
+
+    async def install(self, context):
+        await context.route("**/*", self.handle)
+        context.on("response", self.on_response)
+
+    def summary(self):
+        blocked = sum(self.blocked_types.values()) + sum(self.blocked_hosts.values())
+        detail = ", ".join(f"{name} {n}" for name, n in (self.blocked_types + self.blocked_hosts).most_common(6))
+        return (f"허용 {self.allowed}건({self.allowed_bytes / 1024 / 1024:.1f}MB) / 차단 {blocked}건"
+                f"(절약 추정 {self.saved_bytes / 1024 / 1024:.1f}MB){' - ' + detail if detail else ''}")
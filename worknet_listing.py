@@ -0,0 +1,323 @@
+import asyncio
+import hashlib
+import math
+import re
+from urllib.parse import urlencode, urljoin
+
+from worknet_fetch import LIST_URL, posting_id_from_url
+from worknet_extract import parse_html
+from worknet_metrics import span
+
+# ========================================================
+# 목록 페이지 파싱 (한 번의 evaluate로 모든 행 추출)
+# ========================================================
+# 행마다 제목/회사/급여/지역/시간을 따로 await 하면 행당 10회 이상 왕복이 생깁니다.
+# 페이지의 모든 tr[id^="list"] 행을 브라우저 안에서 한 번에 읽어 dict 목록으로 돌려받습니다.
+
+LIST_ROW_SELECTOR = 'tr[id^="list"]'
+
+# 목록 한 페이지의 공고 수 (resultCnt, 사이트 기본 10건보다 크게 받아 페이지 수를 줄임)
+LIST_PAGE_SIZE = 50
+
+# 최신 등록순 정렬 (증분 수집은 새 공고부터 보다가 이미 본 페이지에서 멈춤)
+# [주의] sortField=DATE / sortOrderBy=DESC 는 사이트에서 확인하지 않은 추정값입니다.
+# 사이트가 이 파라미터를 무시하면 기본 정렬로 내려오므로, 이미 본 공고만 있는 페이지가
+# 최신 공고 페이지보다 먼저 나올 수 있고 증분 수집이 엉뚱한 페이지에서 멈춥니다.
+# 실제 목록 화면에서 '등록일순' 정렬 시 붙는 쿼리 파라미터를 확인한 뒤 바꿔 주세요.
+SORT_NEWEST = {"sortField": "DATE", "sortOrderBy": "DESC"}
+
+
+def list_url(params=None):
+    """검색 조건(쿼리 파라미터)을 붙인 목록 URL"""
+    return LIST_URL + ("?" + urlencode(params) if params else "")
+
+
+def list_page_url(page_num, params=None, page_size=LIST_PAGE_SIZE):
+    """특정 목록 페이지로 바로 가는 URL (pageIndex는 1부터, resultCnt는 페이지당 공고 수)"""
+    return list_url(dict(params or {}, pageIndex=page_num, resultCnt=page_size))
+
+
+LIST_ROWS_JS = r"""
+() => {
+    const text = (el) => (el ? (el.textContent || "").trim() : null);
+    return Array.from(document.querySelectorAll('tr[id^="list"]')).map((row, index) => {
+        const titleEl = row.querySelector("a.t3_sb") || row.querySelector("td.link a");
+
+        const salaryParts = Array.from(row.querySelectorAll("li.dollar span.item.b1_sb"))
+            .map((el) => (el.textContent || "").trim())
+            .filter((t) => t);
+        const locEl = row.querySelector("li.site p") || row.querySelector("li.site");
+
+        // 상세 URL: href 우선, javascript: 링크면 onclick 안의 경로 사용
+        let detailUrl = null;
+        if (titleEl) {
+            const href = titleEl.getAttribute("href") || "";
+            if (href && !href.startsWith("javascript") && href !== "#") {
+                detailUrl = titleEl.href;
+            } else {
+                const m = (titleEl.getAttribute("onclick") || "").match(/['"]([^'"]*empDetail[^'"]*)['"]/);
+                if (m) detailUrl = new URL(m[1], location.href).href;
+            }
+        }
+
+        return {
+            index: index,
+            row_id: row.id,
+            title: text(titleEl) ?? "N/A",
+            company: text(row.querySelector(".cp_name")) ?? "N/A",
+            salary: salaryParts.length ? salaryParts.join(" / ").replace(/\s+/g, " ").trim() : "N/A",
+            location: text(locEl) ?? "N/A",
+            schedule: text(row.querySelector("li.time")) ?? "N/A",
+            detail_url: detailUrl,
+        };
+    });
+}
+"""
+
+
+async def parse_list_rows(page):
+    """
+    현재 목록 페이지의 모든 행을 한 번에 추출합니다.
+    반환: [{index, row_id, title, company, salary, location, schedule, detail_url, posting_id}, ...]
+    """
+    rows = await page.evaluate(LIST_ROWS_JS)
+    for row in rows:
+        row["posting_id"] = posting_id_from_url(row["detail_url"])
+    return rows
+
+
+# ========================================================
+# 목록 HTML 파싱 (브라우저 없이, LIST_ROWS_JS와 같은 규칙)
+# ========================================================
+EMP_DETAIL_ONCLICK = re.compile(r"""['"]([^'"]*empDetail[^'"]*)['"]""")
+
+
+def _find(node, tag, classes=()):
+    """node 하위에서 태그/클래스가 맞는 첫 엘리먼트 (querySelector 근사치)"""
+    for child in node.iter():
+        if child is not node and child.tag == tag and all(c in child.classes() for c in classes):
+            return child
+    return None
+
+
+def _find_all(node, tag, classes=()):
+    return [child for child in node.iter()
+            if child is not node and child.tag == tag and all(c in child.classes() for c in classes)]
+
+
+def _site_text(row):
+    site = _find(row, "li", ("site",))
+    if site is None:
+        return "N/A"
+    p_el = _find(site, "p")
+    return (p_el if p_el is not None else site).text().strip()
+
+
+def _title_element(row):
+    title_el = _find(row, "a", ("t3_sb",))
+    if title_el is None:
+        link_td = _find(row, "td", ("link",))
+        title_el = _find(link_td, "a") if link_td is not None else None
+    return title_el
+
+
+def _detail_url(title_el, base_url):
+    href = title_el.attrs.get("href", "")
+    if href and not href.startswith("javascript") and href != "#":
+        return urljoin(base_url, href)
+    match = EMP_DETAIL_ONCLICK.search(title_el.attrs.get("onclick", ""))
+    return urljoin(base_url, match.group(1)) if match else None
+
+
+def parse_list_html(html, base_url=LIST_URL):
+    """목록 페이지 HTML → parse_list_rows와 같은 형식의 행 목록"""
+    root = parse_html(html)
+    rows = []
+    for tr in root.iter():
+        if tr.tag != "tr" or not tr.attrs.get("id", "").startswith("list"):
+            continue
+        title_el = _title_element(tr)
+        company_el = next((el for el in tr.iter() if "cp_name" in el.classes()), None)
+        time_el = _find(tr, "li", ("time",))
+
+        salary_parts = []
+        for dollar in _find_all(tr, "li", ("dollar",)):
+            for span in _find_all(dollar, "span", ("item", "b1_sb")):
+                part = span.text().strip()
+                if part:
+                    salary_parts.append(part)
+
+        detail_url = _detail_url(title_el, base_url) if title_el is not None else None
+        rows.append({
+            "index": len(rows),
+            "row_id": tr.attrs.get("id"),
+            "title": title_el.text().strip() if title_el is not None else "N/A",
+            "company": company_el.text().strip() if company_el is not None else "N/A",
+            "salary": " ".join(" / ".join(salary_parts).split()) if salary_parts else "N/A",
+            "location": _site_text(tr),
+            "schedule": time_el.text().strip() if time_el is not None else "N/A",
+            "detail_url": detail_url,
+            "posting_id": posting_id_from_url(detail_url),
+        })
+    return rows
+
+
+# ========================================================
+# 목록 페이지 미리 받기 (URL 직접 접근 + 제한된 동시 요청)
+# ========================================================
+# '다음' 버튼 클릭 + networkidle + 고정 2초 대기를 없애고, pageIndex/resultCnt로
+# 목록 페이지를 바로 요청합니다. 상세 수집이 도는 동안 다음 몇 페이지를 미리 받아 둡니다.
+
+class ListPrefetcher:
+    """
+    목록 페이지를 순서대로 내보내면서 최대 ahead개 페이지를 동시에 받아 둡니다.
+    - 기본은 context.request로 HTML을 받아 파싱 (탭 없음)
+    - HTTP 응답에 목록이 없으면(자바스크립트 렌더링) 탭으로 열어 파싱하고, 이후로는 탭 방식 사용
+    - throttle(TokenBucket)을 주면 페이지 요청마다 속도 제한을 거칩니다.
+    - pages(PagePool)를 주면 탭을 새로 만들지 않고 풀에서 빌려 씁니다.
+    - metrics(Metrics)를 주면 list_load / list_parse 소요 시간을 기록합니다.
+    """
+
+    def __init__(self, context, params=None, page_size=LIST_PAGE_SIZE, ahead=3, timeout=15000, log=print,
+                 throttle=None, pages=None, metrics=None):
+        self.context = context
+        self.metrics = metrics
+        self.throttle = throttle
+        self.page_pool = pages
+        self.params = params
+        self.page_size = page_size
+        self.ahead = max(1, ahead)
+        self.timeout = timeout
+        self.log = log
+        self.use_browser = False
+        self.http_pages = 0
+        self.browser_pages = 0
+        self._inflight = {}
+
+    def url(self, page_num):
+        return list_page_url(page_num, self.params, self.page_size)
+
+    async def _fetch_http(self, url):
+        if self.throttle:
+            await self.throttle.acquire()
+        with span(self.metrics, "list_load"):
+            resp = await self.context.request.get(url, headers={"Referer": LIST_URL}, timeout=self.timeout)
+            if not resp.ok:
+                raise RuntimeError(f"HTTP {resp.status}")
+            html = await resp.text()
+        with span(self.metrics, "list_parse"):
+            return parse_list_html(html, url)
+
+    async def _fetch_browser(self, url):
+        page = await self.page_pool.acquire() if self.page_pool else await self.context.new_page()
+        try:
+            if self.throttle:
+                await self.throttle.acquire()
+            with span(self.metrics, "list_load") as s:
+                await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
+                try:
+                    await page.wait_for_selector(LIST_ROW_SELECTOR, state="attached", timeout=5000)
+                except Exception:
+                    s.fail()
+                    return []
+            with span(self.metrics, "list_parse"):
+                return await parse_list_rows(page)
+        finally:
+            if self.page_pool:
+                await self.page_pool.release(page)
+            else:
+                try: await page.close()
+                except: pass
+
+    async def fetch_rows(self, page_num):
+        """한 페이지의 행 목록 (실패하거나 목록 끝이면 빈 목록)"""
+        url = self.url(page_num)
+        if not self.use_browser:
+            try:
+                rows = await self._fetch_http(url)
+                if rows:
+                    self.http_pages += 1
+                    return rows
+            except Exception as e:
+                self.log(f"  [목록] {page_num}페이지 HTTP 요청 실패: {e}")
+        try:
+            rows = await self._fetch_browser(url)
+        except Exception as e:
+            self.log(f"  [목록] {page_num}페이지 로딩 실패: {e}")
+            return []
+        if rows:
+            self.browser_pages += 1
+            if not self.use_browser:
+                self.use_browser = True
+                self.log("  [목록] HTTP 응답에 목록이 없어 이후 페이지는 브라우저로 읽습니다.")
+        return rows
+
+    async def pages(self, start_page=1, end_page=None):
+        """(페이지 번호, 행 목록)을 순서대로 내보냄. 빈 페이지(목록 끝)나 end_page에서 멈춤"""
+        next_page = start_page
+        current = start_page
+        while end_page is None or current <= end_page:
+            while len(self._inflight) < self.ahead and (end_page is None or next_page <= end_page):
+                self._inflight[next_page] = asyncio.create_task(self.fetch_rows(next_page))
+                next_page += 1
+            rows = await self._inflight.pop(current)
+            yield current, rows
+            if not rows:
+                return
+            current += 1
+
+    def cancel(self):
+        """목표를 채워 일찍 멈췄을 때 미리 받던 페이지 요청 취소"""
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+
+
+def job_basic_from_row(row):
+    """목록 행 → 엑셀에 저장할 기본 데이터"""
+    return {
+        "title": row["title"],
+        "company": row["company"],
+        "salary": row["salary"],
+        "location": row["location"],
+        "schedule": row["schedule"],
+        "posting_id": row["posting_id"] or "",
+    }
+
+
+def row_title_locator(page, row):
+    """Ctrl+클릭으로 탭을 열어야 할 때 쓰는 제목 링크 로케이터"""
+    row_el = page.locator(LIST_ROW_SELECTOR).nth(row["index"])
+    return row_el.locator("a.t3_sb, td.link a").first
+
+
+def row_fingerprint(row):
+    """목록 행 내용의 지문 (제목/회사/급여/지역/시간이 바뀌면 달라짐)"""
+    key = "\x1f".join(str(row.get(k, "")) for k in ("title", "company", "salary", "location", "schedule"))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def row_key(row):
+    """목록 단계 중복 제거용 공고 키 (공고 ID, ID를 못 읽은 행은 행 지문)"""
+    return row.get("posting_id") or "row:" + row_fingerprint(row)
+
+
+def plan_shards(target_count, workers, page_size=LIST_PAGE_SIZE, first_page=1):
+    """
+    목표 개수를 채우는 목록 페이지 범위를 workers개로 연속 분할합니다.
+    반환: [(시작 페이지, 끝 페이지, 해당 구간 목표 개수), ...]
+    """
+    total_pages = max(1, math.ceil(target_count / page_size))
+    workers = max(1, min(workers, total_pages))
+    base, extra = divmod(total_pages, workers)
+
+    shards = []
+    start = first_page
+    remaining = target_count
+    for i in range(workers):
+        pages = base + (1 if i < extra else 0)
+        count = min(pages * page_size, remaining)
+        shards.append((start, start + pages - 1, count))
+        start += pages
+        remaining -= count
+    return shards
@@ -0,0 +1,172 @@
+import json
+import os
+import random
+import time
+
+# ========================================================
+# 단계별 소요 시간 측정 (p50/p95/p99, 횟수, 오류) / JSON·Prometheus 텍스트 내보내기
+# ========================================================
+# 목록 로딩, 행 파싱, 탭 열기, 상세 로딩, 기업정보 탭, 필드 추출 전략, 엑셀 저장 등
+# 단계마다 걸린 시간을 모아 실행 중에는 interval초마다, 끝날 때 한 번 더 파일로 씁니다.
+#   - path (예: worknet_metrics.json): 단계별 요약 JSON
+#   - 같은 이름의 .prom 파일: Prometheus 텍스트 형식 (node_exporter textfile collector 등에서 읽음)
+# CLI(worknet_crawler_fixed.py)와 GUI(CrawlerLogic)는 아래 단계 이름을 똑같이 사용합니다.
+#
+# 단계 이름
+#   list_load      목록 페이지 받기 (HTTP 또는 탭)
+#   list_parse     목록 행 파싱
+#   detail_http    HTTP로 상세 HTML 받기 + 파싱
+#   tab_open       상세 탭 열기 (Ctrl+클릭 또는 풀 탭 이동)
+#   detail_load    상세 탭 로딩 대기 (DOM + 필드 라벨)
+#   corp_tab       기업정보 탭 클릭 + 대기
+#   field_<전략>   필드 추출 (field_inpage, field_th_td, field_li_em, field_data_addr, field_region_text, field_regex)
+#   excel_save     엑셀 변환
+#   export_<형식>  분석용 내보내기 (export_parquet, export_feather, export_csv)
+
+DEFAULT_METRICS_PATH = "worknet_metrics.json"
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class _Span:
+    """with 블록의 소요 시간을 기록. 예외가 나거나 fail()을 부르면 오류로 집계"""
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+        self.error = False
+
+    def fail(self):
+        self.error = True
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start, self.error or exc_type is not None)
+        return False
+
+
+class _NullSpan:
+    def fail(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(metrics, stage):
+    """metrics가 None이면 아무것도 기록하지 않는 span (라이브러리 함수에서 측정을 선택적으로)"""
+    return metrics.span(stage) if metrics else _NULL_SPAN
+
+
+def _quantile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class Metrics:
+    def __init__(self, path=DEFAULT_METRICS_PATH, interval=30, max_samples=5000):
+        """
+        path: JSON 파일 경로 (None이면 파일로 쓰지 않음), Prometheus 텍스트는 확장자만 .prom
+        interval: 실행 중 maybe_export()가 실제로 쓰는 최소 간격 (초)
+        max_samples: 단계별로 보관할 표본 수 (넘으면 무작위 표본 추출로 메모리 고정)
+        """
+        self.path = path
+        self.prom_path = os.path.splitext(path)[0] + ".prom" if path else None
+        self.interval = interval
+        self.max_samples = max_samples
+        self.started = time.time()
+        self.stages = {}
+        self._last_export = time.monotonic()
+
+    def span(self, stage):
+        return _Span(self, stage)
+
+    def observe(self, stage, seconds, error=False):
+        rec = self.stages.get(stage)
+        if rec is None:
+            rec = self.stages[stage] = {"count": 0, "errors": 0, "sum": 0.0, "max": 0.0, "samples": []}
+        rec["count"] += 1
+        rec["sum"] += seconds
+        rec["max"] = max(rec["max"], seconds)
+        if error:
+            rec["errors"] += 1
+        samples = rec["samples"]
+        if len(samples) < self.max_samples:
+            samples.append(seconds)
+        else:
+            i = random.randrange(rec["count"])
+            if i < self.max_samples:
+                samples[i] = seconds
+
+    def snapshot(self):
+        stages = {}
+        for stage, rec in self.stages.items():
+            values = sorted(rec["samples"])
+            stages[stage] = {
+                "count": rec["count"],
+                "errors": rec["errors"],
+                "sum": round(rec["sum"], 6),
+                "max": round(rec["max"], 6),
+                **{f"p{int(q * 100)}": round(_quantile(values, q), 6) for q in QUANTILES},
+            }
+        return {
+            "started_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+            "elapsed": round(time.time() - self.started, 3),
+            "stages": stages,
+        }
+
+    def prometheus_text(self, snap=None):
+        snap = snap or self.snapshot()
+        lines = [
+            "# HELP worknet_stage_seconds Time spent per crawl stage.",
+            "# TYPE worknet_stage_seconds summary",
+        ]
+        for stage, s in snap["stages"].items():
+            for q in QUANTILES:
+                lines.append(f'worknet_stage_seconds{{stage="{stage}",quantile="{q}"}} {s[f"p{int(q * 100)}"]}')
+            lines.append(f'worknet_stage_seconds_sum{{stage="{stage}"}} {s["sum"]}')
+            lines.append(f'worknet_stage_seconds_count{{stage="{stage}"}} {s["count"]}')
+        lines += [
+            "# HELP worknet_stage_errors_total Failed or timed out spans per crawl stage.",
+            "# TYPE worknet_stage_errors_total counter",
+        ]
+        for stage, s in snap["stages"].items():
+            lines.append(f'worknet_stage_errors_total{{stage="{stage}"}} {s["errors"]}')
+        return "\n".join(lines) + "\n"
+
+    def maybe_export(self):
+        """마지막으로 쓴 뒤 interval초가 지났으면 파일로 씀"""
+        if time.monotonic() - self._last_export >= self.interval:
+            self.export()
+
+    def export(self):
+        """JSON / Prometheus 텍스트 파일을 임시 파일에 쓰고 교체 (읽는 쪽이 반쯤 쓴 파일을 보지 않게)"""
+        self._last_export = time.monotonic()
+        if not self.path:
+            return
+        snap = self.snapshot()
+        for path, text in ((self.path, json.dumps(snap, ensure_ascii=False, indent=2)),
+                           (self.prom_path, self.prometheus_text(snap))):
+            tmp = path + ".tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp, path)
+            except OSError:
+                pass
+
+    def summary_lines(self):
+        lines = []
+        for stage, s in self.snapshot()["stages"].items():
+            lines.append(f"{stage}: {s['count']}회, p50 {s['p50'] * 1000:.0f}ms / p95 {s['p95'] * 1000:.0f}ms / "
+                         f"p99 {s['p99'] * 1000:.0f}ms, 오류 {s['errors']}회")
+        return lines
@@ -0,0 +1,116 @@
+import asyncio
+
+# ========================================================
+# 재사용 탭 풀 (탭을 매번 새로 만들고 닫지 않음)
+# ========================================================
+# HTTP로 못 읽은 상세 페이지, 브라우저로 읽어야 하는 목록 페이지는 그동안
+# new_page() → goto → close() 를 공고마다 반복했습니다.
+# 풀에서 탭을 빌려 goto로 이동하고, 다 쓰면 about:blank로 비워서 돌려놓습니다.
+#   - 빌려줄 때 상태 확인 (닫혔거나 응답이 없으면 새 탭으로 교체)
+#   - max_uses번 쓴 탭은 메모리 누적을 막기 위해 새 탭으로 교체
+#   - 최대 size개까지만 만들고, 모두 사용 중이면 반납될 때까지 대기
+
+
+class PagePool:
+    def __init__(self, context, size=4, max_uses=50, health_timeout=2.0):
+        self.context = context
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.health_timeout = health_timeout
+        self.created = 0
+        self.borrowed = 0
+        self.replaced = 0
+        self._uses = {}
+        self._idle = []
+        self._count = 0
+        self._cond = None
+        self._closed = False
+
+    async def _new_page(self):
+        page = await self.context.new_page()
+        self.created += 1
+        self._uses[page] = 0
+        return page
+
+    async def _discard(self, page):
+        self._uses.pop(page, None)
+        try: await page.close()
+        except: pass
+
+    async def _healthy(self, page):
+        if page.is_closed() or self._uses.get(page, 0) >= self.max_uses:
+            return False
+        try:
+            await asyncio.wait_for(page.evaluate("1"), self.health_timeout)
+            return True
+        except Exception:
+            return False
+
+    async def warm(self, count):
+        """미리 count개 탭을 만들어 둠"""
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        while self._count < min(count, self.size):
+            self._count += 1
+            page = await self._new_page()
+            async with self._cond:
+                self._idle.append(page)
+                self._cond.notify()
+
+    async def acquire(self):
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        async with self._cond:
+            while not self._idle and self._count >= self.size:
+                await self._cond.wait()
+            if self._idle:
+                page = self._idle.pop()
+            else:
+                # 자리를 먼저 잡아 두고 락 밖에서 탭 생성 (생성이 직렬화되지 않게)
+                self._count += 1
+                page = None
+
+        try:
+            if page is None:
+                page = await self._new_page()
+            elif not await self._healthy(page):
+                self.replaced += 1
+                await self._discard(page)
+                page = await self._new_page()
+        except Exception:
+            await self._give_back_slot()
+            raise
+        self.borrowed += 1
+        self._uses[page] += 1
+        return page
+
+    async def _give_back_slot(self):
+        async with self._cond:
+            self._count -= 1
+            self._cond.notify()
+
+    async def release(self, page, healthy=True):
+        """다 쓴 탭 반납 (healthy=False면 닫고 다음에 새로 만듦)"""
+        if healthy and not self._closed and not page.is_closed():
+            try:
+                await page.goto("about:blank")
+            except Exception:
+                healthy = False
+        else:
+            healthy = False
+        if not healthy:
+            await self._discard(page)
+            await self._give_back_slot()
+            return
+        async with self._cond:
+            self._idle.append(page)
+            self._cond.notify()
+
+    async def close(self):
+        self._closed = True
+        for page in list(self._uses):
+            await self._discard(page)
+        self._idle.clear()
+
+    def summary(self):
+        return f"탭 {self.created}개 생성, {self.borrowed}회 대여, {self.replaced}개 교체 (최대 {self.size}개)"
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import os
+import random
+import time
+
+# ========================================================
+# 실패한 상세 수집 재시도 (지수 백오프 + 재시도 예산) / 실패 보관 파일
+# ========================================================
+# 일시적인 타임아웃 때문에 공고가 그대로 버려지지 않도록, 실패한 공고를
+# base_delay * 2^(시도-1) (+ 약간의 무작위) 뒤에 다시 예약합니다.
+#   - 공고당 최대 max_attempts회
+#   - 실행 전체에서 재시도는 budget회까지 (사이트가 죽었을 때 재시도 폭주 방지)
+#   - 동시에 대기 중인 재시도는 max_pending개까지
+# 끝내 실패한 공고는 실패 보관 파일(JSONL)에 남기고, --replay-dead-letter 로 그 공고만 다시 수집합니다.
+
+DEFAULT_DEAD_LETTER_PATH = "worknet_dead_letter.jsonl"
+
+
+class RetryQueue:
+    def __init__(self, max_attempts=3, base_delay=2.0, max_delay=60.0, budget=200, max_pending=100,
+                 dead_letter_path=DEFAULT_DEAD_LETTER_PATH, log=print):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.max_pending = max_pending
+        self.dead_letter_path = dead_letter_path
+        self.log = log
+
+        self.retried = 0
+        self.dead = 0
+        self._tasks = set()
+
+    def delay(self, attempt):
+        """attempt번째 시도가 실패한 뒤 기다릴 시간 (초)"""
+        base = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return base * random.uniform(0.8, 1.2)
+
+    def submit(self, attempt, retry, row, error):
+        """
+        재시도 가능하면 delay 뒤에 retry(attempt + 1)을 예약하고 True.
+        횟수/예산/대기열 한도를 넘으면 실패 보관 파일에 기록하고 False.
+        """
+        reason = None
+        if attempt >= self.max_attempts:
+            reason = f"{attempt}회 실패"
+        elif self.retried >= self.budget:
+            reason = "재시도 예산 소진"
+        elif len(self._tasks) >= self.max_pending:
+            reason = "재시도 대기열 가득 참"
+        if reason:
+            self.dead_letter(row, error, attempt, reason)
+            return False
+
+        self.retried += 1
+        wait = self.delay(attempt)
+        self.log(f"  [재시도 예약] {str(row.get('title', ''))[:10]}... {wait:.1f}초 뒤 {attempt + 1}번째 시도 ({error})")
+        task = asyncio.ensure_future(self._later(wait, retry, attempt + 1))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _later(self, wait, retry, attempt):
+        await asyncio.sleep(wait)
+        await retry(attempt)
+
+    async def drain(self):
+        """예약된 재시도가 모두 끝날 때까지 대기 (재시도가 다시 재시도를 예약할 수 있음)"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def cancel(self):
+        """오류로 실행을 끝낼 때 대기 중인 재시도 취소 (해당 공고는 체크포인트에 미완료로 남음)"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def dead_letter(self, row, error, attempts, reason=""):
+        self.dead += 1
+        record = {
+            "row": row,
+            "error": str(error)[:300],
+            "attempts": attempts,
+            "reason": reason,
+            "failed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        try:
+            with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError:
+            pass
+
+    def summary(self):
+        return f"재시도 {self.retried}건 (예산 {self.budget}) / 최종 실패 {self.dead}건 → {self.dead_letter_path}"
+
+
+def take_dead_letters(path=DEFAULT_DEAD_LETTER_PATH):
+    """
+    실패 보관 파일의 공고 목록을 읽고 내용은 .bak 에 이어 붙인 뒤 원본을 지웁니다
+    (재수집 중 다시 실패하면 새 파일에 쌓임, .bak 에는 지금까지 재수집한 실패 기록이 모두 남음).
+    같은 공고가 여러 번 있으면 마지막 것만 사용합니다 (공고 ID도 상세 URL도 없는 행은 줄마다 따로).
+    """
+    rows = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        try:
+            row = json.loads(line)["row"]
+        except (ValueError, KeyError, TypeError):
+            continue
+        rows[row.get("posting_id") or row.get("detail_url") or f"line:{line_no}"] = row
+    try:
+        with open(path + ".bak", "a", encoding="utf-8") as bak:
+            bak.write(text if text.endswith("\n") or not text else text + "\n")
+        os.remove(path)
+    except OSError:
+        pass
+    return list(rows.values())
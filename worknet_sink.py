@@ -0,0 +1,240 @@
+import json
+import os
+import re
+import zipfile
+
+# ========================================================
+# 수집 결과 스트리밍 저장 (JSONL) → 마지막에 엑셀 변환
+# ========================================================
+# 결과를 메모리 리스트에 모아두지 않고 공고 하나가 끝날 때마다 JSONL 파일에 추가합니다.
+# 중간에 프로그램이 죽어도 그때까지 수집한 결과는 파일에 남습니다.
+# 엑셀 변환은 JSONL을 EXPORT_CHUNK_ROWS 줄씩 읽어 컬럼 단위로 정제/이스케이프한 뒤
+# 시트 XML을 xlsx(zip) 안에 바로 이어 씁니다. 전체 결과를 다시 메모리에 올리지 않으므로
+# 결과 크기와 상관없이 메모리 사용량이 일정합니다.
+# (openpyxl write-only 모드도 셀마다 XML 요소를 만들어 직렬화하느라 변환 시간의 대부분을 차지했음)
+
+# (내부 키, 엑셀 컬럼명) - 엑셀 컬럼 순서
+COLUMNS = [
+    ("title", "채용공고명"),
+    ("company", "업체명"),
+    ("salary", "급여"),
+    ("location", "지역"),
+    ("schedule", "근무시간"),
+    ("posting_id", "구인인증번호"),
+    ("industry", "업종"),
+    ("employees", "인원수"),
+    ("fax", "팩스번호"),
+    ("address", "주소"),
+]
+
+CONTROL_CHARS = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]')
+MAX_CELL_LEN = 32000
+
+# 엑셀 변환 시 한 번에 읽어 정제할 행 수
+EXPORT_CHUNK_ROWS = 1000
+
+
+# 텍스트 정제 함수 (엑셀에 들어갈 수 없는 제어문자 제거, 셀 길이 제한)
+def clean_text(text):
+    if not isinstance(text, str):
+        return str(text)
+    text = CONTROL_CHARS.sub('', text)
+    if len(text) > MAX_CELL_LEN:
+        text = text[:MAX_CELL_LEN] + "..."
+    return text
+
+
+def clean_column(values):
+    """
+    한 컬럼의 값 목록을 한 번에 정제 (clean_text와 같은 결과)
+    셀마다 정규식을 돌리지 않고 컬럼 전체를 합친 문자열에서 제어문자를 한 번 찾고,
+    최대 길이도 한 번에 확인해서 걸리는 컬럼만 셀 단위로 고칩니다. (대부분의 컬럼은 그대로 통과)
+    """
+    values = [v if isinstance(v, str) else str(v) for v in values]
+    # 구분자 \n 은 CONTROL_CHARS에 포함되지 않음
+    if CONTROL_CHARS.search("\n".join(values)):
+        values = [CONTROL_CHARS.sub('', v) for v in values]
+    if max(map(len, values), default=0) > MAX_CELL_LEN:
+        values = [v[:MAX_CELL_LEN] + "..." if len(v) > MAX_CELL_LEN else v for v in values]
+    return values
+
+
+def escape_column(values):
+    """
+    정제된 컬럼 값들을 한 번에 XML 이스케이프
+    (clean_column을 거친 값에는 \x00이 없으므로 \x00으로 합쳤다가 다시 나눔)
+    \r은 그대로 쓰면 XML 줄바꿈 정규화로 \r\n → \n이 되므로 문자 참조(&#13;)로 씀
+    """
+    joined = "\x00".join(values)
+    joined = joined.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    joined = joined.replace("\r", "&#13;")
+    return joined.split("\x00")
+
+
+def iter_chunks(records, size=EXPORT_CHUNK_ROWS):
+    """레코드를 size개씩 묶어서 내보냄"""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ResultSink:
+    """
+    완료된 공고를 JSONL 파일에 batch_size 건씩 모아서 기록합니다.
+    append=False면 새로 시작(기존 파일 덮어씀), True면 이어쓰기.
+    """
+
+    def __init__(self, path, batch_size=20, append=False):
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0
+        self._buffer = []
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, record):
+        self._buffer.append(json.dumps(record, ensure_ascii=False))
+        self.count += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        self._file.write("\n".join(self._buffer) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._buffer = []
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+
+
+def iter_records(path):
+    """JSONL 결과를 한 줄씩 읽기 (중간에 끊긴 마지막 줄은 무시)"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def merge_results(paths, out_path):
+    """
+    여러 JSONL 결과(분할 수집 워커별 출력)를 순서대로 하나로 합칩니다.
+    같은 공고 ID는 처음 것만 남깁니다. 합친 건수를 반환합니다.
+    """
+    seen_ids = set()
+    sink = ResultSink(out_path)
+    try:
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            for record in iter_records(path):
+                posting_id = record.get("posting_id")
+                if posting_id:
+                    if posting_id in seen_ids:
+                        continue
+                    seen_ids.add(posting_id)
+                sink.write(record)
+    finally:
+        sink.close()
+    return sink.count
+
+
+# ========================================================
+# xlsx 스트리밍 기록 (시트 1개, 문자열 셀만)
+# ========================================================
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+XLSX_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+def _column_letter(index):
+    """0 → A, 25 → Z, 26 → AA"""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _sheet_rows(rows, first_row):
+    """이스케이프된 값 행들 → <row> XML 문자열"""
+    letters = [_column_letter(i) for i in range(len(COLUMNS))]
+    parts = []
+    for n, row in enumerate(rows, first_row):
+        parts.append(f'<row r="{n}">')
+        for letter, value in zip(letters, row):
+            parts.append(f'<c r="{letter}{n}" t="inlineStr"><is><t xml:space="preserve">{value}</t></is></c>')
+        parts.append('</row>')
+    return "".join(parts)
+
+
+def export_excel(jsonl_path, xlsx_path, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    JSONL 결과 → 엑셀. 저장한 행 수를 반환합니다.
+    chunk_rows 행씩 읽어 컬럼 단위로 정제(clean_column)/이스케이프(escape_column)하고
+    시트 XML을 zip 안에 바로 이어 씁니다 (메모리에는 한 묶음만 남음).
+    """
+    rows = 0
+    with zipfile.ZipFile(xlsx_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        zf.writestr("[Content_Types].xml", XLSX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", XLSX_ROOT_RELS)
+        zf.writestr("xl/workbook.xml", XLSX_WORKBOOK)
+        zf.writestr("xl/_rels/workbook.xml.rels", XLSX_WORKBOOK_RELS)
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as raw:
+            def write(text):
+                # 짝이 안 맞는 서로게이트 등 UTF-8로 못 쓰는 문자는 ?로
+                raw.write(text.encode("utf-8", "replace"))
+
+            write(XLSX_SHEET_HEAD)
+            write(_sheet_rows([escape_column([name for _, name in COLUMNS])], 1))
+            for chunk in iter_chunks(iter_records(jsonl_path), chunk_rows):
+                columns = [escape_column(clean_column([record.get(key, "") for record in chunk])) for key, _ in COLUMNS]
+                write(_sheet_rows(zip(*columns), rows + 2))
+                rows += len(chunk)
+            write(XLSX_SHEET_TAIL)
+    return rows
@@ -0,0 +1,180 @@
+import asyncio
+import time
+
+from worknet_extract import FIELD_RULES, detail_frames
+
+# ========================================================
+# 이벤트 기반 로딩 대기 (고정 sleep 대신)
+# ========================================================
+# 상세 탭의 sleep(0.3), 기업정보 탭 클릭 후 sleep(0.5) 대신
+# 필드 라벨(업종/주소 등)이 어느 프레임에든 붙는 순간 바로 다음 단계로 넘어갑니다.
+# 기업정보 탭은 라벨이 이미 붙어 있는 페이지에서 누르므로, 클릭이 일으킨 요청이 끝나고
+# DOM 변경이 잠잠해질 때까지 기다립니다 (settle_after).
+# 대기마다 타임아웃이 있고, 이름별로 걸린 시간/타임아웃 횟수를 기록합니다.
+
+# 시간 단위: ms
+DETAIL_LOAD_TIMEOUT = 10000
+FIELDS_READY_TIMEOUT = 3000
+CORP_TAB_TIMEOUT = 2000
+# 필드 대기 중 새로 주소가 정해진 iframe을 확인하는 간격
+FRAME_POLL_MS = 100
+# 진행 중인 요청이 없고 DOM 변경이 이 시간 동안 없으면 로딩이 끝난 것으로 봄
+SETTLE_QUIET_MS = 150
+SETTLE_POLL_MS = 50
+
+# 메인 프레임 DOM의 마지막 변경 시각 기록 (performance.now() 기준)
+_OBSERVE_MUTATIONS_JS = """
+() => {
+    window.__worknetLastMutation = performance.now();
+    if (window.__worknetObserver) return;
+    window.__worknetObserver = new MutationObserver(() => { window.__worknetLastMutation = performance.now(); });
+    window.__worknetObserver.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+"""
+_QUIET_FOR_JS = "() => performance.now() - (window.__worknetLastMutation || 0)"
+
+
+def _css_string(pattern):
+    return pattern.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _ready_selector():
+    """규칙 표의 라벨로 '필드가 화면에 붙었는지' 확인하는 셀렉터 생성"""
+    parts = []
+    for rule in FIELD_RULES:
+        label = _css_string(rule["label"].pattern)
+        for strategy in rule["strategies"]:
+            if strategy == "th_td":
+                parts.append(f'th:text-matches("{label}")')
+            elif strategy == "li_em":
+                parts.append(f'li em:text-matches("{label}")')
+            elif strategy == "data_addr":
+                parts.append("[data-addr]")
+    return ", ".join(dict.fromkeys(parts))
+
+
+FIELDS_READY_SELECTOR = _ready_selector()
+
+
+async def wait_for_fields(dtl_page, timeout=FIELDS_READY_TIMEOUT):
+    """
+    메인 프레임이나 같은 사이트 iframe 중 한 곳에라도 필드 라벨이 나타나면 바로 반환합니다.
+    timeout 안에 어디에도 없으면 asyncio.TimeoutError.
+    domcontentloaded 직후에는 상세 iframe이 아직 about:blank(주소 확정 전)일 수 있으므로
+    FRAME_POLL_MS마다 프레임 목록을 다시 보고, 새로 주소가 정해진 같은 사이트 iframe에도 대기를 겁니다.
+    """
+    deadline = time.monotonic() + timeout / 1000
+    waiters = {}
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for frame in detail_frames(dtl_page):
+                if frame not in waiters:
+                    waiters[frame] = asyncio.ensure_future(
+                        frame.wait_for_selector(FIELDS_READY_SELECTOR, state="attached", timeout=remaining * 1000))
+            pending = [task for task in waiters.values() if not task.done()]
+            if any(task.done() and not task.cancelled() and not task.exception() for task in waiters.values()):
+                return
+            if pending:
+                done, _ = await asyncio.wait(pending, timeout=min(remaining, FRAME_POLL_MS / 1000),
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if any(not task.exception() for task in done):
+                    return
+            else:
+                await asyncio.sleep(min(remaining, FRAME_POLL_MS / 1000))
+        raise asyncio.TimeoutError(f"필드 라벨 대기 {timeout}ms 초과")
+    finally:
+        for task in waiters.values():
+            if not task.done():
+                task.cancel()
+        # 취소된 대기의 예외는 읽어서 버림 (경고 로그 방지)
+        await asyncio.gather(*waiters.values(), return_exceptions=True)
+
+
+class _Settle:
+    """
+    async with settle_after(dtl_page) as settled:
+        await button.click()
+        await settled.wait(timeout)
+    블록 안에서 시작된 요청이 모두 끝나고 DOM 변경이 SETTLE_QUIET_MS 동안 없을 때 wait()가 반환
+    """
+
+    def __init__(self, dtl_page, quiet_ms=SETTLE_QUIET_MS):
+        self.page = dtl_page
+        self.quiet_ms = quiet_ms
+        self.pending = set()
+
+    def _started(self, request):
+        self.pending.add(request)
+
+    def _finished(self, request):
+        self.pending.discard(request)
+
+    async def __aenter__(self):
+        self.page.on("request", self._started)
+        self.page.on("requestfinished", self._finished)
+        self.page.on("requestfailed", self._finished)
+        try:
+            await self.page.main_frame.evaluate(_OBSERVE_MUTATIONS_JS)
+        except Exception:
+            pass
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        for event, handler in (("request", self._started), ("requestfinished", self._finished),
+                               ("requestfailed", self._finished)):
+            self.page.remove_listener(event, handler)
+        return False
+
+    async def wait(self, timeout=CORP_TAB_TIMEOUT):
+        """timeout(ms) 안에 잠잠해지지 않으면 asyncio.TimeoutError"""
+        deadline = time.monotonic() + timeout / 1000
+        while time.monotonic() < deadline:
+            if not self.pending:
+                try:
+                    quiet = await self.page.main_frame.evaluate(_QUIET_FOR_JS)
+                except Exception:
+                    # 클릭으로 메인 프레임이 이동하는 중이면 다음 확인까지 대기
+                    quiet = 0
+                if quiet >= self.quiet_ms:
+                    return
+            await asyncio.sleep(SETTLE_POLL_MS / 1000)
+        raise asyncio.TimeoutError(f"요청 {len(self.pending)}건 진행 중 / DOM 변경 계속, {timeout}ms 초과")
+
+
+def settle_after(dtl_page, quiet_ms=SETTLE_QUIET_MS):
+    return _Settle(dtl_page, quiet_ms)
+
+
+class WaitStats:
+    """대기 이름별 횟수 / 총 시간 / 최대 시간 / 타임아웃 횟수"""
+
+    def __init__(self):
+        self.records = {}
+
+    async def run(self, name, awaitable):
+        """awaitable을 기다리고 걸린 시간을 기록. 타임아웃/오류면 False (예외는 올리지 않음)"""
+        start = time.perf_counter()
+        ok = True
+        try:
+            await awaitable
+        except Exception:
+            ok = False
+        elapsed = time.perf_counter() - start
+
+        rec = self.records.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+        rec["count"] += 1
+        rec["total"] += elapsed
+        rec["max"] = max(rec["max"], elapsed)
+        if not ok:
+            rec["timeouts"] += 1
+        return ok
+
+    def summary_lines(self):
+        lines = []
+        for name, rec in self.records.items():
+            avg_ms = rec["total"] / rec["count"] * 1000
+            lines.append(f"{name}: {rec['count']}회, 평균 {avg_ms:.0f}ms, 최대 {rec['max'] * 1000:.0f}ms, 타임아웃 {rec['timeouts']}회")
+        return lines